@@ -1,16 +1,28 @@
-import random
+from assets import assets
+from game_random import rng
+from lasers import AlienLaser
 
-import pygame
-
-from lasers import EnemyLaser
+# Aliens turn around at the screen's edges and start at the top again once they moved off the bottom
+LEFT_EDGE = 0
+RIGHT_EDGE = 730
+BOTTOM_EDGE = 600
 
 
 class Alien:
     """
     Represents an alien enemy in the game. Aliens move down and back and forth across the screen and
     can shoot lasers down towards the player.
+
+    Aliens are created by the hundred, so an instance stores only its own state in __slots__: its rect, direction and
+    laser. The images and speeds are shared by all aliens at class level.
     """
 
+    __slots__ = ("rect", "direction", "laser")
+
+    speed = 120  # Pixels per second, left or right
+    fall_speed = 60  # Pixels per second, down
+    images = None  # Image facing each direction, loaded by the first alien
+
     def __init__(self, x, y):
         """
         Initializes an alien object at a specific (x, y) position.
@@ -18,59 +30,51 @@ class Alien:
         :param x: The initial x-coordinate of the alien.
         :param y: The initial y-coordinate of the alien.
         """
-        self.image_left = pygame.image.load("media/alien_left.png")
-        self.image_right = pygame.image.load("media/alien_right.png")
-        self.rect = self.image_left.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-        self.speed = 2
-        self.direction = random.choice([1, -1])  # Direction of movement (1 = right, -1 = left)
-        self.show_hit_box = False
+        if Alien.images is None:
+            Alien.images = {1: assets.image("media/alien_right.png"), -1: assets.image("media/alien_left.png")}
+        self.rect = Alien.images[-1].get_rect(topleft=(x, y))
+        self.direction = rng.choice([1, -1])  # Direction of movement (1 = right, -1 = left)
 
         # Laser
-        self.laser = EnemyLaser("media/alien_laser.png", 1, "media/alien_laser.wav")
+        self.laser = AlienLaser(1)
 
-    def move(self):
+    def reset(self, x, y):
         """
-        Moves the alien across the screen. It moves down and left or right depending on the current
-        direction. When it hits the screen's edge, it changes direction.
-        """
-        self.rect.x += self.speed * self.direction  # Move the alien right or left
-        self.rect.y += 1
-        if self.rect.x >= 730 or self.rect.x <= 0:  # Reverse direction when hitting screen boundaries
-            self.direction *= -1
-        if self.rect.y >= 600:  # Reset position when the alien moves off the bottom
-            self.rect.y = 0
+        Makes a killed alien ready to be spawned again at a new position, with a new random direction.
 
-        # Laser
-        self.laser.fire(self.rect.x, self.rect.y, 25, 60)  # Adjusted firing position
-        self.laser.move()
+        :param x: The new x-coordinate of the alien.
+        :param y: The new y-coordinate of the alien.
+        """
+        self.rect.topleft = (x, y)
+        self.direction = rng.choice([1, -1])
+        self.laser.reset()
 
-    def draw(self, screen):
+    def move(self, dt):
         """
-        Draws the alien on the screen and its laser if fired.
+        Moves the alien across the screen. It moves down and left or right depending on the current
+        direction. When it hits the screen's edge, it changes direction.
 
-        :param screen: The screen surface to draw the alien and its laser on.
+        :param dt: Length of the simulation step in seconds.
         """
-        if self.direction == 1:
-            screen.blit(self.image_right, (self.rect.x, self.rect.y))  # Alien image adjusted to direction
-        elif self.direction == -1:
-            screen.blit(self.image_left, (self.rect.x, self.rect.y))
-        # Optional hit box for debugging
-        if self.show_hit_box:
-            pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
+        rect = self.rect
+        x, y = rect.topleft
+        x += round(self.speed * dt) * self.direction  # Move the alien right or left
+        y += round(self.fall_speed * dt)
+        if x >= RIGHT_EDGE or x <= LEFT_EDGE:  # Reverse direction when hitting screen boundaries
+            self.direction = -self.direction
+        if y >= BOTTOM_EDGE:  # Reset position when the alien moves off the bottom
+            y = 0
+        rect.topleft = (x, y)
 
         # Laser
-        self.laser.draw(screen)
+        laser = self.laser
+        laser.fire(x, y)
+        laser.move(dt)
 
-    def check_collision(self, other):
+    def sprite(self):
         """
-        Checks if the alien collides with another object (player).
+        Returns the alien's image, facing its direction, and position. The laser's sprite is separate.
 
-        :param other: The other object to check collision with (player).
-        :return: True if the alien collides with the other object, else False.
+        :return: An (image, rect) pair for a SpriteBatch
         """
-        if pygame.Rect.colliderect(self.rect, other.rect):
-            return True
-        else:
-            return False
+        return self.images[self.direction], self.rect
@@ -0,0 +1,68 @@
+from alien import Alien
+
+
+class AlienPool:
+    """
+    A pool of reusable aliens (each with its laser). Spawning takes a free alien and resets it, killing an alien
+    puts it back, so once the pool is warm no aliens, lasers or sounds are allocated during a level.
+    """
+
+    def __init__(self, size):
+        """
+        Initializes the pool with preallocated aliens.
+
+        :param size: Number of aliens to preallocate, the pool grows if more are alive at once
+        """
+        self.free = [Alien(-100, -100) for _ in range(size)]
+        self.size = size  # Aliens owned by the pool, free or alive
+        self.alive = 0
+        self.high_water_mark = 0  # Most aliens alive at the same time
+        self.spawns = 0  # Aliens spawned since the pool was created
+        self.reuses = 0  # Spawns served by a free alien
+        self.allocations = size  # Aliens ever created by the pool
+
+    def acquire(self, x, y):
+        """
+        Spawns an alien at the given position, reusing a free one when possible.
+
+        :param x: The initial x-coordinate of the alien
+        :param y: The initial y-coordinate of the alien
+        :return: The spawned alien
+        """
+        if self.free:
+            alien = self.free.pop()
+            alien.reset(x, y)
+            self.reuses += 1
+        else:
+            alien = Alien(x, y)
+            self.size += 1
+            self.allocations += 1
+
+        self.spawns += 1
+        self.alive += 1
+        if self.alive > self.high_water_mark:
+            self.high_water_mark = self.alive
+        return alien
+
+    def release(self, alien):
+        """
+        Returns a killed alien to the pool.
+
+        :param alien: The alien to put back
+        """
+        self.free.append(alien)
+        self.alive -= 1
+
+    def stats(self):
+        """
+        Returns the pool counters.
+
+        :return: A dictionary with the pool size, aliens alive, high-water mark, reuses and allocations
+        """
+        return {
+            "size": self.size,
+            "alive": self.alive,
+            "high_water_mark": self.high_water_mark,
+            "reuses": self.reuses,
+            "allocations": self.allocations,
+        }
@@ -0,0 +1,122 @@
+import numpy as np
+
+from alien import BOTTOM_EDGE, LEFT_EDGE, RIGHT_EDGE, Alien
+from game_random import percent_roll
+from lasers import BOTTOM_LIMIT, OFF_SCREEN, AlienLaser
+from sound_bus import sound_bus
+
+
+class AlienSwarm:
+    """
+    Moves many aliens and their lasers at once, as NumPy array operations, following exactly the rules of
+    Alien.move, EnemyLaser.fire and EnemyLaser.move. The Alien objects stay the aliens of the game, everything else
+    (collisions, drawing, bots, saves) keeps using them: the swarm keeps their positions, directions and laser
+    positions in arrays between steps, and after every step writes back only what changed.
+
+    The arrays are read from the aliens again whenever the aliens are not the same ones as in the last step, or one
+    was spawned (a spawned alien may be a killed one taken from the pool again). Laser states are read every step,
+    since a laser that hits the player is made ready again by the game scene.
+
+    The fire rolls are drawn from the game's random number stream one by one, for the ready lasers in the aliens'
+    order, so the stream and every replay stay the same as with Alien.move.
+    """
+
+    def __init__(self):
+        """Initializes an empty swarm."""
+        self.aliens = []  # The aliens of the last step, in their order
+        self.spawns = None  # Spawn count of the alien pool in the last step
+        self.rects = []
+        self.lasers = []
+        self.laser_rects = []
+
+        self.x = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.direction = np.zeros(0, dtype=np.int64)  # 1 = right, -1 = left
+        self.laser_x = np.zeros(0, dtype=np.int64)
+        self.laser_y = np.zeros(0, dtype=np.int64)
+        self.shoot_chance = np.zeros(0, dtype=np.int64)  # A laser fires when its roll is above its shoot chance
+
+        # Counters
+        self.reads = 0  # Times the arrays were read from the aliens
+
+    def read(self, aliens, spawns):
+        """
+        Reads the state of the aliens into the arrays.
+
+        :param aliens: The live aliens
+        :param spawns: Spawn count of the alien pool
+        """
+        self.aliens = list(aliens)
+        self.spawns = spawns
+        self.rects = [alien.rect for alien in aliens]
+        self.lasers = [alien.laser for alien in aliens]
+        self.laser_rects = [laser.rect for laser in self.lasers]
+
+        self.x = np.array([rect.x for rect in self.rects], dtype=np.int64)
+        self.y = np.array([rect.y for rect in self.rects], dtype=np.int64)
+        self.direction = np.array([alien.direction for alien in aliens], dtype=np.int64)
+        self.laser_x = np.array([rect.x for rect in self.laser_rects], dtype=np.int64)
+        self.laser_y = np.array([rect.y for rect in self.laser_rects], dtype=np.int64)
+        self.shoot_chance = np.array([laser.shoot_chance for laser in self.lasers], dtype=np.int64)
+        self.reads += 1
+
+    def move(self, aliens, spawns, dt):
+        """
+        Moves every alien, rolls the firing decision of every ready laser and moves every laser, the same as calling
+        Alien.move on each alien in turn.
+
+        :param aliens: The live aliens
+        :param spawns: Spawn count of the alien pool, which changes whenever an alien is spawned
+        :param dt: Length of the simulation step in seconds
+        """
+        if spawns != self.spawns or self.aliens != aliens:
+            self.read(aliens, spawns)
+        n = len(aliens)
+        x = self.x
+        y = self.y
+        direction = self.direction
+        was_firing = np.fromiter((laser.state == "fire" for laser in self.lasers), dtype=bool, count=n)
+
+        # Alien.move: move right or left and down, turn around at the screen's edges, start at the top again
+        x += round(Alien.speed * dt) * direction
+        y += round(Alien.fall_speed * dt)
+        turned = np.flatnonzero((x >= RIGHT_EDGE) | (x <= LEFT_EDGE))
+        direction[turned] *= -1
+        y[y >= BOTTOM_EDGE] = 0
+
+        # EnemyLaser.fire: every ready laser fires with a random chance, rolled in the aliens' order
+        ready = np.flatnonzero(~was_firing)
+        fired = np.zeros(n, dtype=bool)
+        if len(ready):
+            rolls = np.fromiter((percent_roll() for _ in range(len(ready))), dtype=np.int64, count=len(ready))
+            fired[ready] = rolls > self.shoot_chance[ready]
+        laser_x = self.laser_x.copy()
+        laser_y = self.laser_y.copy()
+        x_offset, y_offset = AlienLaser.fire_offset
+        laser_x[fired] = x[fired] + x_offset
+        laser_y[fired] = y[fired] + y_offset
+
+        # EnemyLaser.move: fired lasers move down and are ready again off the bottom, ready lasers wait off-screen
+        moving = was_firing | fired
+        laser_y[moving] += round(AlienLaser.speed * dt)
+        firing = moving & (laser_y < BOTTOM_LIMIT)
+        laser_x[~moving] = OFF_SCREEN
+        laser_y[~moving] = OFF_SCREEN
+
+        # Write back: every alien moved, but only a few turned, and only the lasers that moved or changed state
+        for rect, position in zip(self.rects, zip(x.tolist(), y.tolist())):
+            rect.topleft = position
+        for index, value in zip(turned.tolist(), direction[turned].tolist()):
+            self.aliens[index].direction = value
+        moved = np.flatnonzero((laser_x != self.laser_x) | (laser_y != self.laser_y))
+        laser_rects = self.laser_rects
+        for index, position in zip(moved.tolist(), zip(laser_x[moved].tolist(), laser_y[moved].tolist())):
+            laser_rects[index].topleft = position
+        changed = np.flatnonzero(firing != was_firing)
+        for index, value in zip(changed.tolist(), firing[changed].tolist()):
+            self.lasers[index].state = "fire" if value else "ready"
+        self.laser_x = laser_x
+        self.laser_y = laser_y
+
+        if fired.any():
+            sound_bus.trigger(AlienLaser.laser_sound)
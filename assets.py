@@ -0,0 +1,228 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+
+class AssetManager:
+    """
+    Process-wide cache for images and sounds. Each file is read from disk and decoded once, images are
+    converted to the display format so they are ready to blit, and every later request returns the shared object.
+    Game objects such as aliens and lasers can therefore be created in the middle of a frame without any I/O.
+    Large assets that are only needed later, like the next level's background and music, can be prefetched on a
+    worker thread and evicted again once they are no longer needed.
+    """
+
+    def __init__(self):
+        """Initializes an empty cache and its hit/miss counters."""
+        self.images = {}  # (path, alpha) -> Surface
+        self.sounds = {}  # path -> Sound
+        self.music_data = {}  # path -> bytes of the encoded music file, streamed from memory when played
+        self.pending = {}  # (path, alpha) or path -> Future of an image or music file read on the worker thread
+        self.kept = set()  # Paths that are never evicted
+        self.worker = None
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+    def image(self, path, alpha=True):
+        """
+        Returns the image at the given path, loading and converting it on the first request.
+
+        :param path: Path to the image file
+        :param alpha: True to keep per-pixel transparency (sprites), False for opaque images (backgrounds)
+        :return: The shared Surface for this image
+        """
+        key = (path, alpha)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        future = self.pending.pop(key, None)
+        if future is not None:
+            # Decoded on the worker thread, waits only if the prefetch has not finished yet
+            self.prefetched += 1
+            surface = future.result()
+        else:
+            surface = pygame.image.load(path)
+
+        # Conversion needs the display, so it always happens here on the main thread
+        surface = self.convert(surface, alpha)
+        self.images[key] = surface
+        return surface
+
+    def sound(self, path):
+        """
+        Returns the sound at the given path, decoding it on the first request.
+
+        :param path: Path to the sound file
+        :return: The shared Sound for this file
+        """
+        sound = self.sounds.get(path)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        sound = pygame.mixer.Sound(path)
+        self.sounds[path] = sound
+        return sound
+
+    def music(self, path):
+        """
+        Returns the music file at the given path as an in-memory file for pygame.mixer.music.load,
+        reading it on the first request. Playing from memory never waits on the disk.
+
+        :param path: Path to the music file
+        :return: A new file object over the shared file contents
+        """
+        data = self.music_data.get(path)
+        if data is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            future = self.pending.pop(path, None)
+            if future is not None:
+                self.prefetched += 1
+                data = future.result()
+            else:
+                data = self.read_file(path)
+            self.music_data[path] = data
+        return io.BytesIO(data)
+
+    @staticmethod
+    def read_file(path):
+        """
+        Reads a whole file.
+
+        :param path: Path to the file
+        :return: The file contents as bytes
+        """
+        with open(path, "rb") as file:
+            return file.read()
+
+    def prefetch(self, image_paths=(), music_paths=(), alpha=False):
+        """
+        Starts reading and decoding assets on a worker thread, so a later request does not stall the game loop.
+        Only decoding runs on the worker, the images are converted to the display format when first requested.
+
+        :param image_paths: Paths of images to decode
+        :param music_paths: Paths of music files to read into memory
+        :param alpha: True to keep per-pixel transparency of the images, False for opaque images (backgrounds)
+        """
+        if self.worker is None:
+            self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+
+        for path in image_paths:
+            key = (path, alpha)
+            if key not in self.images and key not in self.pending:
+                self.pending[key] = self.worker.submit(pygame.image.load, path)
+        for path in music_paths:
+            if path not in self.music_data and path not in self.pending:
+                self.pending[path] = self.worker.submit(self.read_file, path)
+
+    def keep(self, path):
+        """
+        Marks an asset as never evicted, e.g. a background that is also used by the menus.
+
+        :param path: Path to the asset
+        """
+        self.kept.add(path)
+
+    def evict(self, image_paths=(), music_paths=(), alpha=False):
+        """
+        Drops assets that are no longer needed from the cache, including prefetches that were never used.
+        Assets marked with keep are left in the cache.
+
+        :param image_paths: Paths of images to drop
+        :param music_paths: Paths of music files to drop
+        :param alpha: Transparency the images were requested with
+        """
+        for path in image_paths:
+            key = (path, alpha)
+            if path in self.kept:
+                continue
+            if self.images.pop(key, None) is not None:
+                self.evicted += 1
+            future = self.pending.pop(key, None)
+            if future is not None:
+                future.cancel()
+        for path in music_paths:
+            if path in self.kept:
+                continue
+            if self.music_data.pop(path, None) is not None:
+                self.evicted += 1
+            future = self.pending.pop(path, None)
+            if future is not None:
+                future.cancel()
+
+    @staticmethod
+    def convert(surface, alpha):
+        """
+        Converts a surface to the display's pixel format. Conversion needs a display mode, so surfaces loaded
+        before pygame.display.set_mode are returned unchanged and converted later by convert_loaded.
+
+        :param surface: The surface to convert
+        :param alpha: True to keep per-pixel transparency
+        :return: The converted surface, or the original if no display is set
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if alpha:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def convert_loaded(self):
+        """Converts every cached image to the display format. Call once after the display mode is set."""
+        for (path, alpha), surface in self.images.items():
+            self.images[(path, alpha)] = self.convert(surface, alpha)
+
+    def preload(self, image_paths=(), sound_paths=()):
+        """
+        Loads a batch of assets up front, e.g. before the first frame, so no request ever misses during play.
+
+        :param image_paths: Paths of sprite images to load
+        :param sound_paths: Paths of sounds to load
+        """
+        for path in image_paths:
+            self.image(path)
+        for path in sound_paths:
+            self.sound(path)
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        :return: A dictionary with hits, misses, prefetches used, evictions and the number of cached assets
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "prefetched": self.prefetched,
+            "evicted": self.evicted,
+            "images": len(self.images),
+            "sounds": len(self.sounds),
+            "music": len(self.music_data),
+            "pending": len(self.pending),
+        }
+
+    def clear(self):
+        """Drops every cached asset and resets the counters."""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.images.clear()
+        self.sounds.clear()
+        self.music_data.clear()
+        self.kept.clear()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+
+# The shared asset manager used by every game object
+assets = AssetManager()
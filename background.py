@@ -0,0 +1,84 @@
+import pygame
+
+
+def display_format(image):
+    """
+    Returns the image in the display's pixel format, so blitting it needs no conversion. Images from the asset cache
+    already are, and are returned as they are.
+
+    :param image: An opaque image
+    :return: The image, or a converted copy of it
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return image
+    if image.get_bitsize() == display.get_bitsize() and image.get_masks() == display.get_masks():
+        return image
+    return image.convert()
+
+
+def blit_visible(screen, image, x, y):
+    """
+    Blits only the part of the image that lands on the screen.
+
+    :param screen: The surface to draw on
+    :param image: The image
+    :param x: The x-coordinate of the image's top left corner, may be off the screen
+    :param y: The y-coordinate of the image's top left corner, may be off the screen
+    :return: The covered rectangle, or None if no part of the image is on the screen
+    """
+    area = image.get_rect().clip(pygame.Rect(-x, -y, *screen.get_size()))
+    if not area.width or not area.height:
+        return None
+    return screen.blit(image, (x + area.x, y + area.y), area)
+
+
+class ScrollingBackground:
+    """
+    A background that scrolls down without end behind the game, for parallax. The image is stitched above a copy of
+    itself into one strip once, so every frame is just a screen-sized subsurface of the strip: nothing is copied until
+    the renderer draws it, and the renderer sees a new background only when the scroll position changed.
+    """
+
+    def __init__(self, image, speed):
+        """
+        Initializes the background and builds the strip.
+
+        :param image: The opaque background image, as tall as the screen
+        :param speed: Scroll speed in pixels per second
+        """
+        image = display_format(image)
+        width, self.height = image.get_size()
+        self.strip = pygame.Surface((width, 2 * self.height)).convert(image)
+        self.strip.blit(image, (0, 0))
+        self.strip.blit(image, (0, self.height))
+        self.speed = speed
+
+        self.offset = 0.0  # Pixels scrolled, wrapped to the image height
+        self.previous_offset = 0.0  # At the previous simulation step
+        self.view = None
+        self.view_offset = None
+
+    def update(self, ms):
+        """
+        Scrolls the background.
+
+        :param ms: Length of the simulation step in milliseconds
+        """
+        self.previous_offset = self.offset
+        self.offset = (self.offset + self.speed * ms / 1000) % self.height
+        if self.offset < self.previous_offset:
+            self.previous_offset -= self.height  # Wrapped around, keep interpolating forwards
+
+    def surface(self, alpha=1.0):
+        """
+        Returns the visible part of the background.
+
+        :param alpha: How far between the previous (0) and the current (1) step to draw the background
+        :return: A screen-sized subsurface of the strip, the same one as long as the scroll position is the same
+        """
+        offset = round(self.previous_offset + (self.offset - self.previous_offset) * alpha) % self.height
+        if offset != self.view_offset:
+            self.view = self.strip.subsurface((0, self.height - offset, self.strip.get_width(), self.height))
+            self.view_offset = offset
+        return self.view
@@ -0,0 +1,216 @@
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bots import BOTS
+from level_data import LEVEL_FILE, load_level_data
+from levels import Level
+from sound_bus import sound_bus
+from timestep import STEP_MS
+
+# Longest a simulated game may last before it counts as a timeout, in milliseconds
+MAX_GAME_MS = 180_000
+
+# The game scene of this worker process, built once by init_worker and reused for every game
+worker_game = None
+
+
+def init_worker(level_file):
+    """
+    Sets up a worker process: pygame with the dummy video and audio drivers and a game scene with the given levels.
+
+    :param level_file: Path of the level file to play
+    """
+    global worker_game
+    # Imported here, so only worker processes set up pygame
+    from game_scene import GameScene
+    from headless import init_headless
+    from main import load_font
+
+    screen = init_headless()
+    levels = [Level(**definition) for definition in load_level_data(level_file, cache_path=None)]
+    worker_game = GameScene(screen, load_font(), levels)
+
+
+def play(task):
+    """
+    Plays one level from the start with full health, until the boss or the player is dead or the time is up.
+
+    :param task: A tuple of (level number, seed, bot name, longest game in milliseconds)
+    :return: A dictionary with the level, the outcome ("won", "lost" or "timeout"), the milliseconds played,
+             the damage taken and the score
+    """
+    level_number, seed, bot_name, max_ms = task
+    game = worker_game
+    game.level_index = level_number - 1
+    game.load_level()
+    game.score.reset()
+    game.new_game(seed)
+    bot = BOTS[bot_name](game, seed)
+    game.read_keys = bot
+
+    damage = 0
+    ms = 0.0
+    outcome = "timeout"
+    health = game.player.health_points
+    while ms < max_ms:
+        game.update(STEP_MS)
+        sound_bus.flush()
+        bot.advance()
+        ms += STEP_MS
+
+        # Healing power-ups make health go up again, so damage is added up step by step
+        damage += max(0, health - game.player.health_points)
+        health = game.player.health_points
+        if health <= 0:
+            outcome = "lost"
+            break
+        if game.boss.health_bar.bar_width <= 0:  # The same test as GameScene.next_scene
+            outcome = "won"
+            break
+
+    return {
+        "level": level_number,
+        "outcome": outcome,
+        "ms": ms,
+        "damage": damage,
+        "score": game.score.target_score,
+    }
+
+
+def play_batch(tasks):
+    """
+    Plays several games in a row, so a worker gets its work in few messages.
+
+    :param tasks: List of play tasks
+    :return: List of results
+    """
+    return [play(task) for task in tasks]
+
+
+def distribution(values):
+    """
+    Summarizes a list of numbers.
+
+    :param values: The numbers
+    :return: A dictionary with the mean, 10th percentile, median and 90th percentile, or None if there are none.
+             The percentiles are interpolated between the values, never beyond the smallest and largest.
+    """
+    if not values:
+        return None
+    if len(values) == 1:
+        return {"mean": values[0], "p10": values[0], "median": values[0], "p90": values[0]}
+    deciles = statistics.quantiles(values, n=10, method="inclusive")
+    return {
+        "mean": statistics.fmean(values),
+        "p10": deciles[0],
+        "median": statistics.median(values),
+        "p90": deciles[-1],
+    }
+
+
+def aggregate(results):
+    """
+    Builds the per-level report from the results of every game.
+
+    :param results: List of results of play
+    :return: A dictionary of level number to its statistics: games played, survival rate (boss killed), loss and
+             timeout rates, and the distributions of time to kill the boss in seconds, damage taken and score
+    """
+    report = {}
+    for level_number in sorted({result["level"] for result in results}):
+        games = [result for result in results if result["level"] == level_number]
+        won = [result for result in games if result["outcome"] == "won"]
+        report[level_number] = {
+            "games": len(games),
+            "survival_rate": len(won) / len(games),
+            "loss_rate": sum(result["outcome"] == "lost" for result in games) / len(games),
+            "timeout_rate": sum(result["outcome"] == "timeout" for result in games) / len(games),
+            "time_to_kill_s": distribution([result["ms"] / 1000 for result in won]),
+            "damage": distribution([result["damage"] for result in games]),
+            "score": distribution([result["score"] for result in games]),
+        }
+    return report
+
+
+def simulate(games, levels, bot="aim", seed=0, workers=None, level_file=LEVEL_FILE, max_ms=MAX_GAME_MS, batch=8):
+    """
+    Plays many games of every level on a pool of worker processes. Game i of a level is seeded with seed + i, so
+    the results do not depend on the number of workers or on which worker plays which game.
+
+    :param games: Number of games per level
+    :param levels: List of level numbers to play
+    :param bot: Name of the bot playing, a key of bots.BOTS
+    :param seed: Seed of the first game
+    :param workers: Number of worker processes, all cores if None
+    :param level_file: Path of the level file to play
+    :param max_ms: Longest a game may last in milliseconds
+    :param batch: Number of games sent to a worker at once
+    :return: A tuple of (list of results, seconds it took)
+    """
+    tasks = [(level_number, seed + index, bot, max_ms) for level_number in levels for index in range(games)]
+    batches = [tasks[start : start + batch] for start in range(0, len(tasks), batch)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(level_file,)) as executor:
+        results = [result for batch_results in executor.map(play_batch, batches) for result in batch_results]
+    return results, time.perf_counter() - start
+
+
+def print_report(report):
+    """Prints the per-level report as a table."""
+    print(
+        f"{'level':>5}{'games':>7}{'survive':>9}{'lost':>7}{'timeout':>9}"
+        f"{'kill s p10/med/p90':>22}{'damage mean':>13}{'score p10/med/p90':>22}"
+    )
+    for level_number, stats in report.items():
+        kill = stats["time_to_kill_s"]
+        kill_text = f"{kill['p10']:.0f}/{kill['median']:.0f}/{kill['p90']:.0f}" if kill else "-"
+        score = stats["score"]
+        score_text = f"{score['p10']:.0f}/{score['median']:.0f}/{score['p90']:.0f}"
+        print(
+            f"{level_number:>5}{stats['games']:>7}{stats['survival_rate']:>9.0%}{stats['loss_rate']:>7.0%}"
+            f"{stats['timeout_rate']:>9.0%}{kill_text:>22}{stats['damage']['mean']:>13.1f}{score_text:>22}"
+        )
+
+
+def main():
+    """
+    Command line entry point: python balance.py --games 500 --bot aim --levels levels.json
+    Plays every level many times with a bot on all cores and prints how hard each level is.
+    """
+    parser = argparse.ArgumentParser(description="Simulate many headless games to balance the levels.")
+    parser.add_argument("--games", type=int, default=200, help="games per level")
+    parser.add_argument("--level", type=int, action="append", help="level to play, may be repeated (default: all)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="aim", help="bot playing the games")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--levels", default=LEVEL_FILE, help="level file to play, e.g. a changed copy of levels.json")
+    parser.add_argument("--max-seconds", type=float, default=MAX_GAME_MS / 1000, help="longest game in seconds")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    level_count = len(load_level_data(args.levels, cache_path=None))
+    for level_number in args.level or ():
+        if not 1 <= level_number <= level_count:
+            parser.error(f"--level: no level {level_number}, the levels are 1 to {level_count}")
+    levels = args.level or list(range(1, level_count + 1))
+    results, elapsed = simulate(
+        args.games, levels, args.bot, args.seed, args.workers, args.levels, args.max_seconds * 1000
+    )
+    report = aggregate(results)
+    print_report(report)
+    workers = args.workers or os.cpu_count()
+    print(
+        f"{len(results)} games in {elapsed:.1f} s on {workers} workers: {len(results) / elapsed:.1f} games per second"
+    )
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
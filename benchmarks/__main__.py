@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import pygame
+
+from benchmarks.scenarios import create_scenarios
+from game_random import rng
+from headless import init_headless
+from renderer import renderer
+from sound_bus import sound_bus
+from timestep import STEP_MS
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+STATS = ("mean", "p95", "p99")
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Returns the nearest-rank percentile of already sorted samples.
+
+    :param sorted_samples: Samples in ascending order
+    :param fraction: The percentile as a fraction, e.g. 0.95
+    :return: The sample at that rank
+    """
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+def summarize(samples):
+    """
+    Summarizes frame times.
+
+    :param samples: Frame times in milliseconds
+    :return: A dictionary with mean, p95 and p99 in milliseconds
+    """
+    ordered = sorted(samples)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+    }
+
+
+def run_scenario(scenario, frames, warmup, ms):
+    """
+    Runs a scenario and times update and draw (including the display update) separately for every frame.
+
+    :param scenario: The Scenario to run
+    :param frames: Number of timed frames
+    :param warmup: Number of untimed frames run first
+    :param ms: Simulated milliseconds per frame
+    :return: A dictionary with the update and draw summaries
+    """
+    update = scenario.update
+    draw = scenario.draw
+    refill = scenario.refill
+    present = renderer.present
+    flush = sound_bus.flush
+    clock = time.perf_counter
+
+    update_times = []
+    draw_times = []
+    for frame in range(warmup + frames):
+        if refill is not None:
+            refill()
+        start = clock()
+        update(ms)
+        flush()
+        middle = clock()
+        draw()
+        present()
+        end = clock()
+        if frame >= warmup:
+            update_times.append((middle - start) * 1000)
+            draw_times.append((end - middle) * 1000)
+
+    return {"update": summarize(update_times), "draw": summarize(draw_times)}
+
+
+def compare(name, result, baseline, stats, tolerance, min_delta):
+    """
+    Compares a scenario result with its baseline.
+
+    :param name: The scenario name
+    :param result: The result from run_scenario
+    :param baseline: The baseline dictionary for all scenarios
+    :param stats: The statistics to check, e.g. ("mean", "p95")
+    :param tolerance: Allowed slowdown as a fraction, e.g. 0.25 for 25 %
+    :param min_delta: Slowdowns smaller than this many milliseconds are treated as timer noise
+    :return: A list of regression messages (empty if none)
+    """
+    regressions = []
+    if name not in baseline:
+        return regressions
+    for phase in ("update", "draw"):
+        for stat in stats:
+            expected = baseline[name][phase][stat]
+            measured = result[phase][stat]
+            if measured > expected * (1 + tolerance) and measured - expected > min_delta:
+                regressions.append(
+                    f"{name} {phase} {stat}: {measured:.3f} ms > baseline {expected:.3f} ms (+{tolerance:.0%})"
+                )
+    return regressions
+
+
+def main():
+    """Command line entry point: python -m benchmarks [scenario ...]"""
+    parser = argparse.ArgumentParser(description="Run gameplay benchmarks and compare them with the baseline.")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("--frames", type=int, default=1000, help="timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="untimed frames before timing starts")
+    parser.add_argument("--ms", type=float, default=STEP_MS, help="simulated milliseconds per frame")
+    parser.add_argument("--seed", type=int, default=0, help="random seed used for every scenario")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing, 0.25 = 25 %%")
+    parser.add_argument("--gate", default="mean,p95", help="statistics checked against the baseline")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="ignore slowdowns below this many ms")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    screen = init_headless()
+    scenarios = create_scenarios(screen)
+    names = args.scenarios or list(scenarios)
+    gate = [stat for stat in args.gate.split(",") if stat in STATS]
+
+    try:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        baseline = {}
+
+    results = {}
+    regressions = []
+    print(f"{'scenario':<18}{'phase':<8}{'mean':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for name in names:
+        random.seed(args.seed)
+        scenario = scenarios[name]()
+        rng.seed(args.seed)  # The game's own random stream, seeded after the scenario's game was created
+        result = run_scenario(scenario, args.frames, args.warmup, args.ms)
+        results[name] = result
+        for phase in ("update", "draw"):
+            stats = result[phase]
+            print(f"{name:<18}{phase:<8}{stats['mean']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}")
+        regressions += compare(name, result, baseline, gate, args.tolerance, args.min_delta)
+
+    pygame.quit()
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    for message in regressions:
+        print("REGRESSION: " + message)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
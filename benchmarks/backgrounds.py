@@ -0,0 +1,75 @@
+import pygame
+
+from assets import assets
+from background import ScrollingBackground, blit_visible
+from benchmarks.timing import time_frames
+from headless import init_headless
+from timestep import STEP_MS
+
+TRANSITION_STEP = 6  # Pixels the transition scrolls per frame
+
+
+def transition_frames(draw, frames):
+    """
+    Times drawing the level transition at every scroll position in turn.
+
+    :param draw: Function drawing both backgrounds, called with the y-coordinate of the finished level's background
+    :param frames: Number of frames
+    :return: Mean milliseconds per frame
+    """
+    positions = iter([])
+
+    def step():
+        nonlocal positions
+        y = next(positions, None)
+        if y is None:
+            positions = iter(range(0, 600, TRANSITION_STEP))
+            y = next(positions)
+        draw(y)
+
+    return time_frames(step, frames)
+
+
+def main(frames=600):
+    """
+    Measures the blit cost per frame of the level transition: two whole backgrounds as loaded from the file (as
+    before the asset cache), two whole converted backgrounds, and only their visible parts. Then a still against a
+    scrolling background in the game.
+    """
+    screen = init_headless()
+    raw = pygame.image.load("media/background.png"), pygame.image.load("media/background2.png")
+    converted = assets.image("media/background.png", alpha=False), assets.image("media/background2.png", alpha=False)
+
+    def whole(images):
+        def draw(y):
+            screen.blit(images[0], (0, y))
+            screen.blit(images[1], (0, y - 600))
+
+        return draw
+
+    def visible(y):
+        blit_visible(screen, converted[0], 0, y)
+        blit_visible(screen, converted[1], 0, y - 600)
+
+    print(f"{'level transition':<28}{'ms':>8}")
+    for name, draw in (
+        ("whole, unconverted", whole(raw)),
+        ("whole, converted", whole(converted)),
+        ("visible", visible),
+    ):
+        print(f"{name:<28}{transition_frames(draw, frames):>8.3f}")
+
+    scrolling = ScrollingBackground(converted[0], 40)
+
+    def scroll():
+        scrolling.update(STEP_MS)
+        screen.blit(scrolling.surface(), (0, 0))
+
+    print(f"{'game background':<28}{'ms':>8}")
+    print(f"{'still':<28}{time_frames(lambda: screen.blit(converted[0], (0, 0)), frames):>8.3f}")
+    print(f"{'scrolling':<28}{time_frames(scroll, frames):>8.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
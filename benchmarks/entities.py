@@ -0,0 +1,70 @@
+import random
+import tracemalloc
+
+import pygame
+
+from alien import Alien
+from benchmarks.timing import STEP, create_aliens, time_frames
+from boss import Boss
+from headless import init_headless
+from health_bar import HealthBar
+from player import Player
+from powerup import PowerUp
+from score import Score
+
+ALIEN_COUNTS = (100, 1000, 5000)
+INSTANCES = 1000
+
+
+def bytes_per_instance(create, count=INSTANCES):
+    """
+    Measures the memory an object takes with everything only it refers to, e.g. an alien with its rect and laser.
+    Shared resources, like images from the asset cache, are created once before measuring.
+
+    :param create: Function creating one object
+    :param count: Number of objects created to average over
+    :return: Bytes per object
+    """
+    create()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_size = objects.__sizeof__()
+    return (after - before - list_size) / count
+
+
+def main(frames=300):
+    """
+    Measures the bytes per instance of every entity class and the time per Alien.move at high alien counts.
+    """
+    init_headless()
+    random.seed(0)
+    font = pygame.font.Font("media/Minecraft.ttf", 30)
+    entities = (
+        ("Alien", lambda: Alien(100, 100)),
+        ("Boss", lambda: Boss(280, 30, 20, 1)),
+        ("Player", lambda: Player(360, 465)),
+        ("PowerUp", PowerUp),
+        ("HealthBar", lambda: HealthBar(10, 583, 10, 20)),
+        ("Score", lambda: Score(font)),
+    )
+    print(f"{'entity':<12}{'bytes':>8}")
+    for name, create in entities:
+        print(f"{name:<12}{bytes_per_instance(create):>8.0f}")
+
+    print(f"{'aliens':>8}{'us per move':>13}")
+    for count in ALIEN_COUNTS:
+        aliens = create_aliens(count, 1)
+
+        def move():
+            for alien in aliens:
+                alien.move(STEP)
+
+        print(f"{count:>8}{time_frames(move, frames) * 1000 / count:>13.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import pygame
+
+from benchmarks.timing import STEP, time_frames
+from headless import init_headless
+from health_bar import HealthBar
+from hud import LEVEL_TEXT_POSITION, WHITE, Hud
+from score import Score
+from text_cache import text_cache
+
+
+def main(frames=2000):
+    """
+    Measures the HUD's cost per frame: drawing every part each frame (as before the HUD overlay) against the cached
+    overlay, once it settled and is drawn in one blit and while the score counts up every frame, and the overlay while
+    a health bar shrinks.
+    """
+    screen = init_headless()
+    font = pygame.font.Font("media/Minecraft.ttf", 30)
+    score = Score(font)
+    player_bar = HealthBar(10, 583, 10, 20)
+    boss_bar = HealthBar(250, 10, 20, 15)
+    hud = Hud(screen.get_size(), font)
+
+    def immediate():
+        text = text_cache.render(font, "LEVEL " + str(1), True, WHITE)
+        screen.blits([(text, LEVEL_TEXT_POSITION), score.sprite()])
+        player_bar.draw(screen)
+        boss_bar.draw(screen)
+
+    def cached():
+        screen.blits(hud.compose(1, score, player_bar, boss_bar))
+        hud.draw(screen)
+
+    def counting(draw):
+        def count():
+            score.change_score(1)
+            score.update(STEP)
+            draw()
+
+        return count
+
+    def hurting():
+        boss_bar.update(boss_bar.bar_width / boss_bar.width_per_hp - 1, STEP)
+        if boss_bar.bar_width <= 0:
+            boss_bar.bar_width = boss_bar.initial_health * boss_bar.width_per_hp
+        cached()
+
+    print(f"{'hud':<28}{'us':>8}")
+    for name, draw in (
+        ("every part, unchanged", immediate),
+        ("every part, score counting", counting(immediate)),
+        ("overlay, settled", cached),
+        ("overlay, score counting", counting(cached)),
+        ("overlay, health bar moving", hurting),
+    ):
+        print(f"{name:<28}{time_frames(draw, frames) * 1000:>8.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
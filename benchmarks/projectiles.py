@@ -0,0 +1,76 @@
+import random
+
+import pygame
+
+from benchmarks.timing import STEP, time_frames
+from headless import init_headless
+from projectiles import PROJECTILE_SPEED, ProjectilePool
+
+POOL_SIZES = (10, 100, 1000)
+TARGET_COUNT = 50
+
+
+def create_targets(count):
+    """
+    Creates alien-sized rectangles at random positions.
+
+    :param count: Number of rectangles
+    :return: A list of pygame.Rect
+    """
+    return [pygame.Rect(random.randint(0, 729), random.randint(0, 400), 71, 41) for _ in range(count)]
+
+
+def fill_pool(pool, count):
+    """
+    Tops the pool up to the given number of projectiles, at random positions on the screen.
+
+    :param pool: The ProjectilePool
+    :param count: Number of projectiles that should be alive
+    """
+    while pool.count < count:
+        pool.spawn(random.randint(0, 790), random.randint(0, 599), random.choice((-180, 0, 180)))
+
+
+def main(frames=300):
+    """
+    Measures the cost per projectile of moving and culling the pool and of hit testing it against the boss and
+    the aliens, against one pygame.Rect per projectile moved and tested in a loop.
+    """
+    init_headless()
+    random.seed(0)
+    targets = create_targets(TARGET_COUNT)
+    boss = pygame.Rect(300, 20, 200, 120)
+    step_y = round(PROJECTILE_SPEED * STEP)
+    print(f"Hit tests against the boss and {TARGET_COUNT} aliens, microseconds per projectile per frame")
+    print(f"{'projectiles':>12}{'move':>8}{'hits':>8}{'objects':>9}{'speedup':>9}")
+    for count in POOL_SIZES:
+        pool = ProjectilePool(capacity=count)
+
+        def move():
+            pool.move(STEP)
+            fill_pool(pool, count)
+
+        def hit_test():
+            pool.hits(boss)
+            pool.hits_many(targets)
+
+        rects = [pygame.Rect(random.randint(0, 790), random.randint(0, 599), 9, 33) for _ in range(count)]
+
+        def objects():
+            for rect in rects:
+                rect.y -= step_y
+                if rect.y <= -50:
+                    rect.y = 599
+                rect.colliderect(boss)
+                rect.collidelistall(targets)
+
+        fill_pool(pool, count)
+        move_us = time_frames(move, frames) * 1000 / count
+        hits_us = time_frames(hit_test, frames) * 1000 / count
+        objects_us = time_frames(objects, frames) * 1000 / count
+        print(f"{count:>12}{move_us:>8.3f}{hits_us:>8.3f}{objects_us:>9.3f}{objects_us / (move_us + hits_us):>8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import random
+
+from assets import assets
+from headless import ScriptedKeys, create_game
+from level_transition_scene import LevelTransition
+from main import load_font
+from menu_scene import MenuScene
+from weapon import Weapon
+
+
+class Scenario:
+    """
+    A named, reproducible benchmark scenario. It wraps the real scene objects and exposes the per-frame
+    update and draw steps separately so they can be timed on their own.
+    """
+
+    def __init__(self, name, scene, update, draw, refill=None):
+        """
+        Initializes the scenario.
+
+        :param name: The scenario name used in reports and the baseline file
+        :param scene: The scene (or other object) under test
+        :param update: Function called with ms to advance one frame
+        :param draw: Function called to draw one frame
+        :param refill: Optional function called between frames (not timed) to keep the scenario in a steady state
+        """
+        self.name = name
+        self.scene = scene
+        self.update = update
+        self.draw = draw
+        self.refill = refill
+
+
+def fill_aliens(game, count):
+    """
+    Keeps the current level populated with the given number of live aliens, all of them ready to fire.
+
+    :param game: The GameScene
+    :param count: Number of aliens that should be alive
+    """
+    level = game.levels[game.level_index]
+    while len(level.aliens) < count:
+        alien = level.pool.acquire(random.randint(0, 729), random.randint(0, 400))
+        alien.laser.shoot_chance = 0  # Fire whenever the laser is ready
+        level.aliens.append(alien)
+    # Hold the spawn timeline just after its last alien, so the level never spawns any by itself
+    level.cursor = len(level.timeline)
+    level.clock = level.timeline[-1][0]
+    game.level_aliens = level.aliens
+
+
+def fill_projectiles(game, count):
+    """
+    Keeps the player's projectile pool filled with the given number of spread shots at random positions.
+
+    :param game: The GameScene
+    :param count: Number of projectiles that should be alive
+    """
+    projectiles = game.player.projectiles
+    while projectiles.count < count:
+        projectiles.spawn(random.randint(0, 790), random.randint(0, 560), random.choice((-180, 0, 180)))
+
+
+def projectile_scenario(screen, projectile_count):
+    """
+    Builds a game scene scenario on level 5 with a full alien wave, the spread weapon firing all the time and the
+    given number of player projectiles kept alive.
+
+    :param screen: The screen surface
+    :param projectile_count: Number of projectiles kept alive
+    :return: A Scenario
+    """
+    game = create_game(screen, 5)
+    game.read_keys = ScriptedKeys.parse("0:up")
+    game.player.weapon = Weapon("spread")
+
+    def refill():
+        fill_aliens(game, 13)
+        fill_projectiles(game, projectile_count)
+
+    refill()
+    return Scenario(f"projectiles_{projectile_count}", game, game.update, game.draw, refill)
+
+
+def game_scenario(name, screen, level_number, alien_count=0):
+    """
+    Builds a game scene scenario on the given level with no player input.
+
+    :param name: The scenario name
+    :param screen: The screen surface
+    :param level_number: The level to play
+    :param alien_count: Number of aliens kept alive, or 0 to let the level spawn them normally
+    :return: A Scenario
+    """
+    game = create_game(screen, level_number)
+    game.read_keys = ScriptedKeys([])
+    refill = None
+    if alien_count:
+        fill_aliens(game, alien_count)
+
+        def refill():
+            fill_aliens(game, alien_count)
+
+    return Scenario(name, game, game.update, game.draw, refill)
+
+
+def menu_scenario(screen):
+    """Builds the main menu scenario with no input."""
+    menu = MenuScene(screen, assets.image("media/background.png", alpha=False), load_font())
+    return Scenario("menu_idle", menu, menu.update, menu.draw)
+
+
+def level_transition_scenario(screen):
+    """Builds the level transition animation scenario, restarting the animation whenever it finishes."""
+    transition = LevelTransition(screen, load_font())
+    background = assets.image("media/background.png", alpha=False)
+    new_background = assets.image("media/background2.png", alpha=False)
+    transition.player_x = 360
+    transition.level_number = 2
+
+    def refill():
+        # A finished transition lets go of its backgrounds, hand them over again like the game scene does
+        transition.next_scene()
+        transition.set_backgrounds(background, new_background)
+
+    refill()
+
+    return Scenario("level_transition", transition, transition.update, transition.draw, refill)
+
+
+def create_scenarios(screen):
+    """
+    Creates every benchmark scenario.
+
+    :param screen: The screen surface
+    :return: A dictionary of scenario name to a function building that Scenario
+    """
+    return {
+        "level1_idle": lambda: game_scenario("level1_idle", screen, 1),
+        "level5_full": lambda: game_scenario("level5_full", screen, 5, 13),
+        "aliens_500": lambda: game_scenario("aliens_500", screen, 5, 500),
+        "projectiles_300": lambda: projectile_scenario(screen, 300),
+        "menu_idle": lambda: menu_scenario(screen),
+        "level_transition": lambda: level_transition_scenario(screen),
+    }
@@ -0,0 +1,67 @@
+import random
+
+import pygame
+
+from alien_swarm import AlienSwarm
+from benchmarks.timing import STEP, create_aliens, time_frames
+from game_random import rng
+from headless import init_headless
+
+SWARM_SIZES = (10, 30, 50, 64, 100, 500, 1000)
+
+
+def alien_states(aliens):
+    """
+    Returns everything Alien.move changes of every alien.
+
+    :param aliens: List of Alien objects
+    :return: List of (position, direction, laser state, laser position) tuples
+    """
+    return [(alien.rect.topleft, alien.direction, alien.laser.state, alien.laser.rect.topleft) for alien in aliens]
+
+
+def check_equivalence(count=300, frames=2000, shoot_chance=1):
+    """
+    Moves the same aliens one by one and as a swarm, from the same random number stream, and checks that every alien
+    and laser ends up in the same place and the stream in the same state.
+
+    :return: True if both ways agree
+    """
+    states = []
+    for move in ("objects", "swarm"):
+        random.seed(0)
+        rng.seed(0)
+        aliens = create_aliens(count, shoot_chance)
+        swarm = AlienSwarm()
+        for _ in range(frames):
+            if move == "objects":
+                for alien in aliens:
+                    alien.move(STEP)
+            else:
+                swarm.move(aliens, 0, STEP)
+        states.append((alien_states(aliens), rng.getstate()))
+    return states[0] == states[1]
+
+
+def main(frames=300):
+    """Measures the time per frame of Alien.move on every alien against AlienSwarm.move."""
+    init_headless()
+    print("Swarm matches per-object aliens:", check_equivalence() and check_equivalence(shoot_chance=100))
+    print(f"{'aliens':>7}{'objects ms':>12}{'swarm ms':>10}{'speedup':>9}")
+    for count in SWARM_SIZES:
+        random.seed(0)
+        aliens = create_aliens(count, 1)
+        swarm = AlienSwarm()
+
+        def move_objects():
+            for alien in aliens:
+                alien.move(STEP)
+
+        objects_ms = time_frames(move_objects, frames)
+        swarm_ms = time_frames(lambda: swarm.move(aliens, 0, STEP), frames)
+        print(f"{count:>7}{objects_ms:>12.3f}{swarm_ms:>10.3f}{objects_ms / swarm_ms:>8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
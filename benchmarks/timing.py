@@ -0,0 +1,37 @@
+import random
+import time
+
+from alien import Alien
+from timestep import STEP_MS
+
+STEP = STEP_MS / 1000
+
+
+def create_aliens(count, shoot_chance):
+    """
+    Creates aliens at random positions.
+
+    :param count: Number of aliens
+    :param shoot_chance: Percentage chance for each alien to fire per frame
+    :return: A list of Alien objects
+    """
+    aliens = []
+    for _ in range(count):
+        alien = Alien(random.randint(1, 729), random.randint(0, 599))
+        alien.laser.shoot_chance = 100 - shoot_chance
+        aliens.append(alien)
+    return aliens
+
+
+def time_frames(step, frames):
+    """
+    Times a per-frame step.
+
+    :param step: Function advancing one frame
+    :param frames: Number of frames
+    :return: Mean milliseconds per frame
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000 / frames
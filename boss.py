@@ -1,15 +1,23 @@
 import pygame
 
+from assets import assets
 from health_bar import HealthBar
-from lasers import EnemyLaser
+from lasers import BossLaser
 
 
 class Boss:
     """
     Represents the boss enemy in the game. The boss moves horizontally back and forth
     and shoots lasers. It also has a health bar.
+    An instance stores only its own state in __slots__, the image and speeds are shared at class level.
     """
 
+    __slots__ = ("rect", "direction", "health_points", "shoot_chance", "health_bar", "laser")
+
+    speed = 60  # Pixels per second
+    width_per_hp = 15  # Width of the health bar per health point
+    image = None  # Loaded by the first boss
+
     # j hej
     def __init__(self, x, y, health_points, shoot_chance):
         """
@@ -18,18 +26,17 @@ class Boss:
         :param x: The x-coordinate of the boss's initial position.
         :param y: The y-coordinate of the boss's initial position.
         :param health_points: The initial health of the boss, different for each level.
-        :param shoot_chance: The percentage chance for the boss to shoot lasers per frame, different for each level
+        :param shoot_chance: The percentage chance for the boss to shoot lasers per simulation step, different for
+                             each level
         """
-        self.image = pygame.image.load("media/boss.png")
+        if Boss.image is None:
+            Boss.image = assets.image("media/boss.png")
         self.rect = pygame.Rect(x, y, 240, 120)  # Hit Box adjusted to image
-        self.speed = 1
         self.direction = 1  # 1 = right, -1 = left
         self.health_points = health_points
         self.shoot_chance = shoot_chance
-        self.show_hit_box = False
 
         # Health bar
-        self.width_per_hp = 15
         # Centering health bar on screen
         self.health_bar = HealthBar(
             400 - self.health_points * self.width_per_hp / 2,
@@ -39,14 +46,16 @@ class Boss:
         )
 
         # Laser
-        self.laser = EnemyLaser("media/boss_laser.png", self.shoot_chance, "media/laser8.wav", True)
+        self.laser = BossLaser(self.shoot_chance)
 
-    def move(self):
+    def move(self, dt):
         """
         Moves the boss horizontally on the screen. The boss reverses direction when hitting
         set boundaries. Also, updates the health bar and controls laser firing.
+
+        :param dt: Length of the simulation step in seconds.
         """
-        self.rect.x += self.speed * self.direction  # Moves boss horizontally
+        self.rect.x += round(self.speed * dt) * self.direction  # Moves boss horizontally
 
         # Reverse directions
         if self.rect.x >= 380:
@@ -55,24 +64,24 @@ class Boss:
             self.direction = 1
 
         # Health bar
-        self.health_bar.update(self.health_points)
+        self.health_bar.update(self.health_points, dt)
 
         # Laser
-        self.laser.fire(self.rect.x, self.rect.y, 116, 70)  # Adjusted laser firing position to center
-        self.laser.move()
+        self.laser.fire(self.rect.x, self.rect.y)  # Fired from the center, see BossLaser
+        self.laser.move(dt)
 
-    def draw(self, screen):
+    def sprite(self):
         """
-        Draws the boss, health bar and laser on the screen.
+        Returns the boss's image and position. The health bar and laser are drawn by the game scene.
 
-        :param screen: The screen where the boss, health bar, and laser will be drawn.
+        :return: An (image, rect) pair for a SpriteBatch
         """
-        screen.blit(self.image, (self.rect.x, self.rect.y))
-        if self.show_hit_box:  # Optional for debugging
-            pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
+        return self.image, self.rect
 
-        # Health bar
-        self.health_bar.draw(screen)
+    def laser_sprite(self):
+        """
+        Returns the laser's image and position if it is fired.
 
-        # Laser
-        self.laser.draw(screen, 37, 30)  # Adjusted image over hit box
+        :return: An (image, position) pair for a SpriteBatch, or None
+        """
+        return self.laser.sprite()  # Image centered over the hit box, see BossLaser
@@ -0,0 +1,261 @@
+import random
+
+from pygame import K_ESCAPE, K_LEFT, K_RETURN, K_RIGHT, K_SPACE, K_UP, K_m, K_r
+
+from game_over_scene import GameOverScene
+from level_transition_scene import LevelTransition
+from menu_scene import MenuScene
+from pause_scene import PauseScene
+from win_scene import WinScene
+
+# Shots leave the player's ship this far from its left edge, see weapon.WEAPONS
+GUN_OFFSET = 31
+SCREEN_WIDTH = 800
+
+
+class RandomBot:
+    """
+    Presses random keys: holds left, right or neither for a random number of frames, firing or not.
+    Works as the GameScene's key source like headless.ScriptedKeys.
+    """
+
+    def __init__(self, seed=0, min_hold=10, max_hold=60):
+        """
+        Initializes the bot.
+
+        :param seed: Seed of the bot's own random numbers, so a game can be played again
+        :param min_hold: Fewest frames the same keys are held
+        :param max_hold: Most frames the same keys are held
+        """
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.frames_left = 0
+        self.held = frozenset()
+
+    def advance(self):
+        """Moves on to the next frame."""
+        self.frames_left -= 1
+
+    def __call__(self):
+        """
+        Returns the keyboard state for the current frame, picking new keys when the held ones ran out.
+
+        :return: An object that can be indexed with pygame key constants, like pygame.key.get_pressed()
+        """
+        if self.frames_left <= 0:
+            keys = set()
+            direction = self.rng.choice((K_LEFT, K_RIGHT, None))
+            if direction is not None:
+                keys.add(direction)
+            if self.rng.random() < 0.5:
+                keys.add(K_UP)
+            self.held = frozenset(keys)
+            self.frames_left = self.rng.randint(self.min_hold, self.max_hold)
+        return self
+
+    def __getitem__(self, key):
+        """Returns True if the key is held in the current frame."""
+        return key in self.held
+
+
+class AimBot:
+    """
+    Plays like a player who only goes for the boss: keeps firing and moves to shoot straight up at the boss's center,
+    hesitating now and then so no two games are the same. It never dodges.
+    Works as the GameScene's key source like headless.ScriptedKeys.
+    """
+
+    def __init__(self, game, seed=0, hesitation=0.2, tolerance=20):
+        """
+        Initializes the bot.
+
+        :param game: The GameScene it plays, read every frame
+        :param seed: Seed of the bot's own random numbers, so a game can be played again
+        :param hesitation: Chance per frame to not move
+        :param tolerance: Distance in pixels from the boss's center that is close enough
+        """
+        self.game = game
+        self.rng = random.Random(seed)
+        self.hesitation = hesitation
+        self.tolerance = tolerance
+        self.held = frozenset()
+
+    def advance(self):
+        """Moves on to the next frame."""
+
+    def __call__(self):
+        """
+        Returns the keyboard state for the current frame.
+
+        :return: An object that can be indexed with pygame key constants, like pygame.key.get_pressed()
+        """
+        keys = {K_UP}
+        if self.rng.random() >= self.hesitation:
+            distance = self.game.boss.rect.centerx - (self.game.player.rect.x + GUN_OFFSET)
+            if distance > self.tolerance:
+                keys.add(K_RIGHT)
+            elif distance < -self.tolerance:
+                keys.add(K_LEFT)
+        self.held = frozenset(keys)
+        return self
+
+    def __getitem__(self, key):
+        """Returns True if the key is held in the current frame."""
+        return key in self.held
+
+
+class AutopilotBot:
+    """
+    Plays the whole game like a person would, for soak tests (soak.py) and to watch (main.py --autopilot): starts
+    games from the menu, dodges enemy lasers and aliens, collects power-ups, shoots the lowest alien or else the boss,
+    pauses now and then and resumes a moment later, and goes back to the menu after winning or losing.
+
+    Set it as input_state.source, so every scene reads its keys, and pass observe as the game loop's on_frame, so it
+    knows the current scene. It decides from the live rects every frame, with a few comparisons per alien.
+    """
+
+    def __init__(self, game, seed=0, pause_every=3600, look_ahead=140, margin=12):
+        """
+        Initializes the bot.
+
+        :param game: The GameScene it plays
+        :param seed: Seed of the bot's own random numbers
+        :param pause_every: Frames of play between pauses, on average
+        :param look_ahead: Pixels above the player where lasers and aliens are dodged
+        :param margin: Pixels next to the player where lasers and aliens are dodged
+        """
+        self.game = game
+        self.rng = random.Random(seed)
+        self.pause_chance = 1 / pause_every
+        self.look_ahead = look_ahead
+        self.margin = margin
+
+        self.scene = None
+        self.scene_frames = 0  # Frames since the current scene started
+        self.wait = 30  # Frames to wait in a menu before pressing a key
+        self.held = frozenset()
+
+        # Counters
+        self.games = 0
+        self.pauses = 0
+        self.wins = 0
+        self.losses = 0
+
+    def advance(self):
+        """Moves on to the next frame, when used as the key source of the game scene alone."""
+
+    def observe(self, scene):
+        """
+        Follows the game loop to the next scene. Use as the game loop's on_frame.
+
+        :param scene: The scene of the next frame
+        :return: False, the bot never ends the game loop
+        """
+        if scene is not self.scene:
+            if scene is self.game and isinstance(self.scene, MenuScene):
+                self.games += 1
+            elif isinstance(scene, PauseScene):
+                self.pauses += 1
+            elif isinstance(scene, WinScene):
+                self.wins += 1
+            elif isinstance(scene, GameOverScene):
+                self.losses += 1
+            self.scene = scene
+            self.scene_frames = 0
+            self.wait = self.rng.randint(30, 180)
+        self.scene_frames += 1
+        return False
+
+    def __call__(self):
+        """
+        Returns the keys for the current frame.
+
+        :return: An object that can be indexed with pygame key constants, like pygame.key.get_pressed()
+        """
+        scene = self.scene
+        if scene is self.game:
+            self.held = self.play()
+        elif isinstance(scene, LevelTransition):
+            self.held = frozenset()
+        elif self.scene_frames < self.wait:  # Take a moment in every menu
+            self.held = frozenset()
+        elif isinstance(scene, MenuScene) or scene is None:
+            self.held = frozenset((K_SPACE,))
+        elif isinstance(scene, PauseScene):
+            self.held = frozenset((K_r,))
+        elif isinstance(scene, (GameOverScene, WinScene)):
+            self.held = frozenset((K_RETURN,))
+        else:
+            self.held = frozenset((K_m,))  # Credits, instructions or saved, back to the menu
+        return self
+
+    def __getitem__(self, key):
+        """Returns True if the key is held in the current frame."""
+        return key in self.held
+
+    def play(self):
+        """
+        Picks the keys for a frame of the game: dodge whatever would hit the player soon, otherwise move under a
+        power-up, the lowest alien or the boss. Always fires.
+
+        :return: The held keys
+        """
+        game = self.game
+        if self.rng.random() < self.pause_chance:
+            return frozenset((K_ESCAPE,))
+
+        player = game.player.rect
+        top = player.top - self.look_ahead
+        left = player.left - self.margin
+        right = player.right + self.margin
+
+        # The closest laser or alien coming down on the player
+        threat = None
+        dangers = [game.boss.laser.rect] if game.boss.laser.state == "fire" else []
+        for alien in game.level_aliens:
+            dangers.append(alien.rect)
+            if alien.laser.state == "fire":
+                dangers.append(alien.laser.rect)
+        for rect in dangers:
+            if rect.bottom >= top and rect.top <= player.bottom and rect.right >= left and rect.left <= right:
+                if threat is None or rect.bottom > threat.bottom:
+                    threat = rect
+
+        if threat is not None:
+            # Move away from it, or the other way when against the edge of the screen
+            move = K_RIGHT if threat.centerx <= player.centerx else K_LEFT
+            if move == K_RIGHT and player.right >= SCREEN_WIDTH or move == K_LEFT and player.left <= 0:
+                move = K_LEFT if move == K_RIGHT else K_RIGHT
+            return frozenset((K_UP, move))
+
+        # Something to line up with: a falling power-up, the lowest alien above the player, or the boss
+        powerup = game.powerup
+        if powerup.state == "spawned" and powerup.rect.bottom < player.top:
+            target = powerup.rect.centerx
+            position = player.centerx
+        else:
+            aliens = [alien.rect for alien in game.level_aliens if alien.rect.bottom < top]
+            target = max(aliens, key=lambda rect: rect.bottom).centerx if aliens else game.boss.rect.centerx
+            position = player.x + GUN_OFFSET
+
+        if target - position > self.margin:
+            return frozenset((K_UP, K_RIGHT))
+        if position - target > self.margin:
+            return frozenset((K_UP, K_LEFT))
+        return frozenset((K_UP,))
+
+
+def autopilot_in_game(game, seed):
+    """Returns an AutopilotBot that plays only the game scene, never pausing, for balance.py."""
+    bot = AutopilotBot(game, seed, pause_every=float("inf"))
+    bot.observe(game)
+    return bot
+
+
+# Bots by name, each built from (game, seed)
+BOTS = {
+    "random": lambda game, seed: RandomBot(seed),
+    "aim": lambda game, seed: AimBot(game, seed),
+    "autopilot": autopilot_in_game,
+}
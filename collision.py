@@ -0,0 +1,48 @@
+import pygame
+
+# Kinds of hit pairs reported by CollisionSystem.detect, in the order they are applied
+LASER_HITS_BOSS = "laser_hits_boss"
+BOSS_LASER_HITS_PLAYER = "boss_laser_hits_player"
+LASER_HITS_ALIEN = "laser_hits_alien"
+ALIEN_HITS_PLAYER = "alien_hits_player"
+ALIEN_LASER_HITS_PLAYER = "alien_laser_hits_player"
+
+
+class CollisionSystem:
+    """
+    Finds every collision of a frame in one batched pass. All colliders are gathered first, tested with
+    Rect.collidelistall or, for the player's projectiles, by the projectile pool as array operations. The hits are
+    returned as (kind, alien_index, projectile_index) triples for the game scene to apply afterwards. Nothing is
+    changed during detection, so removing aliens can never make the detection skip one.
+    """
+
+    def detect(self, player, boss, aliens):
+        """
+        Detects every hit between the player, the boss, the aliens and all their lasers.
+
+        :param player: The player (its rect and projectiles are tested)
+        :param boss: The boss (its rect and laser are tested)
+        :param aliens: The list of live aliens
+        :return: List of (kind, alien_index, projectile_index) hits in the order they should be applied,
+                 alien_index and projectile_index are None for hits not involving an alien or a projectile
+        """
+        hits = []
+        projectiles = player.projectiles
+
+        # The player's projectiles are tested all at once by the projectile pool
+        for projectile in projectiles.hits(boss.rect).tolist():
+            hits.append((LASER_HITS_BOSS, None, projectile))
+        if pygame.Rect.colliderect(boss.laser.rect, player.rect):
+            hits.append((BOSS_LASER_HITS_PLAYER, None, None))
+
+        if aliens:
+            alien_rects = [alien.rect for alien in aliens]
+            laser_rects = [alien.laser.rect for alien in aliens]
+            for projectile, index in projectiles.hits_many(alien_rects):
+                hits.append((LASER_HITS_ALIEN, index, projectile))
+            for index in player.rect.collidelistall(alien_rects):
+                hits.append((ALIEN_HITS_PLAYER, index, None))
+            for index in player.rect.collidelistall(laser_rects):
+                hits.append((ALIEN_LASER_HITS_PLAYER, index, None))
+
+        return hits
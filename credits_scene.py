@@ -1,6 +1,8 @@
-import pygame
 from pygame import K_m
 
+from input_state import input_state
+from text_cache import text_cache
+
 WHITE = (255, 255, 255)
 
 
@@ -28,14 +30,13 @@ class CreditsScene:
         """
         self.screen.blit(self.background, (0, 0))
         # Render text
-        credits_text = self.font.render("INCREDIBLE GAME BY: FREJA AHLBECK", True, WHITE)
-        return_text = self.font.render("PRESS M TO RETURN TO MAIN MENU", True, WHITE)
-        a_text = self.font.render("(BETYG: A?)", True, WHITE)  # A GREAT SUGGESTION
+        credits_text = text_cache.render(self.font, "INCREDIBLE GAME BY: FREJA AHLBECK", True, WHITE)
+        return_text = text_cache.render(self.font, "PRESS M TO RETURN TO MAIN MENU", True, WHITE)
+        a_text = text_cache.render(self.font, "(BETYG: A?)", True, WHITE)  # A GREAT SUGGESTION
         # Draw text on screen
         self.screen.blit(credits_text, (120, 100))
         self.screen.blit(a_text, (330, 138))
         self.screen.blit(return_text, (130, 562))
-        pygame.display.flip()
 
     def update(self, _):
         """Needed for the main game loop to work. No updates needed for static scene."""
@@ -47,7 +48,7 @@ class CreditsScene:
 
         :return: The next scene (either the current scene or the menu scene).
         """
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
         if keys[K_m]:
             return self.menu_scene
         else:
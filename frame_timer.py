@@ -0,0 +1,177 @@
+import json
+import time
+
+import pygame
+from pygame import K_F3, K_F12
+
+WHITE = (255, 255, 255)
+GREEN = (50, 255, 50)
+RED = (255, 50, 50)
+YELLOW = (255, 255, 50)
+
+# 60 FPS frame budget in milliseconds
+FRAME_BUDGET = 1000 / 60
+
+
+class FrameTimer:
+    """
+    Lightweight per-phase frame timing. Timed sections are stored in a fixed-size ring buffer that can be shown
+    as a live frame-time graph and exported as Chrome trace-event JSON (open it in chrome://tracing or Perfetto).
+    While disabled, start() and stop() return immediately, so the hooks can stay in the game loop.
+    """
+
+    def __init__(self, capacity=4096, graph_frames=240):
+        """
+        Initializes the timer. Timing is off until enabled.
+
+        :param capacity: Number of timed sections kept in the ring buffer
+        :param graph_frames: Number of frame times kept for the overlay graph
+        """
+        self.enabled = False
+        self.show_overlay = False
+        self.origin = time.perf_counter()
+
+        # Ring buffer of timed sections
+        self.capacity = capacity
+        self.names = [None] * capacity
+        self.starts = [0.0] * capacity
+        self.durations = [0.0] * capacity
+        self.index = 0
+        self.count = 0
+
+        # Ring buffer of whole frame times for the graph, in milliseconds
+        self.graph_frames = graph_frames
+        self.frame_times = [0.0] * graph_frames
+        self.frame_index = 0
+        self.last_frame_end = 0.0
+
+        self.font = None
+
+    def start(self):
+        """
+        Starts timing a section.
+
+        :return: The start time to pass to stop(), or 0 when timing is off
+        """
+        if self.enabled:
+            return time.perf_counter()
+        return 0
+
+    def stop(self, name, start):
+        """
+        Ends a timed section and stores it in the ring buffer.
+
+        :param name: Name of the timed phase, e.g. "update"
+        :param start: The value returned by start()
+        """
+        if not start:
+            return
+        index = self.index
+        self.names[index] = name
+        self.starts[index] = start
+        self.durations[index] = time.perf_counter() - start
+        self.index = (index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def end_frame(self):
+        """Records the time of the whole frame for the overlay graph. Called once at the end of every frame."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame_end:
+            self.frame_times[self.frame_index] = (now - self.last_frame_end) * 1000
+            self.frame_index = (self.frame_index + 1) % self.graph_frames
+        self.last_frame_end = now
+
+    def toggle(self):
+        """Turns timing and the overlay on or off."""
+        self.enabled = not self.enabled
+        self.show_overlay = self.enabled
+        self.last_frame_end = 0.0
+
+    def samples(self):
+        """
+        Returns the stored sections from oldest to newest.
+
+        :return: A list of (name, start, duration) tuples, times in seconds
+        """
+        first = (self.index - self.count) % self.capacity
+        result = []
+        for offset in range(self.count):
+            i = (first + offset) % self.capacity
+            result.append((self.names[i], self.starts[i], self.durations[i]))
+        return result
+
+    def export_trace(self, file_name="frame_trace.json"):
+        """
+        Writes the ring buffer as Chrome trace-event JSON.
+
+        :param file_name: The file to write
+        :return: The number of exported events
+        """
+        events = [
+            {
+                "name": name,
+                "ph": "X",  # Complete event with a duration
+                "ts": (start - self.origin) * 1_000_000,
+                "dur": duration * 1_000_000,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, duration in self.samples()
+        ]
+        with open(file_name, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return len(events)
+
+    def handle_key(self, key):
+        """
+        Handles the debug keys: F3 toggles timing and the overlay, F12 dumps the trace.
+
+        :param key: The pressed key
+        """
+        if key == K_F3:
+            self.toggle()
+        elif key == K_F12 and self.count:
+            count = self.export_trace()
+            print(f"Exported {count} timing events to frame_trace.json")
+
+    def draw_overlay(self, screen):
+        """
+        Draws the live frame-time graph in the top right corner. Bars above the 60 FPS budget are red.
+
+        :param screen: The screen to draw on
+        :return: The rectangle covered by the overlay, or None if it is hidden
+        """
+        if not self.show_overlay:
+            return None
+        if self.font is None:
+            self.font = pygame.font.Font("media/Minecraft.ttf", 14)
+
+        height = 80
+        left = screen.get_width() - self.graph_frames - 10
+        top = 40
+        scale = height / (2 * FRAME_BUDGET)  # Graph shows 0 - 33 ms
+
+        panel = pygame.Surface((self.graph_frames, height))
+        panel.set_alpha(160)
+        screen.blit(panel, (left, top))
+
+        for offset in range(self.graph_frames):
+            frame_time = self.frame_times[(self.frame_index + offset) % self.graph_frames]
+            bar = min(height, int(frame_time * scale))
+            color = RED if frame_time > FRAME_BUDGET else GREEN
+            pygame.draw.line(screen, color, (left + offset, top + height), (left + offset, top + height - bar))
+
+        budget_y = top + height - int(FRAME_BUDGET * scale)
+        pygame.draw.line(screen, YELLOW, (left, budget_y), (left + self.graph_frames, budget_y))
+
+        last = self.frame_times[(self.frame_index - 1) % self.graph_frames]
+        text = self.font.render(f"FRAME {last:.1f} MS", True, WHITE)
+        screen.blit(text, (left, top + height + 2))
+        return pygame.Rect(left, top, self.graph_frames, height + 2 + text.get_height())
+
+
+# The shared frame timer used by the game loop and scenes
+frame_timer = FrameTimer()
@@ -1,6 +1,9 @@
 import pygame
 from pygame import K_RETURN
 
+from input_state import input_state
+from text_cache import text_cache
+
 # Initialize pygame font
 pygame.font.init()
 
@@ -37,15 +40,16 @@ class GameOverScene:
         """
         Draws the game over message, final score, and the option to return to the main menu.
         """
-        game_over_text = game_over_font.render("GAME OVER", True, WHITE)
-        final_score_text = self.font.render("FINAL SCORE: " + str(self.game_scene.score.target_score), True, WHITE)
-        return_to_menu_text = self.font.render("PRESS ENTER TO CONTINUE TO MENU", True, WHITE)
+        game_over_text = text_cache.render(game_over_font, "GAME OVER", True, WHITE)
+        final_score_text = text_cache.render(
+            self.font, "FINAL SCORE: " + str(self.game_scene.score.target_score), True, WHITE
+        )
+        return_to_menu_text = text_cache.render(self.font, "PRESS ENTER TO CONTINUE TO MENU", True, WHITE)
         # Draw text on screen
         self.screen.blit(self.background, (0, 0))
         self.screen.blit(game_over_text, (70, 200))
         self.screen.blit(final_score_text, (70, 260))
         self.screen.blit(return_to_menu_text, (130, 562))
-        pygame.display.flip()
 
     def next_scene(self):
         """
@@ -53,7 +57,7 @@ class GameOverScene:
 
         :return: The next scene (either the current scene or the menu scene).
         """
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
         if keys[K_RETURN]:
             self.game_scene.reset()  # Reset game to be played again
             return self.menu_scene
@@ -0,0 +1,22 @@
+import random
+
+# The one random number stream of the game simulation. Every random choice made by game objects is drawn from it,
+# and the game scene seeds it when a game starts, so a game can be replayed exactly from its seed and input.
+rng = random.Random()
+
+# Bound once, percent_roll runs for every ready laser in every simulation step
+_getrandbits = rng.getrandbits
+
+
+def percent_roll():
+    """
+    Returns a random whole number from 1 to 100, drawn from rng exactly like rng.randint(1, 100) draws it (7 random
+    bits, drawn again while 100 or more), so the stream and every replay stay the same. It takes a quarter of the
+    time, randint spends most of its time checking its arguments.
+
+    :return: A number from 1 to 100
+    """
+    roll = _getrandbits(7)
+    while roll >= 100:
+        roll = _getrandbits(7)
+    return roll + 1
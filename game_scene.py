@@ -1,11 +1,39 @@
+import random
+
 import pygame
 from pygame import K_ESCAPE
 
+from background import ScrollingBackground
+from collision import (
+    ALIEN_HITS_PLAYER,
+    ALIEN_LASER_HITS_PLAYER,
+    BOSS_LASER_HITS_PLAYER,
+    LASER_HITS_ALIEN,
+    LASER_HITS_BOSS,
+    CollisionSystem,
+)
+from frame_timer import frame_timer
+from game_random import rng
+from hud import Hud
+from input_state import input_state
+from memory_profiler import memory_profiler
+from music import music
 from player import Player
 from powerup import PowerUp
+from renderer import renderer
+import save_game
 from score import Score
+from sound_bus import sound_bus
+import sprite_batch
+from sprite_batch import SpriteBatch
+from timestep import timestep
+
 
-WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+# Objects that moved further than this in one step jumped, and are not interpolated
+MAX_INTERPOLATION = 50
 
 
 class GameScene:
@@ -34,99 +62,230 @@ class GameScene:
         self.powerup = PowerUp()
 
         self.background = None
+        self.scrolling_background = None  # For levels with a scrolling background
         self.boss = None
         self.level_aliens = []
 
-        # Sounds
-        self.collision_sound = pygame.mixer.Sound("media/rumble.wav")
-        self.player_collision_sound = pygame.mixer.Sound("media/player_boom.wav")
+        # Positions at the previous simulation step, for render interpolation
+        self.previous_positions = []
+
+        # Collision detection
+        self.collisions = CollisionSystem()
+
+        # Drawing, the debug hit boxes are an optional layer on top
+        self.sprite_batch = SpriteBatch()
+        self.show_hit_boxes = False
 
         # Score
         self.score = Score(self.font)
 
+        # The level label, score and health bars, composed on a cached overlay
+        self.hud = Hud(screen.get_size(), self.font)
+
         # Scene connections
         self.game_over_scene = None
         self.pause_scene = None
         self.level_transition_scene = None
         self.win_scene = None
 
+        # Source of the keyboard state: the snapshot taken at the start of the frame,
+        # replaced by scripted input when running headless
+        self.read_keys = input_state
+
+        # Every random choice in the game is drawn from this stream, seeded when a game starts
+        self.rng = rng
+        self.seed = None
+
+        # Optional InputRecorder, started with every new game
+        self.recorder = None
+
         # Load the first level
         self.load_level()
 
     def load_level(self):
         """
         Load the current level by setting the background, spawning the boss, and clearing aliens.
+        Prefetches the next level's assets and evicts those of the other levels.
+        Marks a level boundary for the memory profiler.
         This method is called whenever a new level is started or transitioned into.
         """
         level = self.levels[self.level_index]
         self.boss = level.spawn_boss()
         self.background = level.background
-        level.aliens.clear()
+        self.scrolling_background = None
+        if level.scroll_speed:
+            self.scrolling_background = ScrollingBackground(self.background, level.scroll_speed)
+
+        # Only the current and the next level keep their background and music cached. The next level's are decoded
+        # on a worker thread during the boss fight, so the level transition never waits on the disk
+        for number, any_level in enumerate(self.levels):
+            if number in (self.level_index, self.level_index + 1):
+                any_level.prefetch()
+            else:
+                any_level.unload()
+
+        # Return the aliens of every level to their pools, aliens left from a previous level included
+        for any_level in self.levels:
+            any_level.clear_aliens()
+        self.level_aliens = level.aliens
+        memory_profiler.level_loaded(self.level_index + 1)
 
     def update(self, ms):
         """
-        Update the game state each frame by processing player input, updating player, boss,
+        Update the game state by one simulation step by processing player input, updating player, boss,
         aliens, and powerups, and managing level-specific logic.
 
-        :param ms: Milliseconds elapsed since the last frame, used for timing.
+        :param ms: Length of the simulation step in milliseconds, used for timing.
         """
         level = self.levels[self.level_index]
+        dt = ms / 1000
+
+        # Remember where everything was, so frames drawn between two steps can be interpolated
+        if timestep.active:
+            self.previous_positions = self.positions()
+            self.player.projectiles.remember()
 
         # Checks if the player pressed any movement or action keys
-        keys = pygame.key.get_pressed()
-        self.player.check_input(keys)
+        keys = self.read_keys()
+        self.player.check_input(keys, dt)
+
+        start = frame_timer.start()
+        self.player.update(dt)
+        self.boss.move(dt)  # Update the boss's position
+        frame_timer.stop("player_boss", start)
 
-        self.player.update()
-        self.boss.move()  # Update the boss's position
+        start = frame_timer.start()
         self.check_collision()
+        frame_timer.stop("check_collision", start)
 
+        start = frame_timer.start()
         level.update_aliens(self.boss.rect.x, ms)
+        frame_timer.stop("update_aliens", start)
 
         self.level_aliens = level.aliens
 
-        for alien in self.level_aliens:
-            alien.move()
+        start = frame_timer.start()
+        level.move_aliens(dt)
+        frame_timer.stop("move_aliens", start)
 
         self.powerup.spawn()
-        self.powerup.move()
-        self.score.update()
+        self.powerup.move(dt)
+        self.score.update(dt)
 
-    def draw(self):
-        """
-        Draw all elements of the current game scene: background, player, boss, aliens, powerups,
-        score, and level text. This method is called every frame to update the display.
+        if self.scrolling_background is not None:
+            self.scrolling_background.update(ms)
+
+    def positions(self):
         """
-        self.screen.blit(self.background, (0, 0))
-        self.player.draw(self.screen)
-        self.boss.draw(self.screen)
-        self.show_level_text()
-        self.score.draw(self.screen)
+        Returns the position of every moving object.
 
+        :return: A list of (rect, x, y) for the player, boss, aliens, lasers and powerup
+                 (the projectile pool remembers the player's projectiles itself)
+        """
+        rects = [self.player.rect, self.boss.rect, self.boss.laser.rect, self.powerup.rect]
         for alien in self.level_aliens:
-            alien.draw(self.screen)
+            rects.append(alien.rect)
+            rects.append(alien.laser.rect)
+        return [(rect, rect.x, rect.y) for rect in rects]
 
-        self.powerup.draw(self.screen)
+    def interpolate(self, alpha):
+        """
+        Moves every object to where it is between the previous and the current simulation step, for drawing.
+        Objects that jumped (respawned, wrapped around or were reset) are left where they are.
 
-        pygame.display.flip()
+        :param alpha: How far between the previous (0) and the current (1) step to place the objects
+        :return: A list of (rect, x, y) with the current positions, to be restored after drawing
+        """
+        current = []
+        for rect, x, y in self.previous_positions:
+            dx = rect.x - x
+            dy = rect.y - y
+            if (dx or dy) and abs(dx) <= MAX_INTERPOLATION and abs(dy) <= MAX_INTERPOLATION:
+                current.append((rect, rect.x, rect.y))
+                rect.x = x + round(dx * alpha)
+                rect.y = y + round(dy * alpha)
+        return current
 
-    def start_level_music(self):
+    def draw(self):
+        """
+        Draw all elements of the current game scene: background, player, boss, aliens, powerups,
+        score, and level text. This method is called every frame, the game loop then updates the display.
         """
-        Start the music for the current level. This method stops any currently playing music
-        and plays the music for the current level.
+        # Draw moving objects between the last two simulation steps, so motion stays smooth at any render rate
+        current = []
+        alpha = 1.0
+        if timestep.alpha < 1 and self.previous_positions:
+            alpha = timestep.alpha
+            current = self.interpolate(alpha)
+
+        # Everything is drawn through the renderer, which restores and updates only the changed regions
+        start = frame_timer.start()
+        renderer.begin_frame(self.visible_background(alpha))
+        frame_timer.stop("draw_background", start)
+
+        # Every sprite is drawn with one blit sequence, layer by layer
+        start = frame_timer.start()
+        batch = self.sprite_batch
+        batch.add(sprite_batch.PLAYER, self.player.sprite())
+        batch.extend(sprite_batch.PROJECTILES, self.player.projectiles.sprites(alpha))
+        batch.add(sprite_batch.BOSS, self.boss.sprite())
+        batch.add(sprite_batch.ENEMY_LASERS, self.boss.laser_sprite())
+
+        # Alien.sprite and EnemyLaser.sprite inlined, which saves two method calls per alien
+        aliens = self.level_aliens
+        batch.extend(sprite_batch.ALIENS, [(alien.images[alien.direction], alien.rect) for alien in aliens])
+        lasers = [alien.laser for alien in aliens]
+        batch.extend(
+            sprite_batch.ENEMY_LASERS, [(laser.image, laser.rect) for laser in lasers if laser.state == "fire"]
+        )
+
+        batch.add(sprite_batch.POWERUP, self.powerup.sprite())
+        level_number = self.levels[self.level_index].level_number
+        hud = self.hud.compose(level_number, self.score, self.player.health_bar, self.boss.health_bar)
+        batch.extend(sprite_batch.HUD, hud)
+        batch.submit(renderer)
+        self.hud.draw(self.screen)
+
+        if self.show_hit_boxes:
+            self.draw_hit_boxes()
+        frame_timer.stop("draw_sprites", start)
+
+        # Back to the simulated positions
+        for rect, x, y in current:
+            rect.x = x
+            rect.y = y
+
+    def visible_background(self, alpha=1.0):
         """
-        level = self.levels[self.level_index]
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(level.music_file)
-        pygame.mixer.music.play(-1)
+        Returns the background as it is on the screen.
 
-    def show_level_text(self):
+        :param alpha: How far between the previous (0) and the current (1) step a scrolling background is drawn
+        :return: The level's background, or the visible part of it if it scrolls
         """
-        Display the current level number on the screen. This text is shown in the top-left corner
-        of the screen.
+        if self.scrolling_background is not None:
+            return self.scrolling_background.surface(alpha)
+        return self.background
+
+    def draw_hit_boxes(self):
+        """Draws the debug hit boxes of the player, boss and aliens, and of every fired laser and projectile."""
+        for ship in [self.player, self.boss] + self.level_aliens:
+            renderer.mark(pygame.draw.rect(self.screen, RED, ship.rect, 1))
+
+        for laser in [self.boss.laser] + [alien.laser for alien in self.level_aliens]:
+            if laser.state == "fire":
+                renderer.mark(pygame.draw.rect(self.screen, BLUE, laser.rect, 1))
+
+        projectiles = self.player.projectiles
+        for x, y in zip(projectiles.x[: projectiles.count].tolist(), projectiles.y[: projectiles.count].tolist()):
+            rect = (x, y, projectiles.width, projectiles.height)
+            renderer.mark(pygame.draw.rect(self.screen, BLUE, rect, 1))
+
+    def start_level_music(self):
         """
-        level = self.levels[self.level_index]
-        level_text = self.font.render("LEVEL " + str(level.level_number), True, WHITE)
-        self.screen.blit(level_text, (10, 10))
+        Start the music for the current level, fading out any currently playing music.
+        The track was read ahead together with the level's background, so it starts from memory.
+        """
+        music.play(self.levels[self.level_index].music_file)
 
     def next_scene(self):
         """
@@ -136,18 +295,17 @@ class GameScene:
 
         :return: A scene object representing the next scene
         """
-        keys = pygame.key.get_pressed()
-        if keys[K_ESCAPE]:  # Game paused
-            pygame.mixer.music.stop()
+        keys = self.read_keys()
+        if keys[K_ESCAPE]:  # Game paused, the pause scene pauses the music
             return self.pause_scene
 
         elif self.player.health_points <= 0:  # Game over
-            pygame.mixer.music.stop()
+            music.stop()
             return self.game_over_scene
 
         elif self.boss.health_bar.bar_width <= 0 and self.level_index + 1 < len(self.levels):  # Advance to next level
             # Go to next level if the boss is defeated and there is another level
-            self.level_transition_scene.background = self.levels[self.level_index].background
+            background = self.visible_background()
             self.level_transition_scene.player_x = self.player.rect.x
 
             self.level_index += 1
@@ -155,12 +313,11 @@ class GameScene:
             self.start_level_music()
 
             self.level_transition_scene.level_number = self.level_index + 1
-            self.level_transition_scene.new_background = self.levels[self.level_index].background
+            self.level_transition_scene.set_backgrounds(background, self.background)
             return self.level_transition_scene
 
         elif self.boss.health_bar.bar_width <= 0 and self.level_index + 1 == len(self.levels):
             # If you defeat the boss on the last level, win!
-            pygame.mixer.music.stop()
             self.win_scene.start_win_music()
             return self.win_scene
 
@@ -171,53 +328,94 @@ class GameScene:
         """
         Check if any shots have hit the player, boss, or aliens and update their health or state accordingly.
         Also checks if the player collects any powerups and updates the score.
+        All hits are detected first and then applied in one pass, so removing aliens never skips any.
+        Every projectile that hits something is removed. A projectile overlapping several aliens destroys all of them.
         """
+        aliens = self.level_aliens
+        removed = set()
+        spent = set()
+
+        for kind, index, projectile in self.collisions.detect(self.player, self.boss, aliens):
+            if kind == LASER_HITS_BOSS:
+                spent.add(projectile)
+                self.boss.health_points -= 1
+                sound_bus.trigger("hit")  # Play collision sound when a shot hits the boss
+                self.score.change_score(5)
+
+            elif kind == BOSS_LASER_HITS_PLAYER:
+                self.boss.laser.state = "ready"
+                self.player.health_points -= 2
+                sound_bus.trigger("player_hit")
+                self.score.change_score(-10)
 
-        if self.player.laser.hit(self.boss):
-            self.boss.health_points -= 1
-            self.collision_sound.play()  # Play collision sound when a shot hits the boss
-            self.score.change_score(5)
-
-        if self.boss.laser.hit(self.player):
-            self.player.health_points -= 2
-            self.player_collision_sound.play()
-            self.score.change_score(-10)
+            # An alien removed by an earlier hit can't hit the player anymore, neither can its laser
+            elif index in removed:
+                continue
 
-        # Important to keep alien loops separate so that some actions don't interfere with others
-        for alien in self.level_aliens:
-            if self.player.laser.hit(alien):
-                self.level_aliens.remove(alien)
-                self.collision_sound.play()
+            elif kind == LASER_HITS_ALIEN:
+                spent.add(projectile)
+                removed.add(index)
+                sound_bus.trigger("hit")
                 self.score.change_score(10)
 
-        for alien in self.level_aliens:
-            if alien.check_collision(self.player):
+            elif kind == ALIEN_HITS_PLAYER:
                 self.player.health_points -= 1
-                self.level_aliens.remove(alien)
-                self.player_collision_sound.play()
+                removed.add(index)
+                sound_bus.trigger("player_hit")
                 self.score.change_score(-10)
 
-        for alien in self.level_aliens:
-            if alien.laser.hit(self.player):
+            elif kind == ALIEN_LASER_HITS_PLAYER:
+                aliens[index].laser.state = "ready"
                 self.player.health_points -= 1
-                self.player_collision_sound.play()
+                sound_bus.trigger("player_hit")
                 self.score.change_score(-5)
 
+        if removed:
+            self.levels[self.level_index].remove_aliens(removed)
+        if spent:
+            self.player.projectiles.remove(spent)
+
+        # A powerup heals the player, or upgrades the weapon when the player has full health
         if self.powerup.collect(self.player):
             self.powerup.state = "ready"
             if self.player.health_bar.initial_health > self.player.health_points:
                 self.player.health_points += 1
+            else:
+                self.player.weapon = self.player.weapon.upgraded()
 
     def reset(self):
         """
         Reset the game state to the initial conditions for the first level. This includes resetting
         player health, level index, spawned aliens and score. This method is used when restarting the game.
+        The music keeps playing, so the menu music can fade into the level music.
         """
-        self.player = Player(360, 465)
         self.level_index = 0
-        self.levels[self.level_index].spawned_aliens = 0
-        self.level_aliens = self.levels[self.level_index].aliens
         self.load_level()
-        self.levels[self.level_index].time_since_last_spawn = 0
         self.score.reset()
-        pygame.mixer.music.stop()
+        self.new_game()
+
+    def new_game(self, seed=None):
+        """
+        Starts a game on the loaded level: resets the player, powerup and alien spawning, seeds the random
+        number stream and starts recording the input if a recorder is set.
+
+        :param seed: Seed of the random number stream, or None for a new random seed
+        """
+        self.player = Player(360, 465)
+        self.powerup = PowerUp()
+        for level in self.levels:
+            level.reset()
+        self.level_aliens = self.levels[self.level_index].aliens
+        self.previous_positions = []
+
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng.seed(self.seed)
+        self.start_recording()
+
+    def start_recording(self):
+        """
+        Starts recording the input if a recorder is set. The recording starts with a snapshot of the game,
+        which together with the recorded input is all that is needed to replay the game exactly.
+        """
+        if self.recorder is not None:
+            self.recorder.start(save_game.dumps(self))
@@ -0,0 +1,230 @@
+import argparse
+import os
+import sys
+import time
+
+import pygame
+from pygame import K_DOWN, K_ESCAPE, K_LEFT, K_RIGHT, K_UP
+
+from game_scene import GameScene
+from level_data import load_level_data
+from main import create_levels, create_scenes, init_display, load_font
+from renderer import renderer
+from replay import ReplayKeys, load_replay, state_hash
+import save_game
+from sound_bus import sound_bus
+from timestep import STEP_MS
+
+# Key names accepted in input scripts
+KEY_NAMES = {
+    "left": K_LEFT,
+    "right": K_RIGHT,
+    "up": K_UP,
+    "down": K_DOWN,
+    "escape": K_ESCAPE,
+}
+
+
+class ScriptedKeys:
+    """
+    Replays a scripted sequence of held keys instead of reading the keyboard. Used as the GameScene's key source
+    when running headless. Calling the object returns the keyboard state for the current frame.
+    """
+
+    def __init__(self, script):
+        """
+        Initializes the scripted input.
+
+        :param script: A list of (frame, held_keys) pairs. From each frame on, the given keys are held until the
+                       next entry. Keys are pygame key constants.
+        """
+        self.script = sorted(script, key=lambda entry: entry[0])
+        self.frame = 0
+        self.next_entry = 0
+        self.held = frozenset()
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Builds scripted input from text such as "0:right+up,90:left,180:" (hold right and up from frame 0,
+        only left from frame 90 and nothing from frame 180).
+
+        :param text: The input script
+        :return: A ScriptedKeys object
+        :raises ValueError: If a frame is not a whole number or a key name is unknown
+        """
+        script = []
+        for entry in text.split(","):
+            if not entry.strip():
+                continue
+            frame, _, names = entry.partition(":")
+            keys = set()
+            for name in names.split("+"):
+                name = name.strip().lower()
+                if not name:
+                    continue
+                if name not in KEY_NAMES:
+                    raise ValueError(f"{entry.strip()!r}: unknown key {name!r}, use one of {', '.join(KEY_NAMES)}")
+                keys.add(KEY_NAMES[name])
+            try:
+                script.append((int(frame), frozenset(keys)))
+            except ValueError:
+                raise ValueError(f"{entry.strip()!r}: frame {frame.strip()!r} is not a whole number") from None
+        return cls(script)
+
+    def advance(self):
+        """Moves the script on to the next frame."""
+        self.frame += 1
+
+    def __call__(self):
+        """
+        Returns the keyboard state for the current frame.
+
+        :return: An object that can be indexed with pygame key constants, like pygame.key.get_pressed()
+        """
+        while self.next_entry < len(self.script) and self.script[self.next_entry][0] <= self.frame:
+            self.held = self.script[self.next_entry][1]
+            self.next_entry += 1
+        return self
+
+    def __getitem__(self, key):
+        """Returns True if the key is held in the current frame."""
+        return key in self.held
+
+
+def init_headless():
+    """
+    Initializes pygame with the SDL dummy video and audio drivers, so no window or sound device is needed.
+
+    :return: The (invisible) screen surface
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    return init_display()
+
+
+def create_game(screen, level_number=1, seed=0):
+    """
+    Creates a GameScene positioned at the start of the given level.
+
+    :param screen: The screen surface
+    :param level_number: The level to start on (1 is the first level)
+    :param seed: Seed of the game's random number stream
+    :return: The GameScene
+    :raises ValueError: If the game has no such level
+    """
+    levels = create_levels()
+    if not 1 <= level_number <= len(levels):
+        raise ValueError(f"no level {level_number}, the levels are 1 to {len(levels)}")
+    game = GameScene(screen, load_font(), levels)
+    game.level_index = level_number - 1
+    game.load_level()
+    game.new_game(seed)
+    return game
+
+
+def run_headless(frames, level_number=1, inputs=None, ms=STEP_MS, draw=False, seed=0):
+    """
+    Drives GameScene.update with a fixed frame time as fast as the CPU allows, without a frame cap.
+
+    :param frames: Number of frames to simulate
+    :param level_number: The level to start on
+    :param inputs: Scripted input (ScriptedKeys), or None to press nothing
+    :param ms: Simulated milliseconds per frame (one simulation step by default)
+    :param draw: Also call GameScene.draw each frame (to the invisible screen)
+    :param seed: Seed of the game's random number stream
+    :return: Simulated frames per second
+    """
+    screen = init_headless()
+    game = create_game(screen, level_number, seed)
+    if inputs is None:
+        inputs = ScriptedKeys([])
+    game.read_keys = inputs
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update(ms)
+        sound_bus.flush()
+        if draw:
+            game.draw()
+            renderer.present()
+        inputs.advance()
+    elapsed = time.perf_counter() - start
+
+    pygame.quit()
+    return frames / elapsed if elapsed > 0 else float("inf")
+
+
+def run_replay(path):
+    """
+    Replays a recorded game as fast as the CPU allows and checks the state hash of every frame against the recording.
+
+    :param path: Path of the replay file, written by running the game with --record
+    :return: A tuple of (number of frames, replayed frames per second, first diverging frame or None)
+    """
+    snapshot, frames = load_replay(path)
+    screen = init_headless()
+
+    # The connected game scene of the real game, so level transitions happen as they did when recorded
+    game = create_scenes(screen, load_font(), create_levels()).game_scene
+    save_game.loads(game, snapshot)
+    keys = ReplayKeys()
+    game.read_keys = keys
+
+    diverged = None
+    start = time.perf_counter()
+    for frame, (_, steps, mask, recorded_hash) in enumerate(frames):
+        keys.mask = mask
+        for _ in range(steps):
+            game.update(STEP_MS)
+        sound_bus.flush()
+        if state_hash(game) != recorded_hash:
+            diverged = frame
+            break
+        game.next_scene()
+    elapsed = time.perf_counter() - start
+
+    pygame.quit()
+    replayed = len(frames) if diverged is None else diverged + 1
+    return len(frames), replayed / elapsed if elapsed > 0 else float("inf"), diverged
+
+
+def main():
+    """
+    Command line entry point: python headless.py --frames 10000 --level 5 --keys 0:right+up,300:left
+    or python headless.py --replay game.rpl
+    """
+    parser = argparse.ArgumentParser(description="Run the game simulation headless and uncapped.")
+    parser.add_argument("--frames", type=int, default=10000, help="number of frames to simulate")
+    parser.add_argument("--level", type=int, default=1, help="level to start on (1 is the first)")
+    parser.add_argument("--keys", default="", help='scripted input, e.g. "0:right+up,90:left,180:"')
+    parser.add_argument("--ms", type=float, default=STEP_MS, help="simulated milliseconds per frame")
+    parser.add_argument("--draw", action="store_true", help="also draw every frame")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the game's random number stream")
+    parser.add_argument("--replay", help="replay a game recorded with main.py --record and check it for divergence")
+    args = parser.parse_args()
+
+    if args.replay:
+        try:
+            count, fps, diverged = run_replay(args.replay)
+        except ValueError as error:
+            parser.error(f"--replay: {error}")
+        print(f"Replayed {count} frames: {fps:.1f} frames per second")
+        if diverged is not None:
+            print(f"Diverged from the recording at frame {diverged}")
+            sys.exit(1)
+        return
+
+    level_count = len(load_level_data())
+    if not 1 <= args.level <= level_count:
+        parser.error(f"--level: no level {args.level}, the levels are 1 to {level_count}")
+    try:
+        inputs = ScriptedKeys.parse(args.keys)
+    except ValueError as error:
+        parser.error(f"--keys: {error}")
+    fps = run_headless(args.frames, args.level, inputs, args.ms, args.draw, args.seed)
+    print(f"Simulated {args.frames} frames of level {args.level}: {fps:.1f} frames per second")
+
+
+if __name__ == "__main__":
+    main()
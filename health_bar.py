@@ -9,8 +9,14 @@ class HealthBar:
     """
     This class represents a health bar that displays the current health of a player or enemy.
     The bar will change colour based on whether health is increasing or decreasing.
+    An instance stores only its own state in __slots__, the height and speed are shared at class level.
     """
 
+    __slots__ = ("initial_health", "width_per_hp", "x", "y", "color", "bar_width", "health_rect")
+
+    height = 7
+    speed = 60  # Pixels per second the bar grows or shrinks
+
     def __init__(self, x, y, initial_health, width_per_hp=30):
         """
         Initialize the health bar with the starting position, size, and health.
@@ -22,39 +28,41 @@ class HealthBar:
         """
         self.initial_health = initial_health
         self.width_per_hp = width_per_hp
-        self.height = 7
         self.x = x
         self.y = y
         self.color = WHITE
         self.bar_width = self.initial_health * self.width_per_hp
         self.health_rect = pygame.Rect(self.x, self.y, self.bar_width, self.height)
 
-    def update(self, current_health):
+    def update(self, current_health, dt):
         """
         Update the health bar's width based on the current health of the entity.
         Changes colour if health is increasing (green) or decreasing (red).
 
         :param current_health: The current health value that determines the health bar's width.
+        :param dt: Length of the simulation step in seconds.
         """
         target_width = current_health * self.width_per_hp
+        step = round(self.speed * dt)
         self.color = WHITE
 
         # If health is decreasing, reduce the width and set the colour to red
         if target_width < self.bar_width:
-            self.bar_width -= 1
+            self.bar_width = max(self.bar_width - step, target_width)
             self.color = RED
-            self.health_rect = pygame.Rect(self.x, self.y, self.bar_width, self.height)
+            self.health_rect.width = self.bar_width
 
         # If health is increasing, increase the width and set the colour to green
         elif target_width > self.bar_width:
-            self.bar_width += 1
+            self.bar_width = min(self.bar_width + step, target_width)
             self.color = GREEN
-            self.health_rect = pygame.Rect(self.x, self.y, self.bar_width, self.height)
+            self.health_rect.width = self.bar_width
 
     def draw(self, screen):
         """
         Draw the health bar on the screen.
 
         :param screen: The screen where the health bar will be drawn.
+        :return: The rectangle covered by the bar
         """
-        pygame.draw.rect(screen, self.color, self.health_rect)
+        return screen.fill(self.color, self.health_rect)
@@ -0,0 +1,139 @@
+import pygame
+
+from renderer import renderer
+from text_cache import text_cache
+
+WHITE = (255, 255, 255)
+CLEAR = (0, 0, 0, 0)
+
+LEVEL_TEXT_POSITION = (10, 10)  # Top left corner of the screen
+SETTLE_FRAMES = 30  # Frames without a change before the overlay is drawn in one blit
+
+
+class Hud:
+    """
+    The heads-up display of the game scene: the level label, the score and the health bars of the player and the
+    boss. They are composed on a cached transparent overlay the size of the screen, each part at its place on the
+    screen, and a part is only drawn again when the value it shows changed. Then only its region of the overlay is
+    cleared and redrawn. The score counts up for a while after every hit, so while it counts it is drawn straight
+    from its image, and put on the overlay once it stopped.
+
+    While parts change, the overlay is drawn through their regions, one (overlay, rect, area) sprite each. Once
+    nothing changed for SETTLE_FRAMES frames, a run-length encoded copy of the overlay is made, which SDL blits
+    skipping the transparent runs, and the whole HUD is drawn with that one blit. Either way the dirty-rectangle
+    renderer only restores and updates the regions of the parts, not the whole screen.
+    """
+
+    def __init__(self, size, font):
+        """
+        Initializes an empty HUD.
+
+        :param size: Size of the screen
+        :param font: The font of the level label
+        """
+        self.overlay = pygame.Surface(size, pygame.SRCALPHA)
+        self.font = font
+
+        # The value every part shows and the region it covers on the overlay, by part name
+        self.shown = {}
+        self.regions = {}
+        self.sprites = []
+        self.counting = None  # The score's (image, position) while it counts, drawn instead of its region
+
+        # Run-length encoded copy of the overlay, made once the HUD settled
+        self.composite = None
+        self.clean_frames = 0  # Frames since a part last changed
+
+        # Counters
+        self.redraws = 0  # Parts drawn again since the HUD was created
+        self.composites = 0  # Copies of the overlay made since the HUD was created
+
+    def compose(self, level_number, score, player_bar, boss_bar):
+        """
+        Draws the parts whose value changed since the last frame on the overlay. Once the HUD settled, draw() draws
+        it instead.
+
+        :param level_number: Number of the current level
+        :param score: The Score
+        :param player_bar: The player's HealthBar
+        :param boss_bar: The boss's HealthBar
+        :return: The HUD's sprites for a SpriteBatch, (overlay, rect, area) triples and the counting score's
+                 (image, position) pair, none once the HUD settled
+        """
+        changed = False
+        if self.shown.get("level") != level_number:
+            text = text_cache.render(self.font, "LEVEL " + str(level_number), True, WHITE)
+            self.redraw("level", level_number, lambda overlay: overlay.blit(text, LEVEL_TEXT_POSITION))
+            changed = True
+        if self.shown.get("score") != score.displayed_score:
+            region = self.regions.pop("score", None)
+            if region is not None:
+                self.overlay.fill(CLEAR, region)
+            self.shown["score"] = score.displayed_score
+            self.counting = score.sprite()
+            changed = True
+        elif self.counting is not None:
+            image, position = self.counting
+            self.counting = None
+            self.redraw("score", score.displayed_score, lambda overlay: overlay.blit(image, position))
+            changed = True
+        for name, bar in (("player_bar", player_bar), ("boss_bar", boss_bar)):
+            value = (bar.bar_width, bar.x, bar.y, bar.color)
+            if self.shown.get(name) != value:
+                self.redraw(name, value, bar.draw)
+                changed = True
+
+        if changed:
+            self.sprites = [(self.overlay, region, region) for region in self.regions.values() if region]
+            if self.counting is not None:
+                self.sprites.append(self.counting)
+            self.composite = None
+            self.clean_frames = 0
+            return self.sprites
+
+        if self.composite is None:
+            self.clean_frames += 1
+            if self.clean_frames < SETTLE_FRAMES:
+                return self.sprites
+            self.composite = self.overlay.copy()
+            self.composite.set_alpha(255, pygame.RLEACCEL)
+            self.composites += 1
+        return []
+
+    def draw(self, screen):
+        """
+        Draws the settled HUD in one blit, on top of the frame's sprites. Only the regions of its parts are recorded
+        with the renderer. Does nothing while the HUD's sprites are drawn instead.
+
+        :param screen: The display surface
+        """
+        if self.composite is None:
+            return
+        screen.blit(self.composite, (0, 0))
+        for region in self.regions.values():
+            renderer.mark(region)
+
+    def redraw(self, name, value, draw):
+        """
+        Clears the region of a part on the overlay and draws it again.
+
+        :param name: Name of the part
+        :param value: The value the part shows from now on
+        :param draw: Function drawing the part on the overlay, returning the rectangle it covered
+        """
+        region = self.regions.get(name)
+        if region is not None:
+            self.overlay.fill(CLEAR, region)
+        self.regions[name] = draw(self.overlay)
+        self.shown[name] = value
+        self.redraws += 1
+
+    def clear(self):
+        """Clears the overlay, so every part is drawn again in the next frame."""
+        self.overlay.fill(CLEAR)
+        self.shown.clear()
+        self.regions.clear()
+        self.sprites = []
+        self.counting = None
+        self.composite = None
+        self.clean_frames = 0
@@ -0,0 +1,94 @@
+import time
+from collections import defaultdict, deque
+
+import pygame
+from pygame import KEYDOWN, QUIT
+
+from frame_timer import frame_timer
+
+
+class InputState:
+    """
+    The keyboard state of the current frame. The game loop polls it once at the start of every frame, which handles
+    the whole event queue and takes one snapshot of the held keys. Scenes and game objects read that snapshot,
+    so everything in a frame sees the same keys and acts on them in the same frame.
+
+    Also measures input latency. pygame events carry no timestamp, so a key press is timed from the poll that picked
+    it up to the presented frame that acted on it; the time since the previous poll is how long it may have waited in
+    the event queue before that. With the frame timer on, each such frame adds an "input_latency" section to its trace.
+    """
+
+    def __init__(self, history=256):
+        """
+        Initializes the input state with no keys held.
+
+        :param history: Number of latency measurements kept
+        """
+        self.keys = defaultdict(bool)  # Snapshot of pygame.key.get_pressed(), indexed with pygame key constants
+        self.pressed = []  # Keys pressed down since the previous frame
+        self.quit = False  # True once the window was closed
+        self.source = None  # Optional key source read instead of the keyboard, e.g. bots.AutopilotBot
+
+        # Latency
+        self.poll_time = 0.0
+        self.queue_wait = 0.0  # Seconds between the previous and the current poll
+        self.waiting = 0  # Key presses of this frame not presented yet
+        self.latencies = deque(maxlen=history)  # (poll to present, queue wait) in milliseconds
+
+    def poll(self):
+        """
+        Handles every pending event and takes the frame's snapshot of the keyboard (or of the key source, if set).
+        Called once at frame start.
+        """
+        now = time.perf_counter()
+        self.queue_wait = now - self.poll_time if self.poll_time else 0.0
+        self.poll_time = now
+
+        self.pressed.clear()
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                self.quit = True
+            elif event.type == KEYDOWN:
+                self.pressed.append(event.key)
+        self.waiting = len(self.pressed)
+        self.keys = pygame.key.get_pressed() if self.source is None else self.source()
+
+    def presented(self):
+        """Records the latency of this frame's key presses. Called once the frame is on the screen."""
+        if not self.waiting:
+            return
+        frame_ms = (time.perf_counter() - self.poll_time) * 1000
+        frame_timer.stop("input_latency", self.poll_time if frame_timer.enabled else 0)
+        for _ in range(self.waiting):
+            self.latencies.append((frame_ms, self.queue_wait * 1000))
+        self.waiting = 0
+
+    def __call__(self):
+        """
+        Returns the keyboard snapshot of the current frame. Lets the input state stand in for pygame.key.get_pressed.
+
+        :return: An object that can be indexed with pygame key constants
+        """
+        return self.keys
+
+    def stats(self):
+        """
+        Returns the measured input latency of the recent key presses.
+
+        :return: A dictionary with the number of key presses, the mean and worst time from poll to present,
+                 and the mean worst case including the wait in the event queue, in milliseconds
+        """
+        if not self.latencies:
+            return {"presses": 0, "mean_ms": 0.0, "max_ms": 0.0, "mean_worst_case_ms": 0.0}
+        frame_times = [frame_ms for frame_ms, _ in self.latencies]
+        worst_cases = [frame_ms + wait_ms for frame_ms, wait_ms in self.latencies]
+        return {
+            "presses": len(frame_times),
+            "mean_ms": sum(frame_times) / len(frame_times),
+            "max_ms": max(frame_times),
+            "mean_worst_case_ms": sum(worst_cases) / len(worst_cases),
+        }
+
+
+# The shared input state, polled by the game loop and read by every scene
+input_state = InputState()
@@ -1,6 +1,8 @@
-import pygame
 from pygame import K_m
 
+from input_state import input_state
+from text_cache import text_cache
+
 WHITE = (255, 255, 255)
 
 
@@ -33,20 +35,20 @@ class InstructionsScene:
         self.draw_return()
         self.draw_game_text()
 
-        pygame.display.flip()
-
     def draw_game_text(self):
         """Draws the game instructions text on the screen."""
-        game_title = self.font.render("GAME:", True, WHITE)
-        game_text = self.font.render("Survive five brutal space battles!", True, WHITE)
-        game_text2 = self.font.render("Defeat the boss to clear each level.", True, WHITE)
-        game_text3 = self.font.render("Destroy enemies to earn score.", True, WHITE)
-        game_text4 = self.font.render("The boss and its aliens fire lasers.", True, WHITE)
-        game_text5 = self.font.render("Dodge enemy lasers to stay alive!", True, WHITE)
-        game_text6 = self.font.render("Each level more aliens appear and boss health increases.", True, WHITE)
-        game_text7 = self.font.render("Grab power-ups to heal your ship.", True, WHITE)
-        game_text8 = self.font.render("Conquer all five levels to claim victory!", True, WHITE)
-        game_text9 = self.font.render("Save your game by pausing and pressing 's'!", True, WHITE)
+        game_title = text_cache.render(self.font, "GAME:", True, WHITE)
+        game_text = text_cache.render(self.font, "Survive five brutal space battles!", True, WHITE)
+        game_text2 = text_cache.render(self.font, "Defeat the boss to clear each level.", True, WHITE)
+        game_text3 = text_cache.render(self.font, "Destroy enemies to earn score.", True, WHITE)
+        game_text4 = text_cache.render(self.font, "The boss and its aliens fire lasers.", True, WHITE)
+        game_text5 = text_cache.render(self.font, "Dodge enemy lasers to stay alive!", True, WHITE)
+        game_text6 = text_cache.render(
+            self.font, "Each level more aliens appear and boss health increases.", True, WHITE
+        )
+        game_text7 = text_cache.render(self.font, "Grab power-ups to heal your ship.", True, WHITE)
+        game_text8 = text_cache.render(self.font, "Conquer all five levels to claim victory!", True, WHITE)
+        game_text9 = text_cache.render(self.font, "Save your game by pausing and pressing 's'!", True, WHITE)
 
         # Draw text on screen
         self.screen.blit(game_title, (10, 134))
@@ -62,14 +64,14 @@ class InstructionsScene:
 
     def draw_return(self):
         """Draws the prompt to return to the main menu on the screen."""
-        return_text = self.font.render("PRESS M TO RETURN TO MAIN MENU", True, WHITE)
+        return_text = text_cache.render(self.font, "PRESS M TO RETURN TO MAIN MENU", True, WHITE)
         self.screen.blit(return_text, (130, 562))
 
     def draw_controls(self):
         """Draws the controls instructions on screen."""
-        controls_title = self.font.render("CONTROLS:", True, WHITE)
-        controls_text = self.font.render("Use LEFT and RIGHT ARROW KEYS to move", True, WHITE)
-        controls_text2 = self.font.render("Use UP ARROW KEY to shoot and press ESC to pause", True, WHITE)
+        controls_title = text_cache.render(self.font, "CONTROLS:", True, WHITE)
+        controls_text = text_cache.render(self.font, "Use LEFT and RIGHT ARROW KEYS to move", True, WHITE)
+        controls_text2 = text_cache.render(self.font, "Use UP ARROW KEY to shoot and press ESC to pause", True, WHITE)
         self.screen.blit(controls_title, (10, 10))
         self.screen.blit(controls_text, (10, 48))
         self.screen.blit(controls_text2, (10, 86))
@@ -84,7 +86,7 @@ class InstructionsScene:
 
         :return: The next scene (either the current scene or the menu scene).
         """
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
         if keys[K_m]:
             return self.menu_scene
         else:
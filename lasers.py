@@ -1,159 +1,119 @@
-import random
-
 import pygame
-from pygame import K_UP
-
-
-class PlayerLaser:
-    """
-    This class manages the laser fired by the player. It handles laser firing,
-    movement, and collision detection with enemy objects. The laser is fired upwards from the
-    player's ship and resets when it moves off-screen.
-    """
 
-    def __init__(self):
-        """Initializes the object"""
-        self.image = pygame.image.load("media/player_laser.png")  # Load laser image
-        self.rect = self.image.get_rect()  # Hit box for the laser
-        self.rect.x = -100  # Start off-screen
-        self.rect.y = -100
-        self.speed = 9
-        self.state = "ready"  # Laser state is 'ready' to shoot initially
-        self.laser_sound = pygame.mixer.Sound("media/laser.wav")  # Sound for laser firing
-
-    def check_input(self, player_x):
-        """
-        Checks player input to see if the laser should be fired.
-
-        :param player_x: x-coordinate of the player to shoot laser from
-        """
-        keys = pygame.key.get_pressed()
-        if keys[K_UP] and self.state == "ready":
-            self.fire(player_x)
-
-    def fire(self, player_x):
-        """
-        Fires the laser from the player's position.
-
-        :param player_x: x-coordinate of the player to shoot laser from
-        """
-        self.state = "fire"
-        self.laser_sound.play()
-        self.rect.y = 475  # Laser start position
-        self.rect.x = player_x + 31  # Adjusted to shoot from player's center
-
-    def move(self):
-        """Moves the laser upwards. Resets the laser if it moves off-screen."""
-        if self.state == "fire":
-            self.rect.y -= self.speed
-            if self.rect.y <= -50:  # Reload when laser moves off-screen
-                self.state = "ready"
-        elif self.state == "ready":
-            self.rect.x = -100  # Move off-screen
-            self.rect.y = -100
-
-    def draw(self, screen):
-        """
-        Draws laser on the screen.
-
-        :param screen: The screen surface to draw the laser on
-        """
-        if self.state == "fire":
-            screen.blit(self.image, (self.rect.x, self.rect.y))
-
-    def hit(self, other):
-        """
-        Checks if the laser collides with an enemy.
+from assets import assets
+from game_random import percent_roll
+from sound_bus import sound_bus
 
-        :param other: The enemy to check for collision with
-        :return: True if hit, False otherwise
-        """
-        if pygame.Rect.colliderect(self.rect, other.rect):
-            self.state = "ready"  # Reset laser state
-            return True
-        else:
-            return False
+OFF_SCREEN = -100  # x and y of a laser that is ready to fire
+BOTTOM_LIMIT = 650  # Fired lasers at or below this y are ready again
 
 
 class EnemyLaser:
     """
-    This class handles lasers fired by enemy ships. It handles randomly firing lasers,
-    controlling their movement, and detecting collisions with the player's ship.
+    This class handles lasers fired by enemy ships. It handles randomly firing lasers and controlling their
+    movement. Their hits on the player's ship are found by the game scene's CollisionSystem.
+
+    Every kind of enemy has its own subclass, which holds what all its lasers share once, at class level: the image,
+    the sound, the hit box and the offsets from the enemy and over the hit box. An instance stores only its own
+    state in __slots__, so a laser has no __dict__.
     """
 
-    def __init__(self, image, shoot_chance, laser_sound, use_custom_hit_box=False):
+    __slots__ = ("rect", "state", "shoot_chance")
+
+    image_file = None  # Set by subclasses
+    laser_sound = None  # Name of the sound effect played when the laser is fired
+    hit_box = None  # (width, height) of a hit box smaller than the image, None for the image's size
+    fire_offset = (0, 0)  # Position the laser is fired from, relative to the enemy
+    image_offset = (0, 0)  # Position of the image's top left corner, left of and above the hit box
+    speed = 300  # Pixels per second
+    image = None  # Loaded from image_file by the first laser of the class
+
+    def __init__(self, shoot_chance):
         """
         Initializes the enemy laser object.
 
-        :param image: The image used for the laser
-        :param shoot_chance: Percentage chance for the laser to be fired per frame
-        :param laser_sound: Laser sound file
-        :param use_custom_hit_box: Optional custom hit box
+        :param shoot_chance: Percentage chance for the laser to be fired per simulation step
         """
-        self.image = pygame.image.load(image)
+        cls = type(self)
+        if cls.image is None:
+            cls.image = assets.image(cls.image_file)
 
-        if use_custom_hit_box:
-            self.rect = pygame.Rect(-100, -100, 8, 60)  # Start off-screen, hit box smaller than image
+        if self.hit_box is not None:
+            # Start off-screen, hit box smaller than image
+            self.rect = pygame.Rect(OFF_SCREEN, OFF_SCREEN, *self.hit_box)
         else:
             self.rect = self.image.get_rect()  # Default hit box on image
 
-        self.speed = 5
         self.state = "ready"
-        self.shoot_chance = 100 - shoot_chance  # Chance to shoot per frame
-        self.show_hit_box = False  # Optional show hit box for debugging
-        self.laser_sound = pygame.mixer.Sound(laser_sound)
+        self.shoot_chance = 100 - shoot_chance  # Chance to shoot per simulation step
 
-    def fire(self, enemy_x, enemy_y, x_adjustment, y_adjustment):
+    def reset(self):
+        """Makes the laser ready to fire again and moves it off-screen."""
+        self.state = "ready"
+        self.rect.topleft = (OFF_SCREEN, OFF_SCREEN)
+
+    def fire(self, enemy_x, enemy_y):
         """
-        Fires the enemy laser with a random chance.
+        Fires the enemy laser with a random chance, from the class's fire offset.
 
         :param enemy_x: x-coordinate of the enemy
         :param enemy_y: y-coordinate of the enemy
-        :param x_adjustment: Adjustment to the x-coordinate for laser alignment
-        :param y_adjustment: Adjustment to the y-coordinate for laser alignment
         """
         if self.state == "ready":
-            if random.randint(1, 100) > self.shoot_chance:  # Random chance to fire
-                self.rect.x = enemy_x + x_adjustment  # Adjusted to enemy center
-                self.rect.y = enemy_y + y_adjustment
+            if percent_roll() > self.shoot_chance:  # Random chance to fire
+                x_offset, y_offset = self.fire_offset  # Adjusted to enemy center
+                self.rect.topleft = (enemy_x + x_offset, enemy_y + y_offset)
                 self.state = "fire"
-                self.laser_sound.play()
+                sound_bus.trigger(self.laser_sound)
 
-    def move(self):
-        """Moves the enemy laser downwards and resets it when off-screen."""
-        if self.state == "fire":
-            self.rect.y += self.speed
+    def move(self, dt):
+        """
+        Moves the enemy laser downwards and resets it when off-screen.
+
+        :param dt: Length of the simulation step in seconds
+        """
+        state = self.state
+        if state == "fire":
+            rect = self.rect
+            rect.y += round(self.speed * dt)
 
-            if self.rect.y >= 650:  # Reset when laser moves off-screen
+            if rect.y >= BOTTOM_LIMIT:  # Reset when laser moves off-screen
                 self.state = "ready"
-        elif self.state == "ready":
-            self.rect.x = -100  # Move off-screen
-            self.rect.y = -100
+        elif state == "ready":
+            self.rect.topleft = (OFF_SCREEN, OFF_SCREEN)  # Move off-screen
 
-    def draw(self, screen, x_adjustment=0, y_adjustment=0):
+    def sprite(self):
         """
-        Draws laser on the screen.
+        Returns the laser's image and position if it is fired, the image moved by the class's image offset.
 
-        :param screen: The screen surface to draw the laser on
-        :param x_adjustment: Optional adjustment of image over hit box
-        :param y_adjustment: Optional adjustment of image over hit box
+        :return: An (image, position) pair for a SpriteBatch, or None if the laser is not fired
         """
-        if self.state == "fire":
-            # Center the image over the hit box
-            screen.blit(self.image, (self.rect.x - x_adjustment, self.rect.y - y_adjustment))
-            if self.show_hit_box:
-                pygame.draw.rect(screen, (0, 0, 255), self.rect, 1)
+        if self.state != "fire":
+            return None
+        x_offset, y_offset = self.image_offset
+        if not x_offset and not y_offset:
+            return self.image, self.rect
+        # Center the image over the hit box
+        return self.image, (self.rect.x - x_offset, self.rect.y - y_offset)
 
-    def hit(self, other):
-        """
-        Checks if the enemy laser collides with another object (player).
-        Resets the laser's state to 'ready' if a collision occurs.
 
-        :param other: The object to check for collision with (the player).
-        :return: bool: Returns True if the laser collides with the object, otherwise False.
-        """
-        if pygame.Rect.colliderect(self.rect, other.rect):
-            self.state = "ready"
-            return True
-        else:
-            return False
+class AlienLaser(EnemyLaser):
+    """The laser of an alien, fired from below its center."""
+
+    __slots__ = ()
+
+    image_file = "media/alien_laser.png"
+    laser_sound = "alien_laser"
+    fire_offset = (25, 60)
+
+
+class BossLaser(EnemyLaser):
+    """The laser of the boss, fired from the middle of the boss, with a hit box narrower than its glow."""
+
+    __slots__ = ()
+
+    image_file = "media/boss_laser.png"
+    laser_sound = "boss_laser"
+    hit_box = (8, 60)
+    fire_offset = (116, 70)
+    image_offset = (37, 30)
@@ -0,0 +1,174 @@
+import json
+import marshal
+import os
+import zlib
+
+# Level definitions, and the compiled form cached next to them so later startups skip parsing and validation
+LEVEL_FILE = "levels.json"
+CACHE_FILE = "levels.cache"
+CACHE_VERSION = 2  # Bump when the compiled form changes
+
+# Defaults for the optional fields of a wave
+WAVE_DEFAULTS = {"x_offset": 90, "x_step": 0, "y": 100}
+
+
+def check_number(value, name, where, minimum=0):
+    """
+    Checks that a field is a whole number of at least the minimum.
+
+    :param value: The field's value
+    :param name: The field's name, for the error message
+    :param where: Which level or wave the field belongs to, for the error message
+    :param minimum: Smallest allowed value
+    :raises ValueError: If the value is not allowed
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise ValueError(f"{where}: {name} must be a whole number of at least {minimum}, not {value!r}")
+
+
+def check_file(value, name, where):
+    """
+    Checks that a field names an existing file.
+
+    :raises ValueError: If it does not
+    """
+    if not isinstance(value, str) or not os.path.isfile(value):
+        raise ValueError(f"{where}: {name} {value!r} is not a file")
+
+
+def compile_timeline(waves, where):
+    """
+    Validates the waves of a level and turns them into one spawn timeline.
+
+    Waves follow each other. A wave spawns count aliens, interval milliseconds apart, the first one delay
+    milliseconds after the previous wave's last alien (or after the level starts). Alien i of a wave spawns at
+    (boss x + x_offset + i * x_step, y).
+
+    :param waves: List of wave dictionaries
+    :param where: Which level the waves belong to, for error messages
+    :return: Tuple of (milliseconds since the timeline started, x offset from the boss, y), sorted by time
+    :raises ValueError: If a wave is not valid
+    """
+    if not isinstance(waves, list) or not waves:
+        raise ValueError(f"{where}: waves must be a non-empty list")
+
+    timeline = []
+    time = 0
+    for number, wave in enumerate(waves, 1):
+        wave_where = f"{where}, wave {number}"
+        if not isinstance(wave, dict):
+            raise ValueError(f"{wave_where}: must be an object")
+        unknown = set(wave) - {"count", "interval", "delay"} - set(WAVE_DEFAULTS)
+        if unknown:
+            raise ValueError(f"{wave_where}: unknown fields {sorted(unknown)}")
+        wave = {**WAVE_DEFAULTS, "delay": wave.get("interval"), **wave}
+        check_number(wave.get("count"), "count", wave_where, 1)
+        check_number(wave.get("interval"), "interval", wave_where)
+        check_number(wave["delay"], "delay", wave_where)
+        for name in ("x_offset", "x_step", "y"):
+            check_number(wave[name], name, wave_where, -10000)
+
+        time += wave["delay"]
+        for index in range(wave["count"]):
+            if index:
+                time += wave["interval"]
+            timeline.append((time, wave["x_offset"] + index * wave["x_step"], wave["y"]))
+    return tuple(timeline)
+
+
+def compile_levels(data, path=LEVEL_FILE):
+    """
+    Validates parsed level definitions and compiles them into the keyword arguments of Level.
+
+    :param data: The parsed level file
+    :param path: Path of the level file, for error messages
+    :return: List of dictionaries, one per level, in order
+    :raises ValueError: If the definitions are not valid
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("levels"), list) or not data["levels"]:
+        raise ValueError(f"{path}: must be an object with a non-empty list of levels")
+    respawn_interval = data.get("respawn_interval", 13000)
+    check_number(respawn_interval, "respawn_interval", path)
+
+    compiled = []
+    required = {"level", "boss_health", "boss_shoot_chance", "background", "music", "waves"}
+    for index, level in enumerate(data["levels"]):
+        where = f"{path}: level {index + 1}"
+        if not isinstance(level, dict):
+            raise ValueError(f"{where}: must be an object")
+        missing = required - set(level)
+        if missing:
+            raise ValueError(f"{where}: missing fields {sorted(missing)}")
+        unknown = set(level) - required - {"respawn_interval", "scroll_speed"}
+        if unknown:
+            raise ValueError(f"{where}: unknown fields {sorted(unknown)}")
+        if level["level"] != index + 1:
+            raise ValueError(f"{where}: levels must be numbered 1, 2, 3... in order, not {level['level']!r}")
+        check_number(level["boss_health"], "boss_health", where, 1)
+        check_number(level["boss_shoot_chance"], "boss_shoot_chance", where)
+        if level["boss_shoot_chance"] > 100:
+            raise ValueError(f"{where}: boss_shoot_chance is a percentage, not {level['boss_shoot_chance']}")
+        check_file(level["background"], "background", where)
+        check_file(level["music"], "music", where)
+        level_respawn = level.get("respawn_interval", respawn_interval)
+        check_number(level_respawn, "respawn_interval", where)
+        scroll_speed = level.get("scroll_speed", 0)
+        check_number(scroll_speed, "scroll_speed", where)
+
+        timeline = compile_timeline(level["waves"], where)
+        compiled.append(
+            {
+                "level_number": level["level"],
+                "boss_health": level["boss_health"],
+                "background_file": level["background"],
+                "music_file": level["music"],
+                "boss_shoot_chance": level["boss_shoot_chance"],
+                "timeline": timeline,
+                # The waves start over respawn_interval after the last alien, with the first alien right away
+                "cycle_ms": timeline[-1][0] + level_respawn - timeline[0][0],
+                "scroll_speed": scroll_speed,
+            }
+        )
+    return compiled
+
+
+def load_level_data(path=LEVEL_FILE, cache_path=CACHE_FILE):
+    """
+    Returns the compiled level definitions. The cache is used while it was compiled from the same level file,
+    otherwise the level file is parsed, validated and compiled, and the cache is written again.
+
+    The cache is stored with marshal, which only handles plain values, so a damaged cache can not run code.
+
+    :param path: Path of the level file
+    :param cache_path: Path of the cache, or None to always compile
+    :return: List of dictionaries with the keyword arguments of Level, one per level
+    :raises ValueError: If the level file is not valid
+    """
+    with open(path, "rb") as file:
+        source = file.read()
+    key = (CACHE_VERSION, marshal.version, zlib.crc32(source))
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as file:
+                cache_key, compiled = marshal.loads(file.read())  # Much faster than marshal.load on the file
+            if cache_key == key:
+                return compiled
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # No cache yet, or an old or damaged one
+
+    try:
+        data = json.loads(source)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path}: {error}") from error
+    compiled = compile_levels(data, path)
+
+    if cache_path is not None:
+        temp_path = cache_path + ".tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(marshal.dumps((key, compiled)))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass  # The game runs without a cache, e.g. from a read-only directory
+    return compiled
@@ -1,4 +1,6 @@
-import pygame
+from assets import assets
+from background import blit_visible, display_format
+from text_cache import text_cache
 
 
 class LevelTransition:
@@ -18,7 +20,7 @@ class LevelTransition:
         self.background = None  # Current level background for transition
         self.new_background = None  # New background to be transitioned into
         self.font = font
-        self.ship_image = pygame.image.load("media/player_ship.png")  # Players ship for animation
+        self.ship_image = assets.image("media/player_ship.png")  # Players ship for animation
         self.ship_y = 465
         self.player_x = None
         self.level_number = None
@@ -29,29 +31,49 @@ class LevelTransition:
         # For transitioning background
         self.background_y = 0
         self.new_background_y = -600
+        self.scroll_speed = 360  # Pixels per second
 
         # For transitioning player ship
         self.transition_phase = "up"
+        self.ship_exit_speed = 600  # Pixels per second
+        self.ship_enter_speed = 300  # Pixels per second
 
-    def update(self, _):
-        """Updates the transition animation by moving the backgrounds and the player's ship."""
-        self.background_y += 6
-        self.new_background_y += 6
-        self.move_ship()
+    def set_backgrounds(self, background, new_background):
+        """
+        Sets the backgrounds to scroll between, in the display's pixel format.
+
+        :param background: Background of the finished level, scrolled out at the bottom
+        :param new_background: Background of the next level, scrolled in from the top
+        """
+        self.background = display_format(background)
+        self.new_background = display_format(new_background)
+
+    def update(self, ms):
+        """
+        Updates the transition animation by moving the backgrounds and the player's ship.
+
+        :param ms: Length of the simulation step in milliseconds
+        """
+        dt = ms / 1000
+        self.background_y += round(self.scroll_speed * dt)
+        self.new_background_y += round(self.scroll_speed * dt)
+        self.move_ship(dt)
 
-    def move_ship(self):
+    def move_ship(self, dt):
         """
         Moves the player's ship during the transition animation.
         First moves upwards out of the screen, then from the bottom into position for the next level.
+
+        :param dt: Length of the simulation step in seconds
         """
         if self.transition_phase == "up":
-            self.ship_y -= 10
+            self.ship_y -= round(self.ship_exit_speed * dt)
             if self.ship_y < -80:
                 self.ship_y = 600
                 self.transition_phase = "down"
 
         elif self.transition_phase == "down":
-            self.ship_y -= 5
+            self.ship_y -= round(self.ship_enter_speed * dt)
             if self.ship_y <= 465:
                 self.ship_y = 465
                 self.transition_phase = "done"
@@ -59,16 +81,15 @@ class LevelTransition:
     def draw(self):
         """
         Draws the transition scene: two backgrounds scrolling and the ship moving.
-        Also displays the new level number.
+        Also displays the new level number. Only the visible part of each background is blitted.
         """
-        self.screen.blit(self.background, (0, self.background_y))
-        self.screen.blit(self.new_background, (0, self.new_background_y))
+        blit_visible(self.screen, self.background, 0, self.background_y)
+        blit_visible(self.screen, self.new_background, 0, self.new_background_y)
         self.screen.blit(self.ship_image, (self.player_x, self.ship_y))
 
-        level_text = self.font.render("LEVEL " + str(self.level_number), True, (255, 255, 255))
+        level_text = text_cache.render(self.font, "LEVEL " + str(self.level_number), True, (255, 255, 255))
         # Draw level number
         self.screen.blit(level_text, (350, 284))
-        pygame.display.flip()
 
     def next_scene(self):
         """
@@ -84,6 +105,9 @@ class LevelTransition:
             self.ship_y = 465  # Reset ship to starting position
             self.transition_phase = "up"
             self.level_number += 1
+            # Let go of the backgrounds, the finished level's one is no longer cached anywhere else
+            self.background = None
+            self.new_background = None
             return self.game_scene  # Switch back to gameplay scene
         else:
             return self
@@ -1,73 +1,138 @@
-from alien import Alien
+from alien_pool import AlienPool
+from alien_swarm import AlienSwarm
+from assets import assets
 from boss import Boss
 
 
+# Steps of 1000/60 ms do not add up to whole milliseconds exactly, spawns due within this margin are not delayed
+TIME_MARGIN_MS = 1e-6
+
+# Aliens alive from which they are moved as a swarm, fewer are moved faster one by one (see benchmarks/swarm.py)
+SWARM_THRESHOLD = 64
+
+
 class Level:
     """
     Represents a game level with aliens and a boss.
 
     Manages alien spawning, boss creation, and controls level-specific properties like music, background, boss health,
-    and alien spawn timing.
+    and alien spawn timing. Aliens spawn from a timeline compiled from the level file (see level_data), so each update
+    only advances a cursor over it.
     """
 
     def __init__(
         self,
         level_number,
-        num_of_aliens,
         boss_health,
-        background,
+        background_file,
         music_file,
         boss_shoot_chance,
-        spawn_interval,
+        timeline,
+        cycle_ms,
+        scroll_speed=0,
     ):
         """
         Initialize the level with required parameters.
 
         :param level_number: The level number (used for tracking progress)
-        :param num_of_aliens: Number of aliens to spawn during the level
         :param boss_health: Health of the boss for this level
-        :param background: Background image for the level
+        :param background_file: Path to the background image for the level, loaded when first needed
         :param music_file: Music file for the level's soundtrack
         :param boss_shoot_chance: Probability that the boss will shoot
-        :param spawn_interval: Time in milliseconds between alien spawns (for this level)
+        :param timeline: Sorted tuple of (milliseconds since the timeline started, x offset from the boss, y),
+                         one per alien spawned
+        :param cycle_ms: Milliseconds after which the timeline starts over, counted from its first spawn
+        :param scroll_speed: Speed in pixels per second at which the background scrolls, 0 for a still background
         """
         self.level_number = level_number
-        self.num_of_aliens = num_of_aliens
+        self.num_of_aliens = len(timeline)
         self.boss_health = boss_health
         self.aliens = []
-        self.background = background
+        self.background_file = background_file
         self.music_file = music_file
         self.shoot_chance = boss_shoot_chance
+        self.scroll_speed = scroll_speed
 
         # Alien spawn control
-        self.spawned_aliens = 0
-        self.spawn_interval = spawn_interval
-        self.time_since_last_spawn = 0
-        self.alien_respawn_interval = 13000
+        self.timeline = timeline
+        self.cycle_ms = cycle_ms
+        self.cursor = 0  # Index of the next spawn in the timeline
+        self.clock = 0  # Milliseconds since the timeline started
+
+        # Aliens are reused, no new aliens are created once the pool is warm
+        self.pool = AlienPool(self.num_of_aliens)
+        self.swarm = AlienSwarm()
+
+    def reset(self):
+        """Resets the alien spawn timing, so a new game plays the level the same way every time."""
+        self.clear_aliens()
+        self.cursor = 0
+        self.clock = 0
+
+    @property
+    def background(self):
+        """The level's background image, loaded and converted on first use (or taken over from a prefetch)."""
+        return assets.image(self.background_file, alpha=False)
+
+    def prefetch(self):
+        """Starts decoding the level's background and reading its music on the asset worker thread."""
+        assets.prefetch(image_paths=[self.background_file], music_paths=[self.music_file])
+
+    def unload(self):
+        """Evicts the level's background and music from the asset cache, once the level is finished."""
+        assets.evict(image_paths=[self.background_file], music_paths=[self.music_file])
 
     def update_aliens(self, boss_x, ms):
         """
-        Update the alien spawn logic based on the time passed and current game state.
-        Spawns new aliens and respawns when all are destroyed.
+        Spawns the aliens that are due, and starts the timeline over once the last alien spawned a while ago.
 
         :param boss_x: The boss's x-coordinate, used to position aliens correctly
         :param ms: Time passed in milliseconds since last update
         """
-        # Add time passed to the spawn timer
-        self.time_since_last_spawn += ms
-
-        # Spawn aliens over time
-        if self.spawned_aliens < self.num_of_aliens:
-            if self.time_since_last_spawn >= self.spawn_interval:
-                alien = Alien(boss_x + 90, 100)
-                self.aliens.append(alien)
-                self.spawned_aliens += 1
-                self.time_since_last_spawn = 0  # Reset timer
-
-        # Spawn more aliens when all are killed and a certain time has passed
-        elif self.spawned_aliens == self.num_of_aliens:
-            if self.time_since_last_spawn >= self.alien_respawn_interval:
-                self.spawned_aliens = 0  # Reset spawned aliens
+        self.clock += ms
+        timeline = self.timeline
+
+        # Spawn more aliens when a certain time has passed since the last one
+        if self.cursor == len(timeline):
+            if self.clock + TIME_MARGIN_MS < timeline[0][0] + self.cycle_ms:
+                return
+            self.clock -= self.cycle_ms
+            self.cursor = 0
+
+        while self.cursor < len(timeline) and timeline[self.cursor][0] <= self.clock + TIME_MARGIN_MS:
+            _, x_offset, y = timeline[self.cursor]
+            self.aliens.append(self.pool.acquire(boss_x + x_offset, y))
+            self.cursor += 1
+
+    def move_aliens(self, dt):
+        """
+        Moves every alien and its laser, as a swarm when many aliens are alive.
+
+        :param dt: Length of the simulation step in seconds
+        """
+        aliens = self.aliens
+        if len(aliens) >= SWARM_THRESHOLD:
+            self.swarm.move(aliens, self.pool.spawns, dt)
+        else:
+            for alien in aliens:
+                alien.move(dt)
+
+    def remove_aliens(self, indices):
+        """
+        Removes killed aliens and returns them to the pool.
+
+        :param indices: Set of indices into the alien list of the aliens to remove
+        """
+        for index in indices:
+            self.pool.release(self.aliens[index])
+        # Update the list in place, it is shared with the game scene
+        self.aliens[:] = [alien for index, alien in enumerate(self.aliens) if index not in indices]
+
+    def clear_aliens(self):
+        """Removes every alien and returns them to the pool."""
+        for alien in self.aliens:
+            self.pool.release(alien)
+        self.aliens.clear()
 
     def spawn_boss(self):
         """
@@ -1,5 +1,18 @@
+import argparse
+
 import pygame
-from pygame import QUIT
+
+from assets import assets
+from bots import AutopilotBot
+from frame_timer import frame_timer
+from input_state import input_state
+from level_data import load_level_data
+from memory_profiler import memory_profiler
+from music import music
+from renderer import renderer
+from replay import InputRecorder, state_hash
+from sound_bus import sound_bus
+from timestep import STEP_MS, timestep
 
 # Import scenes
 from credits_scene import CreditsScene
@@ -13,117 +26,228 @@ from pause_scene import PauseScene
 from saved_scene import SavedScene
 from win_scene import WinScene
 
-FRAMES_PER_SECOND = 60
-
-# Initialize pygame and mixer for music/sound effects
-pygame.init()
-pygame.mixer.init()
-
-# Data definitions
-clock = pygame.time.Clock()
-screen = pygame.display.set_mode((800, 600))
-
-# Background images for different levels
-background = pygame.image.load("media/background.png")
-background2 = pygame.image.load("media/background2.png")
-background3 = pygame.image.load("media/background3.png")
-background4 = pygame.image.load("media/background4.png")
-background5 = pygame.image.load("media/background5.png")
-
-# Window title
-pygame.display.set_caption("Space Game")
-
-# Main font used in game
-font = pygame.font.Font("media/Minecraft.ttf", 28)
-
-# Music tracks for different levels
-music_1 = "media/level1.ogg"
-music_2 = "media/level2.ogg"
-music_3 = "media/level3.ogg"
-music_4 = "media/level4.ogg"
-music_5 = "media/level5.ogg"
-
-
-# Defining levels with increasing difficulty
-levels = [
-    # Level(level_number, num_of_aliens, boss_health, background_image, music, boss_shoot_chance, spawn_interval)
-    Level(1, 3, 10, background, music_1, 1, 2000),
-    Level(2, 5, 15, background2, music_2, 2, 1700),
-    Level(3, 7, 20, background3, music_3, 5, 1500),
-    Level(4, 10, 25, background4, music_4, 10, 1000),
-    Level(5, 13, 30, background5, music_5, 20, 700),
-]
-
-
-def stop_when():
-    """Returns True if quit is pressed"""
-    for events in pygame.event.get():
-        if events.type == QUIT:
-            return True
-
-
-# Scenes: Different states the game can be in
-# A scene must contain three main methods: update, draw and next_scene
-# These methods are used in the game loop
-menu = MenuScene(screen, background, font)
-game = GameScene(screen, font, levels)
-game_over = GameOverScene(screen, background, font)
-pause = PauseScene(screen, background, font)
-credits = CreditsScene(screen, background, font)
-instructions = InstructionsScene(screen, background, font)
-level_transition = LevelTransition(screen, font)
-win = WinScene(screen, background, font)
-save = SavedScene(screen, background)
-
-
-# Scene connections, in main because otherwise there would be a circular dependency
-# Menu connections
-menu.game_scene = game
-menu.game_over_scene = game_over
-menu.credits_scene = credits
-menu.instructions_scene = instructions
-
-# Game over connections
-game_over.menu_scene = menu
-game_over.game_scene = game
-
-# Game connections
-game.game_over_scene = game_over
-game.pause_scene = pause
-game.level_transition_scene = level_transition
-game.win_scene = win
-
-# Pause connections
-pause.game_scene = game
-pause.menu_scene = menu
-pause.saved_scene = save
-
-# Credits, instructions and level transition connections
-credits.menu_scene = menu
-instructions.menu_scene = menu
-level_transition.game_scene = game
-
-# Win connections
-win.menu_scene = menu
-win.game_scene = game
-
-# Save connections
-save.pause_scene = pause
-
-
-# Initial scene
-scene = menu
-
-# Game Loop
-# The game loop renders the current scene
-# Each scene is responsible for change scenes. This is done in next_scene
-game_running = True
-while game_running:
-    ms = clock.tick(FRAMES_PER_SECOND)
-    scene.update(ms)
-    scene.draw()
-    scene = scene.next_scene()
-    game_running = not stop_when()
-
-# Quit pygame when loop ends
-pygame.quit()
+# Highest render rate, the simulation runs at timestep.SIMULATION_RATE whatever the render rate is
+FRAMES_PER_SECOND = 144
+SCREEN_SIZE = (800, 600)
+
+
+def init_display():
+    """
+    Initializes pygame, the mixer, the sound effects and the window, and preloads the sprites used by enemies.
+
+    :return: The screen surface
+    """
+    # Initialize pygame and mixer for music/sound effects
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    assets.convert_loaded()  # Images loaded before the display mode was set
+
+    # Window title
+    pygame.display.set_caption("Space Game")
+
+    # Sprites used by enemies, loaded once so spawning never touches the disk
+    assets.preload(
+        image_paths=["media/alien_left.png", "media/alien_right.png", "media/alien_laser.png", "media/boss_laser.png"]
+    )
+
+    # Every sound effect, played on a fixed pool of mixer channels
+    sound_bus.init()
+    return screen
+
+
+def load_font():
+    """Returns the main font used in game"""
+    return pygame.font.Font("media/Minecraft.ttf", 28)
+
+
+def create_levels():
+    """
+    Creates the levels defined in the level file (levels.json), with increasing difficulty.
+    Backgrounds and music are loaded by each level when needed.
+
+    :return: A list of Level objects
+    """
+    return [Level(**definition) for definition in load_level_data()]
+
+
+def create_scenes(screen, font, levels):
+    """
+    Creates every scene and connects them.
+    A scene must contain three main methods: update, draw and next_scene. These methods are used in the game loop,
+    which updates the display after draw.
+
+    :param screen: The screen surface all scenes draw on
+    :param font: The main font used in game
+    :param levels: The list of levels played in the game scene
+    :return: The initial scene (the main menu)
+    """
+    # The first level's background is also used by the menus, so it stays cached after the level is finished
+    assets.keep(levels[0].background_file)
+    background = levels[0].background
+
+    # Scenes: Different states the game can be in
+    menu = MenuScene(screen, background, font)
+    game = GameScene(screen, font, levels)
+    game_over = GameOverScene(screen, background, font)
+    pause = PauseScene(screen, background, font)
+    credits = CreditsScene(screen, background, font)
+    instructions = InstructionsScene(screen, background, font)
+    level_transition = LevelTransition(screen, font)
+    win = WinScene(screen, background, font)
+    save = SavedScene(screen, background)
+
+    # Scene connections, in main because otherwise there would be a circular dependency
+    # Menu connections
+    menu.game_scene = game
+    menu.game_over_scene = game_over
+    menu.credits_scene = credits
+    menu.instructions_scene = instructions
+
+    # Game over connections
+    game_over.menu_scene = menu
+    game_over.game_scene = game
+
+    # Game connections
+    game.game_over_scene = game_over
+    game.pause_scene = pause
+    game.level_transition_scene = level_transition
+    game.win_scene = win
+
+    # Pause connections
+    pause.game_scene = game
+    pause.menu_scene = menu
+    pause.saved_scene = save
+
+    # Credits, instructions and level transition connections
+    credits.menu_scene = menu
+    instructions.menu_scene = menu
+    level_transition.game_scene = game
+
+    # Win connections
+    win.menu_scene = menu
+    win.game_scene = game
+
+    # Save connections
+    save.pause_scene = pause
+
+    return menu
+
+
+def handle_events():
+    """
+    Handles the events of this frame and takes the frame's keyboard snapshot. Also passes key presses
+    to the frame timer's debug keys.
+
+    :return: True if quit is pressed
+    """
+    input_state.poll()
+    for key in input_state.pressed:
+        frame_timer.handle_key(key)
+    return input_state.quit
+
+
+def run_game(screen, scene, tick, recorder=None, on_frame=None):
+    """
+    Runs the game loop until the window is closed.
+
+    :param screen: The screen surface
+    :param scene: The initial scene
+    :param tick: Function returning the milliseconds since the previous frame, e.g. Clock.tick with the frame cap
+    :param recorder: Optional InputRecorder, given every frame of the game scene
+    :param on_frame: Optional function called with the next scene at the end of every frame, the loop ends when it
+                     returns True
+    """
+    game = scene.game_scene
+
+    # Game Loop
+    # The game loop advances the current scene in fixed simulation steps and renders it
+    # Each scene is responsible for change scenes. This is done in next_scene
+    # Every phase is timed by the frame timer (toggle with F3, export a trace with F12)
+    while True:
+        start = frame_timer.start()
+        ms = tick()
+        frame_timer.stop("tick", start)
+
+        # Input is read once, at the start of the frame, so this frame already acts on it
+        start = frame_timer.start()
+        if handle_events():
+            break
+        frame_timer.stop("events", start)
+
+        # The simulation runs in fixed steps, however long the frame took
+        start = frame_timer.start()
+        steps = timestep.advance(ms)
+        for _ in range(steps):
+            scene.update(STEP_MS)
+        frame_timer.stop("update", start)
+
+        # Sound effects triggered during the steps are played once per frame, music fades follow real time
+        sound_bus.flush()
+        music.update(ms)
+
+        start = frame_timer.start()
+        scene.draw()
+        renderer.mark(frame_timer.draw_overlay(screen))
+        frame_timer.stop("draw", start)
+
+        # Updates only the changed regions when the scene supports it, otherwise flips the whole display
+        start = frame_timer.start()
+        renderer.present()
+        input_state.presented()
+        frame_timer.stop("flip", start)
+
+        if recorder is not None and scene is game:
+            recorder.record(ms, steps, input_state.keys, state_hash(game))
+
+        start = frame_timer.start()
+        scene = scene.next_scene()
+        frame_timer.stop("next_scene", start)
+
+        frame_timer.end_frame()
+        memory_profiler.end_frame()
+        if on_frame is not None and on_frame(scene):
+            break
+
+
+def main():
+    """
+    Sets up the game and runs the game loop until the window is closed.
+    With --record, the last game played is written to a replay file on exit (replay it with headless.py --replay).
+    With --hit-boxes, the game scene draws the hit boxes on top.
+    With --autopilot, a bot plays instead of the keyboard.
+    """
+    parser = argparse.ArgumentParser(description="Space Game")
+    parser.add_argument("--record", help="write the input of the last game played to this replay file")
+    parser.add_argument("--hit-boxes", action="store_true", help="draw the hit boxes of every ship, laser and shot")
+    parser.add_argument("--autopilot", action="store_true", help="let a bot play (close the window to stop)")
+    args = parser.parse_args()
+
+    screen = init_display()
+    clock = pygame.time.Clock()
+    font = load_font()
+
+    # Initial scene
+    scene = create_scenes(screen, font, create_levels())
+    game = scene.game_scene
+    game.show_hit_boxes = args.hit_boxes
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(args.record)
+        game.recorder = recorder
+    on_frame = None
+    if args.autopilot:
+        bot = AutopilotBot(game)
+        input_state.source = bot
+        on_frame = bot.observe
+
+    run_game(screen, scene, lambda: clock.tick(FRAMES_PER_SECOND), recorder, on_frame)
+
+    # Quit pygame when loop ends
+    pygame.quit()
+    if recorder is not None:
+        recorder.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import linecache
+import tracemalloc
+
+# Allocations of the profiler itself are left out of every snapshot
+IGNORED_FILES = frozenset(
+    (
+        __file__,
+        tracemalloc.__file__,
+        linecache.__file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+    )
+)
+
+
+def growth_report(sites, previous, top, exempt=()):
+    """
+    Compares the allocations of two snapshots.
+
+    :param sites: Dictionary of call site (file name, line) to (bytes, blocks) of the newer snapshot
+    :param previous: The same of the older snapshot
+    :param top: Number of call sites to report
+    :param exempt: File names whose call sites are left out
+    :return: A tuple of (net growth in bytes, list of (call site, bytes grown, blocks grown) of the call sites that
+             grew the most)
+    """
+    growth = 0
+    diffs = []
+    for site in sites.keys() | previous.keys():
+        if site[0] in exempt:
+            continue
+        size, count = sites.get(site, (0, 0))
+        previous_size, previous_count = previous.get(site, (0, 0))
+        growth += size - previous_size
+        if size > previous_size:
+            diffs.append((site, size - previous_size, count - previous_count))
+    diffs.sort(key=lambda diff: diff[1], reverse=True)
+    return growth, diffs[:top]
+
+
+class MemoryProfiler:
+    """
+    Opt-in allocation tracking with tracemalloc. Takes a snapshot whenever a level is loaded (GameScene.load_level)
+    and every few frames, and reports the net growth and the call sites that allocated the most since the previous
+    one. Only the bytes per call site are kept of a snapshot, so the profiler barely adds to the memory it measures.
+
+    The budget is checked between two loads of the same level, once the game came around to it again, so only memory
+    that the level did not give back counts. Bounded caches that hold different things at every load, like the asset
+    cache with the current and next level's music, are exempt from the budget but still reported. The first games
+    fill caches and pools, so a level is held to the budget only after a few loads. Levels over the budget are
+    recorded in over_budget, for soak tests to fail on.
+    While disabled, level_loaded() and end_frame() return immediately, so the hooks can stay in the game.
+
+    Only memory allocated through Python is traced: pixel data of surfaces and sounds, allocated by SDL, is not.
+    """
+
+    def __init__(self):
+        """Initializes the profiler. Tracking is off until started."""
+        self.enabled = False
+        self.frame_interval = 0
+        self.top = 10
+        self.level_budget = None
+        self.ignored = IGNORED_FILES
+        self.exempt = frozenset()
+        self.warmup_loads = 2
+
+        self.frame = 0
+        self.level_number = None  # Level being played since the last level snapshot
+        self.level_sites = None
+        self.level_start_frame = 0
+        self.loads = {}  # Level number to (number of loads, frame, sites) of its last load
+        self.frame_sites = None
+
+        # Reports, dictionaries with the level or frame, the growth in bytes and the top call sites
+        self.levels = []
+        self.intervals = []
+        self.over_budget = []
+
+    def start(
+        self, frame_interval=0, top=10, level_budget=None, ignore=(), exempt=(), warmup_loads=2, traceback_depth=1
+    ):
+        """
+        Starts tracking allocations.
+
+        :param frame_interval: Frames between snapshots, 0 for snapshots at level loads only
+        :param top: Number of call sites in every report
+        :param level_budget: Most bytes memory may grow by between two loads of the same level, None for no limit
+        :param ignore: File names whose allocations are left out, e.g. of the test harness
+        :param exempt: File names whose allocations are not held to the budget, e.g. of bounded caches
+        :param warmup_loads: Loads of a level before its growth is held to the budget
+        :param traceback_depth: Frames stored per allocation, more finds the callers but costs more
+        """
+        self.frame_interval = frame_interval
+        self.top = top
+        self.level_budget = level_budget
+        self.ignored = IGNORED_FILES | frozenset(ignore)
+        self.exempt = frozenset(exempt)
+        self.warmup_loads = warmup_loads
+        self.frame = 0
+        self.level_number = None
+        self.level_sites = None
+        self.loads.clear()
+        self.frame_sites = None
+        self.levels.clear()
+        self.intervals.clear()
+        self.over_budget.clear()
+        tracemalloc.start(traceback_depth)
+        self.enabled = True
+
+    def stop(self):
+        """Stops tracking allocations. The reports are kept."""
+        self.enabled = False
+        self.level_sites = None
+        self.loads.clear()
+        self.frame_sites = None
+        tracemalloc.stop()
+
+    def snapshot(self):
+        """
+        Takes a snapshot of the allocations, without those of the profiler.
+
+        :return: Dictionary of call site (file name, line) to (bytes, blocks) allocated there
+        """
+        # Dropping the ignored files from the statistics is much faster than filtering every trace of the snapshot
+        sites = {}
+        for stat in tracemalloc.take_snapshot().statistics("lineno"):
+            frame = stat.traceback[0]
+            if frame.filename not in self.ignored:
+                sites[frame.filename, frame.lineno] = stat.size, stat.count
+        return sites
+
+    def level_loaded(self, level_number):
+        """
+        Ends the report of the level played until now, checks the budget of the loaded level and starts its report.
+        Called by GameScene.load_level.
+
+        :param level_number: Number of the loaded level
+        """
+        if not self.enabled:
+            return
+        sites = self.snapshot()
+        if self.level_sites is not None:
+            growth, top_sites = growth_report(sites, self.level_sites, self.top)
+            self.levels.append(
+                {
+                    "level": self.level_number,
+                    "frames": self.frame - self.level_start_frame,
+                    "growth": growth,
+                    "sites": top_sites,
+                }
+            )
+
+        loads, frame, previous = self.loads.get(level_number, (0, 0, None))
+        if loads >= self.warmup_loads and self.level_budget is not None:
+            growth, top_sites = growth_report(sites, previous, self.top, self.exempt)
+            if growth > self.level_budget:
+                self.over_budget.append(
+                    {
+                        "level": level_number,
+                        "frames": self.frame - frame,
+                        "growth": growth,
+                        "sites": top_sites,
+                        "since_last_load": True,
+                    }
+                )
+        self.loads[level_number] = loads + 1, self.frame, sites
+
+        self.level_sites = sites
+        self.level_number = level_number
+        self.level_start_frame = self.frame
+
+    def end_frame(self):
+        """Counts a frame and takes the interval snapshot when it is due. Called once at the end of every frame."""
+        if not self.enabled:
+            return
+        self.frame += 1
+        if not self.frame_interval or self.frame % self.frame_interval:
+            return
+        sites = self.snapshot()
+        if self.frame_sites is not None:
+            growth, top_sites = growth_report(sites, self.frame_sites, self.top)
+            self.intervals.append({"frame": self.frame, "growth": growth, "sites": top_sites})
+        self.frame_sites = sites
+
+    def format_report(self, report):
+        """
+        Formats a level, interval or over budget report.
+
+        :param report: A dictionary from levels, intervals or over_budget
+        :return: The report as lines of text
+        """
+        if "since_last_load" in report:
+            title = f"level {report['level']} since its last load ({report['frames']} frames)"
+        elif "level" in report:
+            title = f"level {report['level']} ({report['frames']} frames)"
+        else:
+            title = f"frame {report['frame']}"
+        lines = [f"{title}: {report['growth'] / 1024:+.1f} KiB"]
+        for (file_name, line), size, count in report["sites"]:
+            lines.append(f"    {size / 1024:+9.1f} KiB {count:+7d} blocks  {file_name}:{line}")
+        return lines
+
+    def summary(self):
+        """
+        Summarizes the level reports.
+
+        :return: Lines of text: the mean growth of every level, the total and the levels over the budget
+        """
+        lines = [f"{'level':>5}{'played':>8}{'frames':>8}{'growth KiB':>12}"]
+        for level_number in sorted({report["level"] for report in self.levels}):
+            reports = [report for report in self.levels if report["level"] == level_number]
+            frames = sum(report["frames"] for report in reports) / len(reports)
+            growth = sum(report["growth"] for report in reports) / len(reports)
+            lines.append(f"{level_number:>5}{len(reports):>8}{frames:>8.0f}{growth / 1024:>+12.1f}")
+        total = sum(report["growth"] for report in self.levels)
+        current = tracemalloc.get_traced_memory()[0] if self.enabled else 0
+        lines.append(f"{len(self.levels)} levels, {total / 1024:+.1f} KiB in all, {current / 2**20:.1f} MiB traced")
+        if self.over_budget:
+            lines.append(
+                f"{len(self.over_budget)} levels grew more than {self.level_budget / 1024:.0f} KiB since their last "
+                f"load, the most {max(report['growth'] for report in self.over_budget) / 1024:.1f} KiB"
+            )
+        return lines
+
+
+# The shared memory profiler, started by soak tests
+memory_profiler = MemoryProfiler()
@@ -1,6 +1,11 @@
 import pygame
 from pygame import K_SPACE, K_c, K_i, K_l
 
+from input_state import input_state
+import save_game
+from music import music
+from text_cache import text_cache
+
 # Initialize pygame font
 pygame.font.init()
 
@@ -34,20 +39,17 @@ class MenuScene:
         self.instructions_scene = None
 
         # Music
-        self.music_started = False  # Track if menu music is already playing
         self.music_file = "media/menu_music.ogg"
+        music.preload(self.music_file)
 
     def update(self, _):
         """
-        Updates the state of the menu scene. It handles playing the background music for the menu.
+        Updates the state of the menu scene. It handles playing the background music for the menu,
+        which fades in over the music of the previous scene.
 
         :param _: The number of milliseconds passed since the last frame. This value is not used.
         """
-        if not self.music_started:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(self.music_file)
-            pygame.mixer.music.play(-1)
-            self.music_started = True
+        music.play(self.music_file)
 
     def draw(self):
         """
@@ -58,23 +60,21 @@ class MenuScene:
         self.draw_game_name()
         self.draw_menu_text()
 
-        pygame.display.flip()
-
     def draw_background(self):
         """Draws the background image of the menu."""
         self.screen.blit(self.background, (0, 0))
 
     def draw_game_name(self):
         """Draws game name on screen"""
-        game_name_text = game_font.render("SPACE GAME", True, WHITE)
+        game_name_text = text_cache.render(game_font, "SPACE GAME", True, WHITE)
         self.screen.blit(game_name_text, (70, 100))
 
     def draw_menu_text(self):
         """Draws menu options on screen"""
-        start_text = self.font.render("PRESS SPACE TO START NEW GAME", True, WHITE)
-        load_game_text = self.font.render("PRESS L TO LOAD GAME", True, WHITE)
-        instructions_text = self.font.render("PRESS I TO SEE INSTRUCTIONS", True, WHITE)
-        credits_text = self.font.render("PRESS C TO SEE CREDITS", True, WHITE)
+        start_text = text_cache.render(self.font, "PRESS SPACE TO START NEW GAME", True, WHITE)
+        load_game_text = text_cache.render(self.font, "PRESS L TO LOAD GAME", True, WHITE)
+        instructions_text = text_cache.render(self.font, "PRESS I TO SEE INSTRUCTIONS", True, WHITE)
+        credits_text = text_cache.render(self.font, "PRESS C TO SEE CREDITS", True, WHITE)
 
         # Draw on screen
         self.screen.blit(start_text, (10, 448))
@@ -90,10 +90,9 @@ class MenuScene:
 
         :return: A scene object representing the next scene
         """
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
         if keys[K_SPACE]:
             self.game_scene.reset()
-            self.music_started = False
             self.game_scene.start_level_music()
             return self.game_scene
         elif keys[K_c]:
@@ -102,34 +101,20 @@ class MenuScene:
             return self.instructions_scene
 
         elif keys[K_l]:
-            self.music_started = False
-            # Attempt to load saved game from the file "save_data.txt"
+            # Attempt to load the saved game, a text save of an earlier version is converted
             try:
-                # Open save data file
-                with open("save_data.txt", "r") as file:
-                    # Read players level index and players score
-                    level_index = int(file.readline())
-                    score = int(file.readline())
-
-                    # Set games level and score
-                    self.game_scene.level_index = level_index
-                    self.game_scene.score.displayed_score = score
-                    self.game_scene.score.target_score = score
-
-                    # Load level and level music
-                    self.game_scene.load_level()
-                    self.game_scene.start_level_music()
-                return self.game_scene
+                save_game.load(self.game_scene)
 
             # If there is an error, stay in the menu scene
             except FileNotFoundError:
                 print("Save file not found.")
                 return self
-            except EOFError:
-                print("Save file is empty.")
-                return self
-            except ValueError:
-                print("Error reading save data.")
+            except ValueError as error:
+                print("Error reading save data:", error)
                 return self
+
+            # Continue with the level music
+            self.game_scene.start_level_music()
+            return self.game_scene
         else:
             return self
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+
+import pygame
+
+from assets import assets
+from frame_timer import frame_timer
+
+# Length of the fade out of the old track and the fade in of the new one when the music changes, in milliseconds
+FADE_MS = 600
+
+
+class MusicPlayer:
+    """
+    The one place that plays music. Tracks are streamed from memory (see AssetManager.music), pausing keeps the
+    track loaded and resumes it where it was, and changing track fades the old one out before the new one fades in.
+    pygame has a single music stream, so the two tracks take turns instead of overlapping.
+    The time each track change blocks the frame is recorded in stalls.
+    """
+
+    def __init__(self, fade_ms=FADE_MS, volume=1.0):
+        """
+        Initializes the player with nothing playing.
+
+        :param fade_ms: Length of the fade out and of the fade in, in milliseconds
+        :param volume: Music volume (0 - 1)
+        """
+        self.fade_ms = fade_ms
+        self.volume = volume
+        self.current = None  # Path of the loaded track
+        self.paused = False
+        self.next = None  # Path of the track to play once the current one has faded out
+        self.fade_left = 0  # Milliseconds left of the fade out
+        self.stalls = deque(maxlen=64)  # (path, milliseconds) of the most recent track changes
+
+    def play(self, path):
+        """
+        Plays a track in a loop. Nothing happens if it is already playing, a paused track is resumed.
+        Another playing track is faded out first.
+
+        :param path: Path to the music file
+        """
+        if path == self.current:
+            if self.next is not None:
+                # Changed back before the fade out finished, keep playing
+                self.next = None
+                pygame.mixer.music.set_volume(self.volume)
+            self.resume()
+            return
+        if self.current is None or self.paused or not pygame.mixer.get_init():
+            self.start(path)
+            return
+
+        # Fade out what is playing, update() starts the new track once it is silent
+        if self.next is None:
+            self.fade_left = self.fade_ms
+        self.next = path
+
+    def preload(self, path):
+        """
+        Reads a track into memory on the asset worker thread, so starting it later does not touch the disk.
+
+        :param path: Path to the music file
+        """
+        assets.prefetch(music_paths=[path])
+
+    def pause(self):
+        """Pauses the current track, keeping its position."""
+        if self.current is not None and not self.paused:
+            pygame.mixer.music.pause()
+            self.paused = True
+
+    def resume(self):
+        """Resumes a paused track where it was paused."""
+        if self.paused:
+            pygame.mixer.music.unpause()
+            self.paused = False
+
+    def stop(self):
+        """Stops the music right away, including any fade in progress."""
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.current = None
+        self.paused = False
+        self.next = None
+
+    def update(self, ms):
+        """
+        Advances a fade out and starts the next track when it is done. Called once every frame by the game loop.
+        A fade out is held while the music is paused, and continues when it is resumed.
+
+        :param ms: Milliseconds passed since the last frame
+        """
+        if self.next is None or self.paused:
+            return
+        self.fade_left -= ms
+        if self.fade_left <= 0:
+            self.start(self.next)
+        else:
+            pygame.mixer.music.set_volume(self.volume * self.fade_left / self.fade_ms)
+
+    def start(self, path):
+        """
+        Loads a track from memory and fades it in, recording how long this blocked the frame.
+
+        :param path: Path to the music file
+        """
+        self.current = path
+        self.paused = False
+        self.next = None
+        if not pygame.mixer.get_init():
+            return
+
+        timer_start = frame_timer.start()
+        start = time.perf_counter()
+        pygame.mixer.music.stop()
+        pygame.mixer.music.load(assets.music(path), path.rsplit(".", 1)[-1])
+        pygame.mixer.music.set_volume(self.volume)
+        pygame.mixer.music.play(-1, fade_ms=self.fade_ms)
+        self.stalls.append((path, (time.perf_counter() - start) * 1000))
+        frame_timer.stop("music", timer_start)
+
+    def stats(self):
+        """
+        Returns the stall times of the recorded track changes.
+
+        :return: A dictionary with the number of track changes and the mean and worst stall in milliseconds
+        """
+        times = [ms for _, ms in self.stalls]
+        return {
+            "changes": len(times),
+            "mean_stall_ms": sum(times) / len(times) if times else 0.0,
+            "max_stall_ms": max(times, default=0.0),
+        }
+
+
+# The shared music player used by every scene
+music = MusicPlayer()
@@ -1,6 +1,10 @@
-import pygame
 from pygame import K_r, K_m, K_s
 
+from input_state import input_state
+import save_game
+from music import music
+from text_cache import text_cache
+
 WHITE = (255, 255, 255)
 
 
@@ -12,7 +16,7 @@ class PauseScene:
 
     def __init__(self, screen, background, font):
         """
-        Initializes pause scene with attributes such as screen, background and music
+        Initializes pause scene with attributes such as screen and background
         :param screen: The screen where the options will be drawn
         :param background: The background image
         :param font: The main font used
@@ -20,8 +24,6 @@ class PauseScene:
         self.screen = screen
         self.background = background
         self.font = font
-        self.music_file = "media/menu_music.ogg"
-        self.music_started = False
 
         # Scene connections
         self.game_scene = None
@@ -29,12 +31,8 @@ class PauseScene:
         self.saved_scene = None
 
     def update(self, _):
-        """Updates the pause scene music"""
-        if not self.music_started:
-            pygame.mixer.music.stop()  # Stop previous music
-            pygame.mixer.music.load(self.music_file)
-            pygame.mixer.music.play(-1)
-            self.music_started = True
+        """Pauses the level music while the game is paused, it continues from the same place when resumed"""
+        music.pause()
 
     def draw(self):
         """Draws all components on screen"""
@@ -44,17 +42,15 @@ class PauseScene:
         # Draw menu options
         self.draw_menu_text()
 
-        pygame.display.flip()
-
     def draw_background(self):
         """Draws the background"""
         self.screen.blit(self.background, (0, 0))
 
     def draw_menu_text(self):
         """Draws the pause menu options"""
-        return_text = self.font.render("PRESS R TO RETURN TO GAME", True, WHITE)
-        menu_text = self.font.render("PRESS M TO RETURN TO MAIN MENU", True, WHITE)
-        save_text = self.font.render("PRESS S TO SAVE GAME", True, WHITE)
+        return_text = text_cache.render(self.font, "PRESS R TO RETURN TO GAME", True, WHITE)
+        menu_text = text_cache.render(self.font, "PRESS M TO RETURN TO MAIN MENU", True, WHITE)
+        save_text = text_cache.render(self.font, "PRESS S TO SAVE GAME", True, WHITE)
         # Draw on screen
         self.screen.blit(return_text, (70, 100))
         self.screen.blit(menu_text, (70, 138))
@@ -67,25 +63,17 @@ class PauseScene:
 
         :return: The next scene (menu, game or save)
         """
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
         if keys[K_r]:
-            self.game_scene.start_level_music()
-            self.music_started = False
+            music.resume()
             return self.game_scene
 
         elif keys[K_m]:
-            self.music_started = False
             return self.menu_scene
 
         elif keys[K_s]:
-            self.music_started = False
-            # Values to be saved
-            current_level = str(self.game_scene.level_index)
-            score = str(self.game_scene.score.target_score)
-            # Save
-            with open("save_data.txt", "w") as file:
-                file.write(current_level + "\n")
-                file.write(score)
+            # Save the whole game, it continues exactly from here when loaded
+            save_game.save(self.game_scene)
             return self.saved_scene
         else:
             return self
@@ -1,36 +1,42 @@
 import pygame
-from pygame import K_LEFT, K_RIGHT
+from pygame import K_LEFT, K_RIGHT, K_UP
 
+from assets import assets
 from health_bar import HealthBar
-from lasers import PlayerLaser
+from projectiles import ProjectilePool
+from weapon import Weapon
 
 
 class Player:
     """
     Represents the player in the game with different attributes: image, rectangle,
-    speed, health points, health bar and laser
+    speed, health points, health bar, weapon and the projectiles it fired.
+    An instance stores only its own state in __slots__, the image and speed are shared at class level.
     """
 
+    __slots__ = ("rect", "health_points", "health_bar", "weapon", "projectiles")
+
+    speed = 600  # Pixels per second
+    image = None  # Loaded by the first player
+
     def __init__(self, x, y):
         """
-        Initialize the player with a starting position, health, speed, and health bar and laser.
+        Initialize the player with a starting position, health, speed, health bar and weapon.
 
         :param x: The starting X position of the player.
         :param y: The starting Y position of the player.
         """
-        self.image = pygame.image.load("media/player_ship.png")
+        if Player.image is None:
+            Player.image = assets.image("media/player_ship.png")
         self.rect = pygame.Rect(x, y, 80, 60)  # Adjusted hit box
-        self.rect.x = x
-        self.rect.y = y
-        self.speed = 5
         self.health_points = 10
-        self.show_hit_box = False
 
         # Health Bar
         self.health_bar = HealthBar(10, 583, self.health_points, 20)  # Bottom left of screen
 
-        # Laser
-        self.laser = PlayerLaser()
+        # Weapon, every projectile it fires is kept in the pool
+        self.weapon = Weapon()
+        self.projectiles = ProjectilePool()
 
     def move(self, x_dist):
         """
@@ -38,47 +44,40 @@ class Player:
 
         :param x_dist: The distance to move the player along the X-axis.
         """
-        self.rect.move_ip(x_dist, 0)
         # Ensure player stays within screen
         self.rect.x = max(0, min(self.rect.x + x_dist, 800 - 80))
 
-    def update(self):
+    def update(self, dt):
         """
-        Update the player's state: health bar and laser position.
+        Update the player's state: health bar, weapon reload and projectile positions.
+
+        :param dt: Length of the simulation step in seconds.
         """
-        self.health_bar.update(self.health_points)
-        # Laser
-        self.laser.move()
+        self.health_bar.update(self.health_points, dt)
+        self.weapon.update(dt)
+        self.projectiles.move(dt)
 
-    def check_input(self, pressed_keys):
+    def check_input(self, pressed_keys, dt):
         """
         Check if movement keys are pressed and move the player accordingly.
-        Also, check if the player is firing a laser.
+        Also, check if the player is firing.
 
         :param pressed_keys: A dictionary of currently pressed keys.
+        :param dt: Length of the simulation step in seconds.
         """
         if pressed_keys[K_LEFT]:
-            self.move(-self.speed)
+            self.move(-round(self.speed * dt))
         if pressed_keys[K_RIGHT]:
-            self.move(self.speed)
+            self.move(round(self.speed * dt))
 
-        # Check if player is firing laser
-        self.laser.check_input(self.rect.x)
+        # Check if player is firing
+        if pressed_keys[K_UP]:
+            self.weapon.fire(self.projectiles, self.rect.x)
 
-    def draw(self, screen):
+    def sprite(self):
         """
-        Draw the player, health bar and laser on the screen.
+        Returns the player's image and position. The health bar and projectiles are drawn by the game scene.
 
-        :param screen: The Pygame screen object where everything is drawn.
+        :return: An (image, position) pair for a SpriteBatch
         """
-        screen.blit(self.image, (self.rect.x, self.rect.y - 10))
-
-        # Draw the players hit box for debugging
-        if self.show_hit_box:
-            pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
-
-        # Health bar
-        self.health_bar.draw(screen)
-
-        # Laser
-        self.laser.draw(screen)
+        return self.image, (self.rect.x, self.rect.y - 10)
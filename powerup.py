@@ -1,39 +1,55 @@
-import random
-
 import pygame
 
+from assets import assets
+from game_random import rng
+from sound_bus import sound_bus
+
 
 class PowerUp:
-    """This class represents a power-up that heals the player and the player can collect"""
+    """
+    This class represents a power-up that heals the player and the player can collect.
+    An instance stores only its own state in __slots__, the image and speeds are shared at class level.
+    """
+
+    __slots__ = ("rect", "state")
+
+    speed = 120  # Pixels per second
+    spawn_chance = 995  # O.5 % spawn chance per simulation step
+    image = None  # Loaded by the first power-up
 
     def __init__(self):
         """Initializes power-up"""
-        self.image = pygame.image.load("media/powerup.png")
+        if PowerUp.image is None:
+            PowerUp.image = assets.image("media/powerup.png")
         self.rect = self.image.get_rect()
-        self.speed = 2
         self.state = "ready"  # 'ready' = not active, 'spawned' = falling on screen
-        self.spawn_chance = 995  # O.5 % spawn chance per frame
-
-        # Sound
-        self.power_sound = pygame.mixer.Sound("media/power_up_sound.wav")
 
     def spawn(self):
         """Attempts to spawn the power-up randomly if it is currently ready (not already spawned)."""
         if self.state == "ready":
-            if random.randint(1, 1000) > self.spawn_chance:
-                self.rect.x = random.randint(0, 755)  # Random horizontal position
+            if rng.randint(1, 1000) > self.spawn_chance:
+                self.rect.x = rng.randint(0, 755)  # Random horizontal position
                 self.rect.y = -45  # Start above the screen
                 self.state = "spawned"
 
-    def draw(self, screen):
-        """Draws the power-up on screen if it has spawned."""
-        if self.state == "spawned":
-            screen.blit(self.image, (self.rect.x, self.rect.y))
+    def sprite(self):
+        """
+        Returns the power-up's image and position if it has spawned.
+
+        :return: An (image, rect) pair for a SpriteBatch, or None
+        """
+        if self.state != "spawned":
+            return None
+        return self.image, self.rect
 
-    def move(self):
-        """Moves the power-up downward. Resets it if it moves off the bottom of the screen."""
+    def move(self, dt):
+        """
+        Moves the power-up downward. Resets it if it moves off the bottom of the screen.
+
+        :param dt: Length of the simulation step in seconds
+        """
         if self.state == "spawned":
-            self.rect.y += self.speed
+            self.rect.y += round(self.speed * dt)
         if self.rect.y >= 600:
             self.state = "ready"  # Reset when off-screen
 
@@ -47,7 +63,7 @@ class PowerUp:
         if self.state == "spawned":
             if pygame.Rect.colliderect(self.rect, other.rect):
                 self.state = "ready"
-                self.power_sound.play()
+                sound_bus.trigger("powerup")
                 return True  # Power-up is collected
         else:
             return False
@@ -0,0 +1,161 @@
+import numpy as np
+
+from assets import assets
+
+# Movement rules of the player's projectiles (speeds in pixels per second)
+PROJECTILE_SPEED = 540
+TOP_LIMIT = -50  # Projectiles at or above this y have left the screen
+SCREEN_WIDTH = 800
+
+
+class ProjectilePool:
+    """
+    Stores every projectile fired by the player in NumPy arrays. The live projectiles are packed at the front of the
+    arrays, so moving, culling and hit testing run as array operations over all of them at once, and firing or
+    removing projectiles never allocates objects.
+    """
+
+    def __init__(self, capacity=512):
+        """
+        Initializes an empty pool.
+
+        :param capacity: Most projectiles alive at the same time, further shots are dropped
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.vx = np.zeros(capacity, dtype=np.int32)  # Sideways speed in pixels per second, for spread shots
+        self.previous_x = np.zeros(capacity, dtype=np.int32)  # Positions at the previous simulation step
+        self.previous_y = np.zeros(capacity, dtype=np.int32)
+
+        self.image = assets.image("media/player_laser.png")
+        self.width, self.height = self.image.get_size()
+
+        # Counters
+        self.fired = 0
+        self.dropped = 0  # Shots not fired because the pool was full
+
+    def spawn(self, x, y, vx=0):
+        """
+        Fires a projectile.
+
+        :param x: The x-coordinate of the projectile's top left corner
+        :param y: The y-coordinate of the projectile's top left corner
+        :param vx: Sideways speed in pixels per second
+        :return: True if fired, False if the pool is full
+        """
+        n = self.count
+        if n == self.capacity:
+            self.dropped += 1
+            return False
+        self.x[n] = self.previous_x[n] = x
+        self.y[n] = self.previous_y[n] = y
+        self.vx[n] = vx
+        self.count = n + 1
+        self.fired += 1
+        return True
+
+    def remember(self):
+        """Stores the current positions, so frames drawn before the next step can be interpolated."""
+        n = self.count
+        self.previous_x[:n] = self.x[:n]
+        self.previous_y[:n] = self.y[:n]
+
+    def move(self, dt):
+        """
+        Moves every projectile up (and sideways) and removes those that left the screen.
+
+        :param dt: Length of the simulation step in seconds
+        """
+        n = self.count
+        if not n:
+            return
+        y = self.y[:n]
+        y -= round(PROJECTILE_SPEED * dt)
+        x = self.x[:n]
+        vx = self.vx[:n]
+        if vx.any():
+            x += np.rint(vx * dt).astype(np.int32)
+
+        gone = (y <= TOP_LIMIT) | (x + self.width <= 0) | (x >= SCREEN_WIDTH)
+        if gone.any():
+            self.compact(~gone)
+
+    def compact(self, keep):
+        """
+        Packs the projectiles to keep at the front of the arrays, in their order.
+
+        :param keep: Boolean array over the live projectiles, True for the ones to keep
+        """
+        n = self.count
+        kept = int(keep.sum())
+        for array in (self.x, self.y, self.vx, self.previous_x, self.previous_y):
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def remove(self, indices):
+        """
+        Removes projectiles, e.g. those that hit something.
+
+        :param indices: Indices of the projectiles to remove
+        """
+        keep = np.ones(self.count, dtype=bool)
+        keep[list(indices)] = False
+        self.compact(keep)
+
+    def clear(self):
+        """Removes every projectile."""
+        self.count = 0
+
+    def hits(self, rect):
+        """
+        Finds the projectiles overlapping a rectangle, with the same rules as pygame.Rect.colliderect.
+
+        :param rect: The rectangle to test (e.g. the boss's rect)
+        :return: Array of indices of the colliding projectiles
+        """
+        n = self.count
+        if not n:
+            return np.empty(0, dtype=np.intp)
+        x = self.x[:n]
+        y = self.y[:n]
+        hits = (x < rect.right) & (x + self.width > rect.left) & (y < rect.bottom) & (y + self.height > rect.top)
+        return np.flatnonzero(hits)
+
+    def hits_many(self, rects):
+        """
+        Finds every overlapping pair of a projectile and one of several rectangles, testing all pairs at once.
+
+        :param rects: The rectangles to test (e.g. the aliens' rects)
+        :return: List of (projectile_index, rect_index) pairs, sorted by projectile and then rectangle
+        """
+        n = self.count
+        if not n or not rects:
+            return []
+        bounds = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in rects], dtype=np.int32)
+        x = self.x[:n, None]
+        y = self.y[:n, None]
+        hits = (
+            (x < bounds[:, 2]) & (x + self.width > bounds[:, 0]) & (y < bounds[:, 3]) & (y + self.height > bounds[:, 1])
+        )
+        projectiles, targets = np.nonzero(hits)
+        return list(zip(projectiles.tolist(), targets.tolist()))
+
+    def sprites(self, alpha=1.0):
+        """
+        Returns the image and position of every projectile.
+
+        :param alpha: How far between the previous (0) and the current (1) step to draw the projectiles
+        :return: List of (image, position) pairs for a SpriteBatch
+        """
+        n = self.count
+        if not n:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        if alpha < 1:
+            x = self.previous_x[:n] + np.rint((x - self.previous_x[:n]) * alpha).astype(np.int32)
+            y = self.previous_y[:n] + np.rint((y - self.previous_y[:n]) * alpha).astype(np.int32)
+        image = self.image
+        return [(image, position) for position in zip(x.tolist(), y.tolist())]
@@ -0,0 +1,133 @@
+import pygame
+
+# pygame-ce's Surface.fblits skips building the covered rectangles, pygame has only Surface.blits
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+class DirtyRenderer:
+    """
+    Dirty-rectangle rendering for the display. A scene that draws through the renderer only restores the background
+    under what was drawn in the previous frame, and only the old and new rectangles of every drawn object are sent
+    to the display. When the changed area is large, or a scene drew without the renderer, the whole display is
+    flipped instead.
+
+    Entities are drawn to the renderer as if it was the screen surface: it supports blit, blits and fill and records the
+    rectangle each call covers.
+    """
+
+    def __init__(self, max_dirty_fraction=0.5):
+        """
+        Initializes the renderer. It uses the display surface once a frame begins.
+
+        :param max_dirty_fraction: Part of the screen above which a full flip is cheaper than updating rectangles
+        """
+        self.enabled = True
+        self.max_dirty_fraction = max_dirty_fraction
+        self.surface = None
+        self.background = None
+
+        self.drawn = []  # Rectangles drawn this frame
+        self.previous = []  # Rectangles drawn last frame
+        self.active = False  # True when the current frame is drawn through the renderer
+        self.full_redraw = True  # True when the screen content can't be trusted
+
+        # Statistics
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def begin_frame(self, background):
+        """
+        Starts a frame: restores the background under everything drawn in the previous frame,
+        or draws the whole background if the screen was redrawn by something else.
+
+        :param background: The scene's background image
+        """
+        self.surface = pygame.display.get_surface()
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+
+        if self.full_redraw or not self.enabled:
+            self.surface.blit(background, (0, 0))
+        else:
+            self.surface.blits([(background, rect, rect) for rect in self.previous], doreturn=False)
+
+        self.drawn = []
+        self.active = True
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Draws an image like Surface.blit and records the covered rectangle.
+
+        :return: The covered rectangle
+        """
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.drawn.append(rect)
+        return rect
+
+    def blits(self, sequence):
+        """
+        Draws many images like Surface.blits and records the covered rectangles. When the renderer is off the
+        rectangles are not needed, so they are not built (with Surface.fblits where pygame-ce provides it).
+
+        :param sequence: List of (image, position) pairs, drawn in order
+        """
+        if self.enabled:
+            self.drawn += self.surface.blits(sequence)
+        elif HAS_FBLITS:
+            self.surface.fblits(sequence)
+        else:
+            self.surface.blits(sequence, doreturn=False)
+
+    def fill(self, color, rect=None, special_flags=0):
+        """
+        Fills a rectangle like Surface.fill and records it.
+
+        :return: The filled rectangle
+        """
+        rect = self.surface.fill(color, rect, special_flags)
+        self.drawn.append(rect)
+        return rect
+
+    def mark(self, rect):
+        """
+        Records a rectangle that was drawn directly on the display surface.
+
+        :param rect: The rectangle, ignored if None
+        """
+        if rect is not None and self.active:
+            self.drawn.append(rect)
+
+    def present(self):
+        """
+        Shows the frame: updates only the changed rectangles when the frame was drawn through the renderer and
+        the changed area is small, otherwise flips the whole display.
+        """
+        # A frame not drawn through the renderer overwrote the screen, so the next one must be drawn in full
+        full_redraw = not self.active
+
+        dirty_rects = None
+        if self.active and self.enabled:
+            width, height = self.surface.get_size()
+            drawn_area = sum(rect.width * rect.height for rect in self.drawn)
+            if drawn_area > self.max_dirty_fraction * width * height:
+                # Restoring this many regions next frame would cost more than drawing the whole background
+                full_redraw = True
+            elif not self.full_redraw:
+                dirty_rects = self.previous + self.drawn
+
+        if dirty_rects is None:
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            pygame.display.update(dirty_rects)
+            self.partial_updates += 1
+
+        self.full_redraw = full_redraw
+        self.previous = self.drawn if self.active else []
+        self.drawn = []
+        self.active = False
+
+
+# The shared renderer used by the game loop and the game scene
+renderer = DirtyRenderer()
@@ -0,0 +1,163 @@
+import struct
+import zlib
+from array import array
+
+from pygame import K_ESCAPE, K_LEFT, K_RIGHT, K_UP
+
+# Replay file: a header, the save_game snapshot the game started from, then the zlib-compressed frames
+MAGIC = b"SGRP"
+VERSION = 4
+HEADER = struct.Struct("<4sBII")  # magic, version, snapshot length, number of frames
+FRAME = struct.Struct("<fBHI")  # frame milliseconds, simulation steps, held keys, state hash
+
+# The keys the game scene reads, stored as one bit each
+TRACKED_KEYS = (K_LEFT, K_RIGHT, K_UP, K_ESCAPE)
+
+
+def key_mask(keys):
+    """
+    Packs the held tracked keys into a bit mask.
+
+    :param keys: The keyboard state, anything that can be indexed with pygame key constants
+    :return: The bit mask
+    """
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def state_hash(game):
+    """
+    Hashes everything in the game scene that the simulation changes, to find the first frame where a replay
+    diverges from the recorded game.
+
+    :param game: The GameScene
+    :return: A 32-bit hash
+    """
+    player = game.player
+    boss = game.boss
+    powerup = game.powerup
+    values = [
+        game.level_index,
+        player.rect.x,
+        player.health_points,
+        player.health_bar.bar_width,
+        player.projectiles.count,
+        boss.rect.x,
+        boss.health_points,
+        boss.health_bar.bar_width,
+        boss.laser.rect.x,
+        boss.laser.rect.y,
+        powerup.rect.x,
+        powerup.rect.y,
+        game.score.target_score,
+        game.score.displayed_score,
+    ]
+    for alien in game.level_aliens:
+        values += (alien.rect.x, alien.rect.y, alien.direction, alien.laser.rect.x, alien.laser.rect.y)
+    projectiles = player.projectiles
+    data = array("q", [int(value) for value in values]).tobytes()
+    data += projectiles.x[: projectiles.count].tobytes() + projectiles.y[: projectiles.count].tobytes()
+    return zlib.crc32(data)
+
+
+class InputRecorder:
+    """
+    Records a game: a snapshot of the game when it started, then for every rendered frame of the game scene its
+    length, the number of simulation steps, the held keys and the state hash after the steps.
+    Only the latest game is kept.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the recorder.
+
+        :param path: Path of the replay file written by save()
+        """
+        self.path = path
+        self.snapshot = b""
+        self.frames = bytearray()
+        self.frame_count = 0
+
+    def start(self, snapshot):
+        """
+        Starts recording a new game, dropping the previous one.
+
+        :param snapshot: The game's starting state, made by save_game.dumps
+        """
+        self.snapshot = snapshot
+        self.frames.clear()
+        self.frame_count = 0
+
+    def record(self, ms, steps, keys, frame_hash):
+        """
+        Records one rendered frame of the game scene.
+
+        :param ms: Milliseconds the frame took
+        :param steps: Number of simulation steps run in the frame
+        :param keys: The keyboard state read by the game scene in the frame
+        :param frame_hash: state_hash of the game scene after the steps
+        """
+        self.frames += FRAME.pack(ms, steps, key_mask(keys), frame_hash)
+        self.frame_count += 1
+
+    def save(self):
+        """Writes the recorded game to the replay file."""
+        header = HEADER.pack(MAGIC, VERSION, len(self.snapshot), self.frame_count)
+        with open(self.path, "wb") as file:
+            file.write(header)
+            file.write(self.snapshot)
+            file.write(zlib.compress(bytes(self.frames)))
+
+
+def load_replay(path):
+    """
+    Reads a replay file.
+
+    :param path: Path of the replay file
+    :return: A tuple of (snapshot, frames), each frame a tuple of (ms, steps, key mask, state hash)
+    :raises ValueError: If the file is not a replay file of this version, or is truncated
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    try:
+        magic, version, snapshot_length, frame_count = HEADER.unpack_from(data)
+    except struct.error as error:
+        raise ValueError(f"{path} is truncated: {error}") from error
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay file")
+
+    snapshot_end = HEADER.size + snapshot_length
+    snapshot = data[HEADER.size : snapshot_end]
+    try:
+        body = zlib.decompress(data[snapshot_end:])
+    except zlib.error as error:
+        raise ValueError(f"{path} is truncated: {error}") from error
+    frames = list(FRAME.iter_unpack(body))
+    if len(frames) != frame_count:
+        raise ValueError(f"{path} is truncated: {len(frames)} of {frame_count} frames")
+    return snapshot, frames
+
+
+class ReplayKeys:
+    """Key source for the game scene that returns the keys held in the replayed frame."""
+
+    def __init__(self):
+        """Initializes the key source with no keys held."""
+        self.mask = 0
+
+    def __call__(self):
+        """
+        Returns the keyboard state for the current frame.
+
+        :return: An object that can be indexed with pygame key constants, like pygame.key.get_pressed()
+        """
+        return self
+
+    def __getitem__(self, key):
+        """Returns True if the key is held in the current frame."""
+        if key not in TRACKED_KEYS:
+            return False
+        return bool(self.mask & (1 << TRACKED_KEYS.index(key)))
@@ -0,0 +1,332 @@
+import os
+import random
+import struct
+import zlib
+
+from player import Player
+from powerup import PowerUp
+from weapon import UPGRADES, Weapon
+
+# Save file, and the two-line text save of earlier versions (level index, score), migrated when loaded
+SAVE_FILE = "save_data.sav"
+LEGACY_SAVE_FILE = "save_data.txt"
+
+# Snapshot: a header, then the game state. Bump VERSION when the layout changes, older versions can still be read.
+# Version 1 had a single player laser, in version 2 the player has a weapon and a projectile pool.
+# Up to version 2 a level stored its spawned aliens and the time since the last spawn, in version 3 its position
+# on the spawn timeline.
+MAGIC = b"SGSV"
+VERSION = 3
+HEADER = struct.Struct("<4sHI")  # magic, version, CRC32 of the state
+GAME = struct.Struct("<HqiiH")  # level index, seed, score, displayed score, number of levels
+SHIP = struct.Struct("<iiiiBii")  # x, direction, health, health bar width, laser fired, laser x, laser y
+WEAPON = struct.Struct("<BdH")  # weapon, milliseconds until reloaded, number of projectiles
+PROJECTILE = struct.Struct("<iii")  # x, y, sideways speed
+POWERUP = struct.Struct("<Bii")  # spawned, x, y
+LEVEL = struct.Struct("<Hd")  # next spawn on the timeline, milliseconds since the timeline started
+ALIEN_COUNT = struct.Struct("<H")
+ALIEN = struct.Struct("<iibBii")  # x, y, direction, laser fired, laser x, laser y
+RNG = struct.Struct("<i625I?d")  # random.Random state: version, Mersenne Twister state, gauss_next
+
+
+def pack_ship(ship, laser=None):
+    """Packs the player or the boss, with the boss's laser."""
+    fired = laser is not None and laser.state == "fire"
+    laser_x, laser_y = (laser.rect.x, laser.rect.y) if laser is not None else (0, 0)
+    direction = getattr(ship, "direction", 0)
+    return SHIP.pack(ship.rect.x, direction, ship.health_points, ship.health_bar.bar_width, fired, laser_x, laser_y)
+
+
+def unpack_ship(data, offset):
+    """
+    Reads the player or the boss.
+
+    :return: A tuple of the offset after the ship, the ship as (x, direction, health, health bar width) and its
+             laser as (fired, x, y)
+    """
+    x, direction, health, bar_width, fired, laser_x, laser_y = SHIP.unpack_from(data, offset)
+    return offset + SHIP.size, (x, direction, health, bar_width), (fired, laser_x, laser_y)
+
+
+def restore_ship(ship, state):
+    """Restores the player or the boss from what unpack_ship read."""
+    x, direction, health, bar_width = state
+    ship.rect.x = x
+    if direction:
+        ship.direction = direction
+    ship.health_points = health
+    ship.health_bar.bar_width = bar_width
+    ship.health_bar.health_rect.width = bar_width
+
+
+def pack_weapon(player):
+    """Packs the player's weapon and projectiles."""
+    projectiles = player.projectiles
+    n = projectiles.count
+    parts = [WEAPON.pack(UPGRADES.index(player.weapon.name), player.weapon.reload_left, n)]
+    for values in zip(projectiles.x[:n].tolist(), projectiles.y[:n].tolist(), projectiles.vx[:n].tolist()):
+        parts.append(PROJECTILE.pack(*values))
+    return b"".join(parts)
+
+
+def unpack_weapon(data, offset):
+    """
+    Reads the player's weapon and projectiles.
+
+    :return: A tuple of the offset after the projectiles and the weapon as (name, milliseconds until reloaded,
+             list of (x, y, sideways speed) of the projectiles)
+    """
+    weapon, reload_left, count = WEAPON.unpack_from(data, offset)
+    offset += WEAPON.size
+    if weapon >= len(UPGRADES):
+        raise ValueError(f"save has an unknown weapon {weapon}")
+    projectiles = list(PROJECTILE.iter_unpack(data[offset : offset + count * PROJECTILE.size]))
+    if len(projectiles) != count:
+        raise ValueError("damaged save")
+    return offset + count * PROJECTILE.size, (UPGRADES[weapon], reload_left, projectiles)
+
+
+def restore_weapon(player, state):
+    """Restores the player's weapon and projectiles from what unpack_weapon read."""
+    name, reload_left, projectiles = state
+    player.weapon = Weapon(name)
+    player.weapon.reload_left = reload_left
+    for x, y, vx in projectiles:
+        player.projectiles.spawn(x, y, vx)
+
+
+def dumps(game):
+    """
+    Packs the full state of a game: level, score, player, boss, power-up, alien spawning of every level,
+    the live aliens with their lasers and the random number stream.
+
+    :param game: The GameScene
+    :return: The snapshot as bytes
+    """
+    level = game.levels[game.level_index]
+    seed = game.seed if game.seed is not None else -1
+    parts = [
+        GAME.pack(game.level_index, seed, game.score.target_score, game.score.displayed_score, len(game.levels)),
+        pack_ship(game.player),
+        pack_weapon(game.player),
+        pack_ship(game.boss, game.boss.laser),
+        POWERUP.pack(game.powerup.state == "spawned", game.powerup.rect.x, game.powerup.rect.y),
+    ]
+    for any_level in game.levels:
+        parts.append(LEVEL.pack(any_level.cursor, any_level.clock))
+
+    parts.append(ALIEN_COUNT.pack(len(level.aliens)))
+    for alien in level.aliens:
+        laser = alien.laser
+        parts.append(
+            ALIEN.pack(alien.rect.x, alien.rect.y, alien.direction, laser.state == "fire", laser.rect.x, laser.rect.y)
+        )
+
+    version, state, gauss_next = game.rng.getstate()
+    parts.append(RNG.pack(version, *state, gauss_next is not None, gauss_next or 0.0))
+
+    body = b"".join(parts)
+    return HEADER.pack(MAGIC, VERSION, zlib.crc32(body)) + body
+
+
+def loads(game, data):
+    """
+    Restores a game from a snapshot made by dumps. The whole snapshot is read and checked before the game is
+    changed, so a damaged save leaves the game as it was.
+
+    :param game: The GameScene
+    :param data: The snapshot
+    :raises ValueError: If the snapshot is not of this version, or damaged
+    """
+    restore(game, unpack(game, data))
+
+
+def unpack(game, data):
+    """
+    Reads and checks a snapshot made by dumps, without changing the game.
+
+    :param game: The GameScene, whose levels the snapshot must match
+    :param data: The snapshot
+    :return: A dictionary of the game state, for restore
+    :raises ValueError: If the snapshot is not of this version, or damaged
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("damaged save")
+    magic, version, checksum = HEADER.unpack_from(data)
+    if magic != MAGIC or not 1 <= version <= VERSION:
+        raise ValueError(f"not a save of version {VERSION} or older")
+    body = memoryview(data)[HEADER.size :]
+    if zlib.crc32(body) != checksum:
+        raise ValueError("damaged save")
+
+    try:
+        offset = 0
+        level_index, seed, score, displayed_score, level_count = GAME.unpack_from(body, offset)
+        offset += GAME.size
+        if level_count != len(game.levels) or level_index >= level_count:
+            raise ValueError(f"save has {level_count} levels, the game has {len(game.levels)}")
+
+        offset, player, (fired, laser_x, laser_y) = unpack_ship(body, offset)
+        if version == 1:
+            # The single laser of version 1 becomes the only projectile of the single-shot weapon
+            weapon = (UPGRADES[0], 0, [(laser_x, laser_y, 0)] if fired else [])
+        else:
+            offset, weapon = unpack_weapon(body, offset)
+
+        offset, boss, boss_laser = unpack_ship(body, offset)
+
+        powerup = POWERUP.unpack_from(body, offset)
+        offset += POWERUP.size
+
+        timelines = []
+        for any_level in game.levels:
+            cursor, clock = LEVEL.unpack_from(body, offset)
+            offset += LEVEL.size
+            if cursor > len(any_level.timeline):
+                raise ValueError(f"save has {cursor} aliens spawned on level {any_level.level_number}")
+            if version < 3:
+                # Spawned aliens and the time since the last spawn: continue from the last spawned alien
+                clock += any_level.timeline[cursor - 1][0] if cursor else 0
+            timelines.append((cursor, clock))
+
+        (alien_count,) = ALIEN_COUNT.unpack_from(body, offset)
+        offset += ALIEN_COUNT.size
+        aliens = list(ALIEN.iter_unpack(body[offset : offset + alien_count * ALIEN.size]))
+        if len(aliens) != alien_count:
+            raise ValueError("damaged save")
+        offset += alien_count * ALIEN.size
+
+        rng_state = RNG.unpack_from(body, offset)
+    except struct.error as error:
+        raise ValueError(f"damaged save: {error}") from error
+
+    gauss_next = rng_state[-1] if rng_state[-2] else None
+    rng_state = (rng_state[0], rng_state[1:-2], gauss_next)
+    try:
+        # Checked on a spare generator, the game's stream is only set once everything else is restored
+        random.Random().setstate(rng_state)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"damaged save: {error}") from error
+
+    return {
+        "level_index": level_index,
+        "seed": seed if seed >= 0 else None,
+        "score": score,
+        "displayed_score": displayed_score,
+        "player": player,
+        "weapon": weapon,
+        "boss": boss,
+        "boss_laser": boss_laser,
+        "powerup": powerup,
+        "timelines": timelines,
+        "aliens": aliens,
+        "rng_state": rng_state,
+    }
+
+
+def restore(game, state):
+    """
+    Restores a game from the state read by unpack.
+
+    :param game: The GameScene
+    :param state: The dictionary returned by unpack
+    """
+    game.level_index = state["level_index"]
+    game.load_level()
+    game.seed = state["seed"]
+    game.score.target_score = state["score"]
+    game.score.displayed_score = state["displayed_score"]
+    game.previous_positions = []
+
+    game.player = Player(360, 465)
+    restore_ship(game.player, state["player"])
+    restore_weapon(game.player, state["weapon"])
+
+    restore_ship(game.boss, state["boss"])
+    fired, laser_x, laser_y = state["boss_laser"]
+    game.boss.laser.state = "fire" if fired else "ready"
+    game.boss.laser.rect.x = laser_x
+    game.boss.laser.rect.y = laser_y
+
+    game.powerup = PowerUp()
+    spawned, x, y = state["powerup"]
+    game.powerup.state = "spawned" if spawned else "ready"
+    game.powerup.rect.x = x
+    game.powerup.rect.y = y
+
+    for any_level, (cursor, clock) in zip(game.levels, state["timelines"]):
+        any_level.reset()
+        any_level.cursor = cursor
+        any_level.clock = clock
+
+    level = game.levels[game.level_index]
+    for x, y, direction, fired, laser_x, laser_y in state["aliens"]:
+        alien = level.pool.acquire(x, y)
+        alien.direction = direction
+        alien.laser.state = "fire" if fired else "ready"
+        alien.laser.rect.x = laser_x
+        alien.laser.rect.y = laser_y
+        level.aliens.append(alien)
+    game.level_aliens = level.aliens
+
+    game.rng.setstate(state["rng_state"])
+    game.start_recording()
+
+
+def save(game, path=SAVE_FILE):
+    """
+    Writes a snapshot of the game. The snapshot is written to a temporary file first and then renamed over the
+    save, so a crash while saving leaves the previous save intact.
+
+    :param game: The GameScene
+    :param path: Path of the save file
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(dumps(game))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def load(game, path=SAVE_FILE, legacy_path=LEGACY_SAVE_FILE):
+    """
+    Restores the game from the save file. If there is none, a text save of an earlier version is loaded instead
+    (level and score, the level starts from the beginning) and written again as a snapshot.
+
+    :param game: The GameScene
+    :param path: Path of the save file
+    :param legacy_path: Path of the text save of earlier versions
+    :raises FileNotFoundError: If there is no save
+    :raises ValueError: If the save is damaged or of another version
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        migrate(game, legacy_path)
+        save(game, path)
+        return
+    loads(game, data)
+
+
+def migrate(game, legacy_path):
+    """
+    Loads a two-line text save (level index, score) of an earlier version.
+
+    :param game: The GameScene
+    :param legacy_path: Path of the text save
+    :raises FileNotFoundError: If there is no text save
+    :raises ValueError: If the text save is damaged
+    """
+    with open(legacy_path, "r") as file:
+        level_index = int(file.readline())
+        score = int(file.readline())
+    if not 0 <= level_index < len(game.levels):
+        raise ValueError(f"no level {level_index} in the text save")
+
+    game.level_index = level_index
+    game.score.displayed_score = score
+    game.score.target_score = score
+    game.load_level()
+    game.new_game()
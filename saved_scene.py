@@ -1,5 +1,7 @@
 import pygame
 
+from text_cache import text_cache
+
 pygame.font.init()
 
 # Specific font for this scene with larger text
@@ -43,11 +45,10 @@ class SavedScene:
 
     def draw(self):
         """Draws 'SAVED' text on screen"""
-        save_text = font.render("SAVED", True, WHITE)
+        save_text = text_cache.render(font, "SAVED", True, WHITE)
         # Draw text and background
         self.screen.blit(self.background, (0, 0))
         self.screen.blit(save_text, (330, 250))
-        pygame.display.flip()
 
     def next_scene(self):
         """
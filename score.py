@@ -3,7 +3,11 @@ WHITE = (255, 255, 255)
 
 class Score:
     """This class represents player's score, handling score updates, smooth transitions,
-    drawing, and resetting."""
+    drawing, and resetting. An instance stores only its own state in __slots__, the speed is shared at class level."""
+
+    __slots__ = ("font", "displayed_score", "target_score", "rendered_score", "score_text")
+
+    speed = 60  # Points per second the displayed score moves towards the actual score
 
     def __init__(self, font):
         """
@@ -14,23 +18,38 @@ class Score:
         self.displayed_score = 0  # The score currently shown on screen (for smooth transitions)
         self.target_score = 0  # The actual score
 
+        # The last rendered score, the text is only rendered again when the displayed score changes
+        self.rendered_score = None
+        self.score_text = None
+
     def change_score(self, points):
         """Adjusts the target score by a given number of points, ensuring it does not fall below zero."""
         self.target_score += points
         if self.target_score < 0:
             self.target_score = 0  # Prevents negative scores
 
-    def update(self):
-        """Updates the displayed score one by one to approach the target score with a smooth transition."""
+    def update(self, dt):
+        """
+        Updates the displayed score to approach the target score with a smooth transition.
+
+        :param dt: Length of the simulation step in seconds
+        """
+        step = round(self.speed * dt)
         if self.displayed_score < self.target_score:
-            self.displayed_score += 1
+            self.displayed_score = min(self.displayed_score + step, self.target_score)
         elif self.displayed_score > self.target_score:
-            self.displayed_score -= 1
+            self.displayed_score = max(self.displayed_score - step, self.target_score)
+
+    def sprite(self):
+        """
+        Renders the current score if it changed and returns it with its position on the bottom right of the screen.
 
-    def draw(self, screen):
-        """Renders and displays the current score on the bottom right of the screen."""
-        score_text = self.font.render("SCORE: " + str(self.displayed_score), True, WHITE)
-        screen.blit(score_text, (610, 562))
+        :return: An (image, position) pair for a SpriteBatch
+        """
+        if self.displayed_score != self.rendered_score:
+            self.score_text = self.font.render("SCORE: " + str(self.displayed_score), True, WHITE)
+            self.rendered_score = self.displayed_score
+        return self.score_text, (610, 562)
 
     def reset(self):
         """Resets both the displayed score and the target score to zero."""
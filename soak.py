@@ -0,0 +1,243 @@
+import argparse
+from array import array
+import csv
+import os
+import statistics
+import sys
+import time
+
+import pygame
+
+import assets
+from bots import AutopilotBot
+from headless import init_headless
+from input_state import input_state
+from main import FRAMES_PER_SECOND, create_levels, create_scenes, init_display, load_font, run_game
+from memory_profiler import memory_profiler
+from timestep import STEP_MS
+
+# Columns of the soak log, one row per interval
+LOG_FIELDS = (
+    "elapsed_s",
+    "game_s",
+    "frames",
+    "mean_ms",
+    "p99_ms",
+    "max_ms",
+    "drift_pct",
+    "memory_mb",
+    "growth_mb",
+    "games",
+    "pauses",
+    "wins",
+    "losses",
+)
+
+
+def resident_memory():
+    """
+    Returns the memory the process uses.
+
+    :return: Resident memory in bytes, the peak where the current one is unknown (no /proc), 0 if neither is known
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class SoakMonitor:
+    """
+    Watches a long autopilot run. Every frame it times the frame's work (everything but waiting for the frame cap);
+    every interval it logs the frame times, their drift from the first interval, the memory use and its growth since
+    the first interval, and what the bot did. Each row is flushed to the log file, so the log survives a crash.
+    """
+
+    def __init__(self, bot, duration, interval, log_file):
+        """
+        Initializes the monitor.
+
+        :param bot: The AutopilotBot playing
+        :param duration: Seconds to run for
+        :param interval: Seconds between log rows
+        :param log_file: Open text file the CSV log is written to
+        """
+        self.bot = bot
+        self.duration = duration
+        self.interval = interval
+        self.writer = csv.DictWriter(log_file, LOG_FIELDS)
+        self.writer.writeheader()
+        self.log_file = log_file
+
+        self.start = time.perf_counter()
+        self.window_start = self.start
+        self.frame_start = self.start
+        self.frame_times = array("d")  # Milliseconds of work of every frame in the current interval, unboxed
+        self.game_ms = 0.0
+
+        # The first interval is the reference for drift and growth
+        self.first_mean = None
+        self.first_memory = None
+        self.rows = []
+
+        # Memory profiler reports printed so far
+        self.level_reports = 0
+        self.interval_reports = 0
+
+    def tick(self, ms):
+        """
+        Starts timing a frame. Called once the frame cap released the frame.
+
+        :param ms: Milliseconds the frame advances the game
+        :return: ms, so it can wrap the game loop's tick function
+        """
+        self.frame_start = time.perf_counter()
+        self.game_ms += ms
+        return ms
+
+    def on_frame(self, scene):
+        """
+        Ends timing a frame, logs a row every interval and tells the bot the next scene. Use as the game loop's
+        on_frame.
+
+        :param scene: The scene of the next frame
+        :return: True once the run has lasted its duration, or as soon as a level grew over the memory budget
+        """
+        now = time.perf_counter()
+        self.frame_times.append((now - self.frame_start) * 1000)
+        self.bot.observe(scene)
+        if now - self.window_start >= self.interval:
+            self.log(now)
+        if memory_profiler.over_budget:
+            if self.frame_times:
+                self.log(now)
+            return True
+        return now - self.start >= self.duration
+
+    def log(self, now):
+        """
+        Writes a row for the interval that ends now and starts the next interval.
+
+        :param now: The current time from time.perf_counter
+        """
+        times = sorted(self.frame_times)
+        mean = statistics.fmean(times)
+        memory = resident_memory()
+        if self.first_mean is None:
+            self.first_mean = mean
+            self.first_memory = memory
+
+        bot = self.bot
+        row = {
+            "elapsed_s": round(now - self.start, 1),
+            "game_s": round(self.game_ms / 1000, 1),
+            "frames": len(times),
+            "mean_ms": round(mean, 3),
+            "p99_ms": round(times[min(len(times) - 1, int(0.99 * len(times)))], 3),
+            "max_ms": round(times[-1], 3),
+            "drift_pct": round((mean / self.first_mean - 1) * 100, 1),
+            "memory_mb": round(memory / 2**20, 1),
+            "growth_mb": round((memory - self.first_memory) / 2**20, 1),
+            "games": bot.games,
+            "pauses": bot.pauses,
+            "wins": bot.wins,
+            "losses": bot.losses,
+        }
+        self.writer.writerow(row)
+        self.log_file.flush()
+        self.rows.append(row)
+        print(", ".join(f"{name} {value}" for name, value in row.items()))
+        self.print_memory_reports()
+
+        del self.frame_times[:]
+        self.window_start = now
+
+    def print_memory_reports(self):
+        """Prints the memory profiler's reports that are new since the last call."""
+        for report in memory_profiler.levels[self.level_reports :] + memory_profiler.intervals[self.interval_reports :]:
+            print("\n".join(memory_profiler.format_report(report)))
+        self.level_reports = len(memory_profiler.levels)
+        self.interval_reports = len(memory_profiler.intervals)
+
+
+def main():
+    """
+    Command line entry point: python soak.py --minutes 480 --log soak.csv
+    Lets the autopilot play the real game loop for a long time and logs frame-time drift and memory growth.
+    Exits with 1 if the last interval drifted or grew more than the given limits.
+    With --memory-profile, allocations are tracked with tracemalloc and reported per level and every
+    --snapshot-frames frames; with --level-budget the run stops and fails as soon as a level grows more than that.
+    """
+    parser = argparse.ArgumentParser(description="Soak test: the autopilot plays for a long time.")
+    parser.add_argument("--minutes", type=float, default=60, help="how long to run")
+    parser.add_argument("--interval", type=float, default=60, help="seconds between log rows")
+    parser.add_argument("--log", default="soak.csv", help="CSV file the log is written to")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the bot's decisions")
+    parser.add_argument("--uncapped", action="store_true", help="no frame cap, one simulation step per frame")
+    parser.add_argument(
+        "--window", action="store_true", help="open a window and play sound instead of running headless"
+    )
+    parser.add_argument("--max-drift", type=float, help="fail if frames got this many percent slower")
+    parser.add_argument("--max-growth", type=float, help="fail if memory grew by this many megabytes")
+    parser.add_argument("--memory-profile", action="store_true", help="track allocations per level with tracemalloc")
+    parser.add_argument("--snapshot-frames", type=int, default=0, help="also report allocations every this many frames")
+    parser.add_argument(
+        "--level-budget",
+        type=float,
+        help="fail if memory grew by more than this many kilobytes between two loads of a level",
+    )
+    parser.add_argument("--top", type=int, default=10, help="call sites in every memory report")
+    args = parser.parse_args()
+
+    screen = init_display() if args.window else init_headless()
+    clock = pygame.time.Clock()
+    scene = create_scenes(screen, load_font(), create_levels())
+    bot = AutopilotBot(scene.game_scene, args.seed)
+    input_state.source = bot
+    if args.memory_profile or args.level_budget is not None:
+        level_budget = args.level_budget * 1024 if args.level_budget is not None else None
+        # The asset cache holds the current and next level's music, whichever those are at a level load
+        memory_profiler.start(
+            args.snapshot_frames, args.top, level_budget, ignore=(__file__,), exempt=(assets.__file__,)
+        )
+
+    with open(args.log, "w", newline="") as log_file:
+        monitor = SoakMonitor(bot, args.minutes * 60, args.interval, log_file)
+        if args.uncapped:
+            tick = lambda: monitor.tick(STEP_MS)
+        else:
+            tick = lambda: monitor.tick(clock.tick(FRAMES_PER_SECOND))
+        bot.observe(scene)
+        run_game(screen, scene, tick, on_frame=monitor.on_frame)
+    pygame.quit()
+
+    failed = False
+    if memory_profiler.enabled:
+        print("\n".join(memory_profiler.summary()))
+        for report in memory_profiler.over_budget:
+            print("\n".join(memory_profiler.format_report(report)))
+        failed = bool(memory_profiler.over_budget)
+        memory_profiler.stop()
+
+    if not monitor.rows:
+        sys.exit(1 if failed else 0)
+    last = monitor.rows[-1]
+    if args.max_drift is not None and last["drift_pct"] > args.max_drift:
+        print(f"Frame times drifted {last['drift_pct']}%, more than {args.max_drift}%")
+        failed = True
+    if args.max_growth is not None and last["growth_mb"] > args.max_growth:
+        print(f"Memory grew {last['growth_mb']} MB, more than {args.max_growth} MB")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
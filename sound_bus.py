@@ -0,0 +1,127 @@
+import pygame
+
+from assets import assets
+
+# Size of the fixed channel pool all sound effects are played on
+CHANNELS = 16
+
+# Sound effects: name -> (file, priority, most voices of this effect playing at once)
+# An effect with a higher priority may take over the channel of one with a lower priority when all are busy
+EFFECTS = {
+    "alien_laser": ("media/alien_laser.wav", 1, 3),
+    "boss_laser": ("media/laser8.wav", 2, 2),
+    "player_laser": ("media/laser.wav", 3, 2),
+    "hit": ("media/rumble.wav", 3, 3),
+    "player_hit": ("media/player_boom.wav", 4, 2),
+    "powerup": ("media/power_up_sound.wav", 4, 1),
+}
+
+
+class SoundBus:
+    """
+    Plays every sound effect on a fixed pool of mixer channels. Game objects only trigger effects by name during the
+    simulation; once per rendered frame flush() plays them, highest priority first. The same effect triggered several
+    times in one frame is played once, an effect never plays on more than its own number of voices, and when the pool
+    is full an effect takes over the channel of a lower priority one or is dropped.
+    """
+
+    def __init__(self, effects=EFFECTS, channels=CHANNELS):
+        """
+        Initializes the bus. No channels or sounds are used before init().
+
+        :param effects: Dictionary of effect name to (file, priority, max voices)
+        :param channels: Number of mixer channels in the pool
+        """
+        self.effects = effects
+        self.channel_count = channels
+        self.channels = []
+        self.voices = []  # Name of the effect last started on each channel
+        self.sounds = {}  # Effect name -> Sound
+        self.pending = set()  # Effects triggered since the last flush
+
+        # Counters
+        self.played = 0
+        self.merged = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def init(self):
+        """Sets up the channel pool and loads every effect. Call once after pygame.mixer.init."""
+        pygame.mixer.set_num_channels(self.channel_count)
+        self.channels = [pygame.mixer.Channel(index) for index in range(self.channel_count)]
+        self.voices = [None] * self.channel_count
+        for name, (path, _, _) in self.effects.items():
+            self.sounds[name] = assets.sound(path)
+
+    def trigger(self, name):
+        """
+        Requests an effect to be played at the end of the frame.
+
+        :param name: Name of the effect, a key of EFFECTS
+        """
+        if name in self.pending:
+            self.merged += 1
+        else:
+            self.pending.add(name)
+
+    def flush(self):
+        """Plays the effects triggered this frame. Called once every frame by the game loop."""
+        if not self.pending:
+            return
+        if not self.channels:  # No mixer, nothing can be heard
+            self.pending.clear()
+            return
+
+        effects = self.effects
+        for name in sorted(self.pending, key=lambda name: effects[name][1], reverse=True):
+            self.play(name)
+        self.pending.clear()
+
+    def play(self, name):
+        """
+        Plays one effect on a free channel, or on the channel of a lower priority effect if none is free.
+
+        :param name: Name of the effect
+        """
+        _, priority, max_voices = self.effects[name]
+        free = None
+        lowest = None
+        lowest_priority = priority
+        voices = 0
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                if free is None:
+                    free = index
+                continue
+            playing = self.voices[index]
+            if playing == name:
+                voices += 1
+            elif playing is not None and self.effects[playing][1] < lowest_priority:
+                lowest = index
+                lowest_priority = self.effects[playing][1]
+
+        if voices >= max_voices:
+            self.dropped += 1
+            return
+        if free is None:
+            if lowest is None:
+                self.dropped += 1
+                return
+            free = lowest
+            self.stolen += 1
+
+        self.channels[free].play(self.sounds[name])
+        self.voices[free] = name
+        self.played += 1
+
+    def stats(self):
+        """
+        Returns the bus counters.
+
+        :return: A dictionary with the number of effects played, merged, dropped and taking over another's channel
+        """
+        return {"played": self.played, "merged": self.merged, "dropped": self.dropped, "stolen": self.stolen}
+
+
+# The shared sound bus used by every game object
+sound_bus = SoundBus()
@@ -0,0 +1,63 @@
+# Draw layers of the game scene, from the bottom up
+PLAYER = 0
+PROJECTILES = 1
+BOSS = 2
+ALIENS = 3
+ENEMY_LASERS = 4
+POWERUP = 5
+HUD = 6
+LAYER_COUNT = 7
+
+
+class SpriteBatch:
+    """
+    Collects the sprites of a frame by layer and draws them all with one call, so drawing a sprite costs one tuple
+    in a list instead of a Python method call and a blit each. Every sprite is an (image, position) pair, the
+    position a pair of coordinates or a Rect whose top left corner is used, or an (image, position, area) triple that
+    draws only the area of the image.
+    """
+
+    def __init__(self, layer_count=LAYER_COUNT):
+        """
+        Initializes an empty batch.
+
+        :param layer_count: Number of layers, drawn in order of their index
+        """
+        self.layers = [[] for _ in range(layer_count)]
+        self.sequence = []
+
+        # Counters
+        self.sprites = 0  # Sprites drawn in the last batch
+
+    def add(self, layer, sprite):
+        """
+        Adds one sprite.
+
+        :param layer: Index of the layer
+        :param sprite: An (image, position) pair, or None to add nothing
+        """
+        if sprite is not None:
+            self.layers[layer].append(sprite)
+
+    def extend(self, layer, sprites):
+        """
+        Adds several sprites, drawn in their order.
+
+        :param layer: Index of the layer
+        :param sprites: Iterable of (image, position) pairs
+        """
+        self.layers[layer].extend(sprites)
+
+    def submit(self, screen):
+        """
+        Draws every sprite, layer by layer, and empties the batch.
+
+        :param screen: The renderer, or a surface
+        """
+        sequence = self.sequence
+        for layer in self.layers:
+            sequence.extend(layer)
+            layer.clear()
+        self.sprites = len(sequence)
+        screen.blits(sequence)
+        sequence.clear()
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+# The game's modules sit at the top of the repository and load their media relative to it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# No window or sound device is needed
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+@pytest.fixture(autouse=True)
+def in_repository(monkeypatch):
+    """Runs every test from the repository, where the game finds media/ and levels.json."""
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture(scope="session")
+def screen():
+    """Initializes pygame headless once, with the mixer, and returns the screen surface."""
+    from headless import init_headless
+
+    return init_headless()
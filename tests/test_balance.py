@@ -0,0 +1,14 @@
+from balance import distribution
+
+
+def test_percentiles_stay_within_the_values():
+    scores = [0, 0, 0, 40, 120]
+    summary = distribution(scores)
+    assert summary["p10"] == 0
+    assert summary["median"] == 0
+    assert 0 <= summary["p90"] <= 120
+
+
+def test_distribution_of_one_or_no_values():
+    assert distribution([]) is None
+    assert distribution([7]) == {"mean": 7, "p10": 7, "median": 7, "p90": 7}
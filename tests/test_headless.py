@@ -0,0 +1,40 @@
+from pygame import K_LEFT, K_RIGHT, K_UP
+import pytest
+
+from headless import ScriptedKeys, create_game
+
+
+def test_script_holds_keys_until_the_next_entry():
+    keys = ScriptedKeys.parse("0:right+up, 2:LEFT,4:")
+    held = []
+    for _ in range(5):
+        held.append(sorted(key for key in (K_LEFT, K_RIGHT, K_UP) if keys()[key]))
+        keys.advance()
+    assert held == [sorted([K_RIGHT, K_UP])] * 2 + [[K_LEFT]] * 2 + [[]]
+
+
+def test_empty_script_holds_nothing():
+    keys = ScriptedKeys.parse("")
+    assert not keys()[K_UP]
+
+
+def test_unknown_key_is_rejected():
+    with pytest.raises(ValueError, match="unknown key 'space', use one of left, right, up"):
+        ScriptedKeys.parse("0:right,10:space")
+
+
+@pytest.mark.parametrize("text", ["x:up", "1.5:left", ":right"])
+def test_frame_must_be_a_whole_number(text):
+    with pytest.raises(ValueError, match="is not a whole number"):
+        ScriptedKeys.parse(text)
+
+
+@pytest.mark.parametrize("level_number", [0, -1, 6])
+def test_missing_level_is_rejected(screen, level_number):
+    with pytest.raises(ValueError, match=f"no level {level_number}, the levels are 1 to 5"):
+        create_game(screen, level_number)
+
+
+def test_game_starts_on_the_level(screen):
+    game = create_game(screen, 5)
+    assert game.level_index == 4
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from level_data import LEVEL_FILE, compile_levels, load_level_data
+
+
+@pytest.fixture
+def data():
+    """The parsed level file, to break in each test."""
+    with open(LEVEL_FILE) as file:
+        return json.load(file)
+
+
+def test_level_file_is_valid(data):
+    levels = compile_levels(data)
+    assert [level["level_number"] for level in levels] == [1, 2, 3, 4, 5]
+    # Level 1: 3 aliens 2000 ms apart, the first one after one interval
+    assert [time for time, _, _ in levels[0]["timeline"]] == [2000, 4000, 6000]
+    assert levels[0]["cycle_ms"] == 6000 + 13000 - 2000
+
+
+def test_cache_is_used_while_the_level_file_is_unchanged(tmp_path):
+    path = tmp_path / "levels.json"
+    cache_path = tmp_path / "levels.cache"
+    with open(LEVEL_FILE) as file:
+        path.write_text(file.read())
+    compiled = load_level_data(str(path), str(cache_path))
+    assert cache_path.exists()
+    assert load_level_data(str(path), str(cache_path)) == compiled
+
+    cache_path.write_bytes(b"damaged")
+    assert load_level_data(str(path), str(cache_path)) == compiled
+
+
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        (lambda data: data.update(levels=[]), "non-empty list of levels"),
+        (lambda data: data["levels"][1].pop("music"), r"level 2: missing fields \['music'\]"),
+        (lambda data: data["levels"][0].update(speed=3), r"level 1: unknown fields \['speed'\]"),
+        (lambda data: data["levels"][2].update(level=4), "levels must be numbered 1, 2, 3... in order, not 4"),
+        (lambda data: data["levels"][0].update(boss_health=0), "boss_health must be a whole number of at least 1"),
+        (lambda data: data["levels"][0].update(boss_health=True), "boss_health must be a whole number"),
+        (lambda data: data["levels"][0].update(boss_shoot_chance=101), "boss_shoot_chance is a percentage"),
+        (lambda data: data["levels"][0].update(background="media/none.png"), "background 'media/none.png' is not"),
+        (lambda data: data.update(respawn_interval=-1), "respawn_interval must be a whole number"),
+        (lambda data: data["levels"][0].update(waves=[]), "waves must be a non-empty list"),
+        (lambda data: data["levels"][0]["waves"].append(3), "wave 2: must be an object"),
+        (lambda data: data["levels"][0]["waves"][0].update(count=0), "wave 1: count must be a whole number"),
+        (lambda data: data["levels"][0]["waves"][0].update(size=2), r"wave 1: unknown fields \['size'\]"),
+    ],
+)
+def test_invalid_level_file_is_rejected(data, change, message):
+    change(data)
+    with pytest.raises(ValueError, match=message):
+        compile_levels(data)
+
+
+def test_level_file_that_is_not_json_is_rejected(tmp_path):
+    path = tmp_path / "levels.json"
+    path.write_text('{"levels": [')
+    with pytest.raises(ValueError, match="levels.json: Expecting value"):
+        load_level_data(str(path), None)
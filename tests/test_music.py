@@ -0,0 +1,39 @@
+import pygame
+
+from music import MusicPlayer
+
+
+def test_fade_out_is_held_while_paused(screen):
+    player = MusicPlayer(fade_ms=600)
+    player.play("media/level1.ogg")
+    player.play("media/level2.ogg")  # Starts fading level 1 out
+    player.update(200)
+
+    player.pause()
+    for _ in range(10):
+        player.update(200)
+    assert player.current == "media/level1.ogg"
+    assert player.next == "media/level2.ogg"
+    assert player.fade_left == 400
+    assert not pygame.mixer.music.get_busy()
+
+    player.resume()
+    player.update(200)
+    assert player.current == "media/level1.ogg"
+    player.update(200)
+    assert player.current == "media/level2.ogg"
+    assert player.next is None
+    assert not player.paused
+    player.stop()
+
+
+def test_pause_without_a_fade_keeps_the_track(screen):
+    player = MusicPlayer()
+    player.play("media/level1.ogg")
+    player.pause()
+    player.update(1000)
+    assert player.paused
+    assert player.current == "media/level1.ogg"
+    player.resume()
+    assert pygame.mixer.music.get_busy()
+    player.stop()
@@ -0,0 +1,61 @@
+import zlib
+from collections import defaultdict
+
+from pygame import K_LEFT, K_RIGHT, K_UP
+import pytest
+
+from headless import create_game
+from replay import FRAME, HEADER, MAGIC, VERSION, InputRecorder, ReplayKeys, key_mask, load_replay
+import save_game
+
+
+@pytest.fixture
+def recording(screen, tmp_path):
+    """Path of a replay file of a short recorded game."""
+    game = create_game(screen, 1, seed=5)
+    recorder = InputRecorder(str(tmp_path / "game.rpl"))
+    recorder.start(save_game.dumps(game))
+    for frame in range(20):
+        recorder.record(16.0, 1, defaultdict(bool), frame)
+    recorder.save()
+    return tmp_path / "game.rpl"
+
+
+def test_recorded_game_loads(recording):
+    snapshot, frames = load_replay(str(recording))
+    assert snapshot[:4] == save_game.MAGIC
+    assert len(frames) == 20
+    assert frames[3] == (16.0, 1, 0, 3)
+
+
+@pytest.mark.parametrize("magic, version", [(MAGIC, VERSION - 1), (MAGIC, VERSION + 1), (b"SGSV", VERSION)])
+def test_other_file_is_rejected(recording, magic, version):
+    data = recording.read_bytes()
+    _, _, snapshot_length, frame_count = HEADER.unpack_from(data)
+    recording.write_bytes(HEADER.pack(magic, version, snapshot_length, frame_count) + data[HEADER.size :])
+    with pytest.raises(ValueError, match=f"is not a version {VERSION} replay file"):
+        load_replay(str(recording))
+
+
+@pytest.mark.parametrize("length", [0, HEADER.size - 1, HEADER.size + 10, -5])
+def test_truncated_file_is_rejected(recording, length):
+    recording.write_bytes(recording.read_bytes()[:length])
+    with pytest.raises(ValueError, match="is truncated"):
+        load_replay(str(recording))
+
+
+def test_missing_frames_are_rejected(recording):
+    data = recording.read_bytes()
+    _, _, snapshot_length, _ = HEADER.unpack_from(data)
+    frames = zlib.decompress(data[HEADER.size + snapshot_length :])
+    cut = data[: HEADER.size + snapshot_length] + zlib.compress(frames[: -FRAME.size])
+    recording.write_bytes(cut)
+    with pytest.raises(ValueError, match="truncated: 19 of 20 frames"):
+        load_replay(str(recording))
+
+
+def test_replay_keys_hold_the_recorded_keys():
+    keys = ReplayKeys()
+    keys.mask = key_mask(defaultdict(bool, {K_LEFT: True, K_UP: True}))
+    assert keys[K_LEFT] and keys[K_UP]
+    assert not keys[K_RIGHT]
@@ -0,0 +1,144 @@
+import zlib
+
+import pytest
+
+from headless import ScriptedKeys, create_game
+import save_game
+from save_game import GAME, HEADER, LEVEL, MAGIC, POWERUP, SHIP, VERSION, WEAPON
+from timestep import STEP_MS
+
+
+@pytest.fixture
+def played(screen):
+    """A game on level 3 after a few seconds of play, with aliens, lasers and projectiles in flight."""
+    game = create_game(screen, 3, seed=7)
+    game.read_keys = ScriptedKeys.parse("0:right+up,100:left+up")
+    for _ in range(300):
+        game.update(STEP_MS)
+        game.read_keys.advance()
+    return game
+
+
+@pytest.fixture
+def fresh(screen):
+    """A game just started on level 1, to load snapshots into."""
+    return create_game(screen, 1, seed=1)
+
+
+def snapshot(body, version=VERSION):
+    """Puts a header with a correct checksum in front of a snapshot body."""
+    return HEADER.pack(MAGIC, version, zlib.crc32(body)) + bytes(body)
+
+
+def test_loaded_game_is_the_saved_game(played, fresh):
+    data = save_game.dumps(played)
+    save_game.loads(fresh, data)
+    assert save_game.dumps(fresh) == data
+
+
+def test_damaged_save_is_rejected(played, fresh):
+    data = bytearray(save_game.dumps(played))
+    data[HEADER.size + 3] ^= 1
+    with pytest.raises(ValueError, match="damaged save"):
+        save_game.loads(fresh, bytes(data))
+
+
+@pytest.mark.parametrize("length", [0, HEADER.size - 1])
+def test_truncated_header_is_rejected(fresh, length):
+    with pytest.raises(ValueError, match="damaged save"):
+        save_game.loads(fresh, b"SGSV\x03\x00\x00\x00\x00\x00"[:length])
+
+
+def test_truncated_body_is_rejected(played, fresh):
+    body = save_game.dumps(played)[HEADER.size :]
+    with pytest.raises(ValueError, match="damaged save"):
+        save_game.loads(fresh, snapshot(body[:-10]))
+
+
+@pytest.mark.parametrize("version", [0, VERSION + 1])
+def test_unknown_version_is_rejected(played, fresh, version):
+    body = save_game.dumps(played)[HEADER.size :]
+    with pytest.raises(ValueError, match="not a save of version"):
+        save_game.loads(fresh, snapshot(body, version))
+
+
+def test_other_file_is_rejected(fresh):
+    with pytest.raises(ValueError, match="not a save of version"):
+        save_game.loads(fresh, b"PNG!" + bytes(20))
+
+
+def test_failed_load_leaves_the_game_as_it_was(played, fresh):
+    before = save_game.dumps(fresh)
+    body = bytearray(save_game.dumps(played)[HEADER.size :])
+    body[GAME.size + SHIP.size] = 9  # No such weapon
+    with pytest.raises(ValueError, match="unknown weapon"):
+        save_game.loads(fresh, snapshot(body))
+    assert save_game.dumps(fresh) == before
+
+
+def test_version_2_timeline_is_migrated(played, fresh):
+    """Up to version 2 a level stored the time since its last spawn instead of since its timeline started."""
+    data = save_game.dumps(played)
+    body = bytearray(data[HEADER.size :])
+    weapon_size = WEAPON.size + played.player.projectiles.count * save_game.PROJECTILE.size
+    offset = GAME.size + SHIP.size + weapon_size + SHIP.size + POWERUP.size
+    for level in played.levels:
+        cursor, clock = LEVEL.unpack_from(body, offset)
+        if cursor:
+            clock -= level.timeline[cursor - 1][0]
+        LEVEL.pack_into(body, offset, cursor, clock)
+        offset += LEVEL.size
+
+    save_game.loads(fresh, snapshot(body, 2))
+    assert save_game.dumps(fresh) == data
+
+
+def test_version_1_laser_becomes_a_projectile(screen, fresh):
+    """Version 1 had no weapon block, the player's single laser was stored with the ship."""
+    game = create_game(screen, 2, seed=3)
+    body = bytearray(save_game.dumps(game)[HEADER.size :])
+    x, direction, health, bar_width, _, _, _ = SHIP.unpack_from(body, GAME.size)
+    SHIP.pack_into(body, GAME.size, x, direction, health, bar_width, True, 123, 400)
+    weapon = GAME.size + SHIP.size
+    del body[weapon : weapon + WEAPON.size]
+
+    save_game.loads(fresh, snapshot(body, 1))
+    projectiles = fresh.player.projectiles
+    assert fresh.level_index == 1
+    assert fresh.player.weapon.name == "single"
+    assert (projectiles.count, int(projectiles.x[0]), int(projectiles.y[0])) == (1, 123, 400)
+
+
+def test_text_save_is_migrated(fresh, tmp_path):
+    path = tmp_path / "save_data.sav"
+    legacy_path = tmp_path / "save_data.txt"
+    legacy_path.write_text("2\n450\n")
+
+    save_game.load(fresh, str(path), str(legacy_path))
+    assert fresh.level_index == 2
+    assert fresh.score.target_score == 450
+    assert path.exists()  # Written again as a snapshot
+
+    legacy_path.unlink()
+    save_game.load(fresh, str(path), str(legacy_path))
+    assert fresh.level_index == 2
+    assert fresh.score.target_score == 450
+
+
+def test_text_save_of_a_missing_level_is_rejected(fresh, tmp_path):
+    legacy_path = tmp_path / "save_data.txt"
+    legacy_path.write_text("9\n0\n")
+    with pytest.raises(ValueError, match="no level 9"):
+        save_game.load(fresh, str(tmp_path / "save_data.sav"), str(legacy_path))
+
+
+def test_no_save_at_all(fresh, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        save_game.load(fresh, str(tmp_path / "save_data.sav"), str(tmp_path / "save_data.txt"))
+
+
+def test_save_replaces_the_file_in_one_step(played, tmp_path):
+    path = tmp_path / "save_data.sav"
+    save_game.save(played, str(path))
+    assert path.read_bytes() == save_game.dumps(played)
+    assert not (tmp_path / "save_data.sav.tmp").exists()
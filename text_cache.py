@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Cache of rendered text surfaces shared by all scenes. Rendering text with a font is expensive, so each
+    combination of font, string, antialias flag and colour is rendered once and reused. The least recently used
+    surfaces are evicted when the cache is full.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Initializes an empty cache.
+
+        :param max_entries: Maximum number of cached surfaces
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Returns the rendered text, like font.render, rendering it only if it is not cached.
+
+        :param font: The pygame font to render with
+        :param text: The string to render
+        :param antialias: True for smooth edges
+        :param color: The text colour
+        :return: The shared Surface with the rendered text
+        """
+        key = (font, text, antialias, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Evict the least recently used surface
+        return surface
+
+    def clear(self):
+        """Drops every cached surface and resets the counters."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# The shared text cache used by every scene
+text_cache = TextCache()
@@ -0,0 +1,49 @@
+# The simulation always advances in fixed steps, whatever the render rate. Speeds are given per second
+# and multiplied by the step length in seconds.
+SIMULATION_RATE = 60
+STEP_MS = 1000 / SIMULATION_RATE
+
+# Most steps run in one rendered frame, the rest of a long stall is dropped instead of catching up forever
+MAX_STEPS_PER_FRAME = 5
+
+
+class FixedTimestep:
+    """
+    Accumulates the real time passed between rendered frames and turns it into a whole number of fixed simulation
+    steps. What is left over is the interpolation factor used to draw positions between the last two steps.
+    """
+
+    def __init__(self, step_ms=STEP_MS, max_steps=MAX_STEPS_PER_FRAME):
+        """
+        Initializes the timestep.
+
+        :param step_ms: Length of one simulation step in milliseconds
+        :param max_steps: Most steps run per rendered frame
+        """
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.active = False  # True once driven by the game loop, otherwise nothing is interpolated
+        self.alpha = 1.0  # How far the rendered frame is between the previous and the current step (0 - 1)
+
+    def advance(self, ms):
+        """
+        Adds the time of a rendered frame.
+
+        :param ms: Real milliseconds passed since the last frame
+        :return: Number of simulation steps to run before drawing
+        """
+        self.active = True
+        self.accumulator += ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0  # Drop the time that can't be caught up
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.alpha = self.accumulator / self.step_ms
+        return steps
+
+
+# The shared timestep used by the game loop and read by the game scene when drawing
+timestep = FixedTimestep()
@@ -0,0 +1,65 @@
+from sound_bus import sound_bus
+
+# Weapons: name -> (milliseconds between shots, most of its projectiles on screen or None, shots)
+# Each shot is (x offset from the player, sideways speed in pixels per second)
+WEAPONS = {
+    "single": (0, 1, ((31, 0),)),  # One shot at a time, fires again once it hit something or left the screen
+    "rapid": (120, None, ((31, 0),)),
+    "spread": (250, None, ((31, -180), (31, 0), (31, 180))),
+}
+
+# Order in which weapons are handed out as rewards
+UPGRADES = ("single", "rapid", "spread")
+
+# Projectiles start here, just above the player's ship
+FIRE_Y = 475
+
+
+class Weapon:
+    """The player's weapon. Decides when the fire key releases shots and fires them into the projectile pool."""
+
+    def __init__(self, name="single"):
+        """
+        Initializes the weapon.
+
+        :param name: Name of the weapon, a key of WEAPONS
+        """
+        self.name = name
+        self.cooldown, self.max_alive, self.shots = WEAPONS[name]
+        self.reload_left = 0  # Milliseconds until the weapon can fire again
+
+    def update(self, dt):
+        """
+        Reloads the weapon.
+
+        :param dt: Length of the simulation step in seconds
+        """
+        if self.reload_left > 0:
+            self.reload_left -= dt * 1000
+
+    def fire(self, projectiles, player_x):
+        """
+        Fires the weapon if it is reloaded and the projectile limit allows it.
+
+        :param projectiles: The player's ProjectilePool
+        :param player_x: x-coordinate of the player to shoot from
+        """
+        if self.reload_left > 0:
+            return
+        if self.max_alive is not None and projectiles.count >= self.max_alive:
+            return
+        for x_offset, vx in self.shots:
+            projectiles.spawn(player_x + x_offset, FIRE_Y, vx)
+        self.reload_left = self.cooldown
+        sound_bus.trigger("player_laser")
+
+    def upgraded(self):
+        """
+        Returns the next better weapon, or this one if it is the best.
+
+        :return: A Weapon
+        """
+        index = UPGRADES.index(self.name)
+        if index + 1 == len(UPGRADES):
+            return self
+        return Weapon(UPGRADES[index + 1])
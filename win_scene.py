@@ -1,6 +1,10 @@
 import pygame
 from pygame import K_RETURN
 
+from input_state import input_state
+from music import music
+from text_cache import text_cache
+
 # Initialize pygame font
 pygame.font.init()
 
@@ -36,9 +40,11 @@ class WinScene:
 
     def draw(self):
         """Draws the win screen, including win message, final score and option to return to menu."""
-        win_text = win_font.render("YOU WIN!", True, WHITE)
-        final_score_text = self.font.render("FINAL SCORE: " + str(self.game_scene.score.target_score), True, WHITE)
-        return_to_menu_text = self.font.render("PRESS ENTER TO CONTINUE TO MENU", True, WHITE)
+        win_text = text_cache.render(win_font, "YOU WIN!", True, WHITE)
+        final_score_text = text_cache.render(
+            self.font, "FINAL SCORE: " + str(self.game_scene.score.target_score), True, WHITE
+        )
+        return_to_menu_text = text_cache.render(self.font, "PRESS ENTER TO CONTINUE TO MENU", True, WHITE)
 
         # Draw on screen
         self.screen.blit(self.background, (0, 0))
@@ -46,20 +52,15 @@ class WinScene:
         self.screen.blit(final_score_text, (70, 260))
         self.screen.blit(return_to_menu_text, (130, 562))
 
-        pygame.display.flip()
-
     def next_scene(self):
         """Handles input to transition to the main menu if Enter is pressed."""
-        keys = pygame.key.get_pressed()
+        keys = input_state.keys
 
         if keys[K_RETURN]:
-            pygame.mixer.music.stop()  # Stops win music
-            return self.menu_scene
+            return self.menu_scene  # The menu music fades in over the win music
         else:
             return self
 
     def start_win_music(self):
-        """Stops current music. Loads and plays the victory music in a loop."""
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(self.music_file)
-        pygame.mixer.music.play(-1)
+        """Fades out the current music and plays the victory music in a loop."""
+        music.play(self.music_file)